@@ -1,27 +1,90 @@
 """ARIMA API endpoints."""
 
+import asyncio
+from functools import partial
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
+import msgspec
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from jdemetra_common.models import TsData, TsPeriod, TsFrequency, ArimaOrder
-from ..schemas.requests import (
-    EstimateRequest, ForecastRequest, IdentifyRequest, DiagnoseRequest
-)
+from ..schemas import requests, structs
+from ..schemas.requests import ForecastRequest, DiagnoseRequest
 from ..schemas.responses import (
-    EstimateResponse, ForecastResponse, IdentifyResponse, DiagnoseResponse,
-    ForecastPoint, DiagnosticTest
+    EstimateResponse, ForecastResponse, IdentifyResponse, DiagnoseResponse
 )
 from ..core.arima_estimation import estimate_arima, identify_arima
-from ..core.forecasting import generate_forecasts
-from ..core.diagnostics import run_diagnostics
-from ..models.storage import ModelStorage
-from ..main import get_redis
+from ..core.config import settings
+from ..core.responses import ORJSONResponse
+from ..core.forecasting import generate_forecasts, refit_arima, restore_fitted
+from ..core.diagnostics import run_diagnostics_async
+from ..models.storage import ModelStorage, identification_key
+from ..main import get_redis, get_pool
 
 router = APIRouter()
 
 
-@router.post("/arima/estimate", response_model=EstimateResponse)
-async def estimate_model(request: EstimateRequest, redis=Depends(get_redis)):
+def msgspec_body(struct_type):
+    """Dependency decoding the raw JSON body straight into a msgspec struct."""
+    async def decode(request: Request):
+        try:
+            return msgspec.json.decode(await request.body(), type=struct_type)
+        except msgspec.DecodeError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    return decode
+
+
+def openapi_body(model) -> dict:
+    """OpenAPI request body documented from a Pydantic model."""
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+    
+    def _inline(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return _inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: _inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [_inline(value) for value in node]
+        return node
+    
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline(schema)}}
+        }
+    }
+
+
+async def run_blocking(pool, fn, *args, **kwargs):
+    """Run a blocking model fit in the process pool, or inline without one."""
+    if pool is None:
+        return fn(*args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(pool, partial(fn, *args, **kwargs))
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Whether the client accepts newline-delimited JSON."""
+    return "application/x-ndjson" in request.headers.get("accept", "")
+
+
+def ndjson_forecast_stream(header: dict, forecasts: list) -> StreamingResponse:
+    """Stream a header line, then the forecast points one per line in fixed-size batches."""
+    chunk = settings.FORECAST_STREAM_CHUNK
+    
+    def lines():
+        yield orjson.dumps(header) + b"\n"
+        for start in range(0, len(forecasts), chunk):
+            yield b"".join(orjson.dumps(point) + b"\n" for point in forecasts[start:start + chunk])
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/arima/estimate", response_model=EstimateResponse,
+             openapi_extra=openapi_body(requests.EstimateRequest))
+async def estimate_model(request: structs.EstimateRequest = Depends(msgspec_body(structs.EstimateRequest)),
+                         redis=Depends(get_redis), pool=Depends(get_pool)):
     """Estimate ARIMA model."""
     try:
         # Convert request to TsData
@@ -50,55 +113,68 @@ async def estimate_model(request: EstimateRequest, redis=Depends(get_redis)):
             )
         
         # Estimate model
-        model, fitting_info = estimate_arima(
-            ts_data, order, request.method, request.include_mean
+        model, fitting_info, fitted = await run_blocking(
+            pool, estimate_arima, ts_data, order, request.method, request.include_mean
         )
         
-        # Save model
+        # Save model together with its fitted results
         storage = ModelStorage(redis)
-        model_id = await storage.save_model(model, ts_data)
-        
-        return EstimateResponse(
-            model_id=model_id,
-            model=model.to_dict(),
-            fit_time=fitting_info["fit_time"],
-            in_sample_metrics=fitting_info["in_sample_metrics"],
-            convergence_info=fitting_info["convergence"]
-        )
+        model_id = await storage.save_model(model, ts_data, fitted)
+        
+        # orjson writes the UUID and the parameter arrays natively
+        return ORJSONResponse({
+            "model_id": model_id,
+            "model": orjson.Fragment(model.to_json()),
+            "fit_time": fitting_info["fit_time"],
+            "in_sample_metrics": fitting_info["in_sample_metrics"],
+            "convergence_info": fitting_info["convergence"]
+        })
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/arima/forecast", response_model=ForecastResponse)
-async def forecast(request: ForecastRequest, redis=Depends(get_redis)):
-    """Generate forecasts from saved model."""
+async def forecast(request: ForecastRequest, http_request: Request,
+                   redis=Depends(get_redis), pool=Depends(get_pool)):
+    """
+    Generate forecasts from saved model.
+    
+    Clients sending ``Accept: application/x-ndjson`` get long horizons
+    streamed as a header line followed by one forecast point per line.
+    """
     try:
         # Retrieve model
         storage = ModelStorage(redis)
-        model_data = await storage.get_model(request.model_id)
+        model_data = await storage.get_model_with_fitted(request.model_id)
         
         if not model_data:
             raise HTTPException(status_code=404, detail="Model not found")
         
-        model, ts_data = model_data
+        model, ts_data, spec = model_data
         
-        # Generate forecasts
-        forecasts, forecast_time = generate_forecasts(
-            ts_data, model, request.horizon, request.confidence_level
+        # Rebuilding the results runs the Kalman filter, so both paths go to the pool
+        forecasts, forecast_time = await run_blocking(
+            pool, generate_forecasts,
+            ts_data, model, request.horizon, request.confidence_level, spec
         )
         
-        # Convert to response format
-        forecast_points = []
-        for f in forecasts:
-            forecast_points.append(ForecastPoint(**f))
+        if request.horizon > settings.FORECAST_STREAM_THRESHOLD and wants_ndjson(http_request):
+            return ndjson_forecast_stream({
+                "model_id": request.model_id,
+                "frequency": ts_data.frequency.value,
+                "confidence_level": request.confidence_level,
+                "forecast_time": forecast_time
+            }, forecasts)
         
-        return ForecastResponse(
-            model_id=request.model_id,
-            forecasts=forecast_points,
-            confidence_level=request.confidence_level,
-            forecast_time=forecast_time
-        )
+        # Forecasts are plain dicts already; encode once and skip FastAPI re-serialization
+        return ORJSONResponse({
+            "model_id": request.model_id,
+            "frequency": ts_data.frequency.value,
+            "forecasts": forecasts,
+            "confidence_level": request.confidence_level,
+            "forecast_time": forecast_time
+        })
         
     except HTTPException:
         raise
@@ -106,8 +182,10 @@ async def forecast(request: ForecastRequest, redis=Depends(get_redis)):
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/arima/identify", response_model=IdentifyResponse)
-async def identify(request: IdentifyRequest):
+@router.post("/arima/identify", response_model=IdentifyResponse,
+             openapi_extra=openapi_body(requests.IdentifyRequest))
+async def identify(request: structs.IdentifyRequest = Depends(msgspec_body(structs.IdentifyRequest)),
+                   redis=Depends(get_redis), pool=Depends(get_pool)):
     """Automatically identify best ARIMA model."""
     try:
         # Convert to TsData
@@ -122,23 +200,38 @@ async def identify(request: IdentifyRequest):
             metadata=request.timeseries.metadata
         )
         
+        # Repeat calls on the same series and search settings are served from Redis
+        storage = ModelStorage(redis)
+        cache_key = identification_key(ts_data, (
+            request.max_p, request.max_q, request.max_d, request.seasonal,
+            request.stepwise, request.information_criterion
+        ))
+        cached = await storage.get_identification(cache_key)
+        if cached is not None:
+            return IdentifyResponse(**cached)
+        
         # Identify model
-        best_model, search_info = identify_arima(
+        best_model, search_info = await run_blocking(
+            pool, identify_arima,
             ts_data,
             seasonal=request.seasonal,
             stepwise=request.stepwise,
             max_p=request.max_p,
             max_q=request.max_q,
             max_d=request.max_d,
-            information_criterion=request.information_criterion
+            information_criterion=request.information_criterion,
+            n_jobs=request.n_jobs
         )
         
-        return IdentifyResponse(
+        response = IdentifyResponse(
             best_model=best_model.to_dict(),
             search_summary=search_info["search_summary"],
             candidates_evaluated=search_info["candidates_evaluated"],
             identification_time=search_info["identification_time"]
         )
+        await storage.save_identification(cache_key, response.model_dump(mode="json"))
+        
+        return response
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -155,9 +248,10 @@ async def get_model(model_id: UUID, redis=Depends(get_redis)):
     
     model, ts_data = model_data
     
-    return {
+    # The model is embedded as pre-encoded JSON, so its arrays are never boxed into lists
+    return ORJSONResponse({
         "model_id": model_id,
-        "model": model.to_dict(),
+        "model": orjson.Fragment(model.to_json()),
         "timeseries_info": {
             "length": ts_data.length,
             "frequency": ts_data.frequency.value,
@@ -166,36 +260,46 @@ async def get_model(model_id: UUID, redis=Depends(get_redis)):
                 "period": ts_data.start_period.period
             }
         }
-    }
+    })
 
 
 @router.post("/arima/diagnose", response_model=DiagnoseResponse)
-async def diagnose(request: DiagnoseRequest, redis=Depends(get_redis)):
+async def diagnose(request: DiagnoseRequest, redis=Depends(get_redis),
+                   pool=Depends(get_pool)):
     """Run diagnostics on saved model."""
     try:
         # Retrieve model
         storage = ModelStorage(redis)
-        model_data = await storage.get_model(request.model_id)
+        model_data = await storage.get_model_with_residuals(request.model_id)
         
         if not model_data:
             raise HTTPException(status_code=404, detail="Model not found")
         
-        model, ts_data = model_data
+        model, ts_data, stored = model_data
         
         # Run diagnostics
-        results = run_diagnostics(ts_data, model, request.tests)
-        
-        # Convert to response format
-        diagnostic_tests = []
-        for test in results["diagnostic_tests"]:
-            diagnostic_tests.append(DiagnosticTest(**test))
-        
-        return DiagnoseResponse(
-            model_id=request.model_id,
-            residual_stats=results["residual_stats"],
-            diagnostic_tests=diagnostic_tests,
-            model_adequacy=results["model_adequacy"]
-        )
+        if stored is not None:
+            residuals, fitted_values = stored
+            results = await run_diagnostics_async(
+                ts_data, model, request.tests,
+                residuals=residuals, fitted_values=fitted_values
+            )
+        else:
+            spec = await storage.get_fitted(request.model_id)
+            if spec is None:
+                fitted = await run_blocking(
+                    pool, refit_arima, ts_data, model, settings.DIAGNOSE_DIFFERENCED
+                )
+            else:
+                fitted = await run_blocking(pool, restore_fitted, ts_data, spec)
+            results = await run_diagnostics_async(ts_data, model, request.tests, fitted)
+        
+        return ORJSONResponse({
+            "model_id": request.model_id,
+            "residual_stats": results["residual_stats"],
+            "diagnostic_tests": results["diagnostic_tests"],
+            "model_adequacy": results["model_adequacy"]
+        })
         
     except HTTPException:
         raise
@@ -3,19 +3,23 @@
 import time
 import numpy as np
 from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.stattools import acf, pacf
 from pmdarima import auto_arima
+from pmdarima.arima import ndiffs
 from typing import Tuple, Dict, Any, Optional
 
 from jdemetra_common.models import TsData, ArimaModel, ArimaOrder
+from .fast_arima import search_arma
 
 
 def estimate_arima(ts: TsData, order: Optional[ArimaOrder] = None, 
-                  method: str = "css-mle", include_mean: bool = True) -> Tuple[ArimaModel, Dict[str, Any]]:
+                  method: str = "css-mle", include_mean: bool = True) -> Tuple[ArimaModel, Dict[str, Any], Any]:
     """
     Estimate ARIMA model.
     
     Returns:
-        Tuple of (model, fitting_info)
+        Tuple of (model, fitting_info, fitted_results)
     """
     start_time = time.time()
     
@@ -143,15 +147,21 @@ def estimate_arima(ts: TsData, order: Optional[ArimaOrder] = None,
         }
     }
     
-    return arima_model, fitting_info
+    return arima_model, fitting_info, fitted
 
 
 def identify_arima(ts: TsData, seasonal: bool = True, stepwise: bool = True,
                   max_p: int = 5, max_q: int = 5, max_d: int = 2,
-                  information_criterion: str = "aic") -> Tuple[ArimaModel, Dict[str, Any]]:
+                  information_criterion: str = "aic", fallback: bool = True,
+                  n_jobs: int = 1) -> Tuple[ArimaModel, Dict[str, Any]]:
     """
     Automatically identify best ARIMA model.
     
+    Non-seasonal searches run on the Numba-compiled CSS fitter; seasonal
+    searches (and failures of the compiled path when ``fallback`` is set)
+    go through pmdarima's ``auto_arima``. ``n_jobs`` parallelizes the
+    exhaustive grid of the compiled fitter and non-stepwise pmdarima searches.
+    
     Returns:
         Tuple of (best_model, search_info)
     """
@@ -159,25 +169,133 @@ def identify_arima(ts: TsData, seasonal: bool = True, stepwise: bool = True,
     
     # Convert to pandas
     series = ts.to_pandas()
+    m = ts.frequency.periods_per_year
+    
+    # Only the compiled path screens the bounds; auto_arima runs its own tests
+    p_eff, q_eff = max_p, max_q
+    engine = "pmdarima"
+    if seasonal and m > 1:
+        best_model, candidates = _identify_pmdarima(
+            series, m, seasonal, stepwise, max_p, max_q, max_d, information_criterion, n_jobs
+        )
+    else:
+        # Difference once, then shrink the (p, q) bounds from ACF/PACF cut-offs
+        d = ndiffs(series, max_d=max_d, test="kpss")
+        y = np.diff(series.values.astype(np.float64), n=d)
+        p_eff, q_eff = screen_orders(y, max_p, max_q)
+        try:
+            best_model, candidates = _identify_fast(
+                y, d, p_eff, q_eff, information_criterion, n_jobs
+            )
+            engine = "numba"
+        except Exception:
+            if not fallback:
+                raise
+            best_model, candidates = _identify_pmdarima(
+                series, m, False, stepwise, p_eff, q_eff, max_d, information_criterion, n_jobs
+            )
+    
+    # Search information
+    search_info = {
+        "identification_time": time.time() - start_time,
+        "search_summary": {
+            "stepwise": stepwise,
+            "information_criterion": information_criterion,
+            "seasonal_tested": seasonal,
+            "max_order": {"p": max_p, "d": max_d, "q": max_q},
+            "screened_order": {"p": p_eff, "q": q_eff},
+            "engine": engine,
+            "n_jobs": n_jobs
+        },
+        "candidates_evaluated": candidates
+    }
+    
+    return best_model, search_info
+
+
+def screen_orders(y: np.ndarray, max_p: int, max_q: int) -> Tuple[int, int]:
+    """
+    Derive effective AR/MA bounds from PACF/ACF cut-offs of a differenced series.
+    
+    Each bound is the first lag whose (partial) autocorrelation falls inside
+    the 95% band, capped by the requested maximum.
+    """
+    n = len(y)
+    threshold = 1.96 / np.sqrt(n)
+    nlags_limit = n // 2 - 1
+    
+    def _cutoff(coefs: np.ndarray, max_order: int) -> int:
+        insignificant = np.flatnonzero(np.abs(coefs[1:]) < threshold)
+        if len(insignificant) == 0:
+            return max_order
+        return min(max_order, int(insignificant[0]) + 1)
+    
+    p_eff = max_p
+    if 0 < max_p <= nlags_limit:
+        p_eff = _cutoff(pacf(y, nlags=max_p), max_p)
+    q_eff = max_q
+    if 0 < max_q <= nlags_limit:
+        q_eff = _cutoff(acf(y, nlags=max_q, fft=True), max_q)
+    
+    return p_eff, q_eff
+
+
+def _identify_fast(y: np.ndarray, d: int, max_p: int, max_q: int,
+                   information_criterion: str, n_jobs: int = 1) -> Tuple[ArimaModel, int]:
+    """Grid search over ARMA(p, q) on the differenced series with the compiled fitter."""
+    # Include a constant (mean or drift) for d < 2, as auto_arima does
+    intercept = float(y.mean()) if d < 2 else 0.0
+    best, fits = search_arma(y - intercept, max_p, max_q, information_criterion, n_jobs)
     
-    # Run auto_arima
-    auto_model = auto_arima(
+    p, q = best["p"], best["q"]
+    params = best["params"]
+    best_model = ArimaModel(
+        order=ArimaOrder(p=p, d=d, q=q),
+        ar_params=params[:p] if p > 0 else None,
+        ma_params=params[p:p + q] if q > 0 else None,
+        intercept=intercept,
+        sigma2=best["sigma2"],
+        log_likelihood=best["log_likelihood"],
+        aic=best["aic"],
+        bic=best["bic"]
+    )
+    return best_model, len(fits)
+
+
+def _identify_pmdarima(series, m: int, seasonal: bool, stepwise: bool,
+                       max_p: int, max_q: int, max_d: int,
+                       information_criterion: str, n_jobs: int = 1) -> Tuple[ArimaModel, int]:
+    """
+    Model identification through pmdarima's auto_arima.
+    
+    Long or high-frequency series are searched on an approximate likelihood
+    (simple differencing, as R's ``approximation=TRUE``) and only the selected
+    order is re-fitted by exact maximum likelihood.
+    """
+    approximate = len(series) > 150 or m > 12
+    
+    # Run auto_arima; valid fits come back sorted by information criterion
+    valid_fits = auto_arima(
         series,
         start_p=0, start_q=0, max_p=max_p, max_q=max_q, max_d=max_d,
-        seasonal=seasonal, m=ts.frequency.periods_per_year if seasonal else None,
+        seasonal=seasonal, m=m if seasonal else 1,
         stepwise=stepwise,
+        n_jobs=1 if stepwise else n_jobs,  # only honoured by the grid search
         information_criterion=information_criterion,
         trace=True,  # Get search details
         error_action='ignore',
         suppress_warnings=True,
-        return_valid_fits=True
+        return_valid_fits=True,
+        sarimax_kwargs={"simple_differencing": True} if approximate else None
     )
     
+    auto_model = valid_fits[0]
+    
     # Extract order
     arima_order = auto_model.order
     seasonal_order = auto_model.seasonal_order if hasattr(auto_model, 'seasonal_order') else None
     
-    if seasonal_order:
+    if seasonal_order and seasonal_order[3] > 0:
         order = ArimaOrder(
             p=arima_order[0], d=arima_order[1], q=arima_order[2],
             seasonal_p=seasonal_order[0], seasonal_d=seasonal_order[1],
@@ -186,34 +304,49 @@ def identify_arima(ts: TsData, seasonal: bool = True, stepwise: bool = True,
     else:
         order = ArimaOrder(p=arima_order[0], d=arima_order[1], q=arima_order[2])
     
-    # Get fitted parameters
+    # Get fitted parameters, keyed by statsmodels parameter names
     params = auto_model.params()
+    aic, bic = auto_model.aic(), auto_model.bic()
+    if approximate:
+        # Exact re-fit of the selected specification only
+        refit = SARIMAX(
+            series,
+            order=arima_order,
+            seasonal_order=seasonal_order if order.is_seasonal else (0, 0, 0, 0),
+            trend='c' if 'intercept' in params.index else None
+        ).fit(disp=False)
+        params = refit.params
+        aic, bic = refit.aic, refit.bic
     
-    # Extract parameters (simplified - pmdarima has different structure)
-    ar_params = params[:order.p] if order.p > 0 else None
-    ma_params = params[order.p:order.p+order.q] if order.q > 0 else None
+    def _select(prefix):
+        values = [v for name, v in params.items() if name.startswith(prefix)]
+        return np.asarray(values) if values else None
     
     # Create model
     best_model = ArimaModel(
         order=order,
-        ar_params=ar_params,
-        ma_params=ma_params,
-        intercept=float(params[-1]) if len(params) > order.p + order.q else 0.0,
-        sigma2=float(auto_model.sigma2()),
-        aic=float(auto_model.aic()),
-        bic=float(auto_model.bic()) if hasattr(auto_model, 'bic') else None
+        ar_params=_select('ar.L'),
+        ma_params=_select('ma.L'),
+        seasonal_ar_params=_select('ar.S.L') if order.is_seasonal else None,
+        seasonal_ma_params=_select('ma.S.L') if order.is_seasonal else None,
+        intercept=float(params.get('intercept', 0.0)),
+        sigma2=float(params['sigma2']),
+        aic=float(aic),
+        bic=float(bic)
     )
     
-    # Search information
-    search_info = {
-        "identification_time": time.time() - start_time,
-        "search_summary": {
-            "stepwise": stepwise,
-            "information_criterion": information_criterion,
-            "seasonal_tested": seasonal,
-            "max_order": {"p": max_p, "d": max_d, "q": max_q}
-        },
-        "candidates_evaluated": len(auto_model.valid_fits) if hasattr(auto_model, 'valid_fits') else 1
-    }
+    return best_model, len(valid_fits)
+
+
+def warm_up():
+    """
+    Run tiny fits through every estimation path.
     
-    return best_model, search_info
\ No newline at end of file
+    Pays statsmodels/pmdarima import costs and loads the compiled ARMA
+    kernels before the first real request.
+    """
+    rng = np.random.default_rng(0)
+    ARIMA(rng.standard_normal(20), order=(1, 0, 1)).fit()
+    auto_arima(rng.standard_normal(40), start_p=0, start_q=0, max_p=1, max_q=1, seasonal=False,
+               error_action='ignore', suppress_warnings=True)
+    search_arma(rng.standard_normal(40), 1, 1)
@@ -1,6 +1,6 @@
 """Configuration settings."""
 
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -10,13 +10,21 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
     MODEL_CACHE_TTL: int = 86400  # 24 hours
+    STORE_FLOAT32: bool = True  # Downcast stored series values to float32
+    MODEL_MEMORY_CACHE_SIZE: int = 256
+    MODEL_MEMORY_CACHE_TTL: int = 60  # seconds
+    DIAGNOSE_DIFFERENCED: bool = False  # Opt in to re-fitting diagnostics as ARMA on the differenced series
     
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8000"]
     
     # Model settings
     MAX_FORECAST_HORIZON: int = 365
+    FORECAST_STREAM_THRESHOLD: int = 64  # Longer horizons may be streamed as NDJSON
+    FORECAST_STREAM_CHUNK: int = 64  # Forecast points per streamed write
     MAX_ARIMA_ORDER: int = 5
+    PROCESS_POOL_WORKERS: Optional[int] = None  # Defaults to the CPU count
+    WARMUP_ON_STARTUP: bool = True
     
     class Config:
         env_file = ".env"
@@ -1,107 +1,109 @@
 """ARIMA model diagnostics."""
 
+import asyncio
 import numpy as np
 from scipy import stats
 from statsmodels.stats.diagnostic import acorr_ljungbox, het_breuschpagan
-from statsmodels.tsa.arima.model import ARIMA
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from jdemetra_common.models import TsData, ArimaModel
+from .config import settings
+from .forecasting import refit_arima
 
 
-def run_diagnostics(ts: TsData, model: ArimaModel, tests: List[str]) -> Dict[str, Any]:
-    """
-    Run diagnostic tests on ARIMA model.
-    
-    Returns:
-        Dictionary of diagnostic results
-    """
-    # Get residuals
-    series = ts.to_pandas()
-    
-    # Rebuild and fit model to get residuals
-    arima_order = (model.order.p, model.order.d, model.order.q)
-    seasonal_order = None
-    if model.order.is_seasonal:
-        seasonal_order = (
-            model.order.seasonal_p,
-            model.order.seasonal_d,
-            model.order.seasonal_q,
-            model.order.seasonal_period
-        )
-    
-    arima = ARIMA(
-        series,
-        order=arima_order,
-        seasonal_order=seasonal_order,
-        trend='c' if model.intercept != 0 else 'n'
+def ljung_box_test(residuals: np.ndarray, fitted_values: np.ndarray,
+                   moments: Any) -> Dict[str, Any]:
+    """Ljung-Box test for residual autocorrelation, computed at the max lag only."""
+    resid_values = np.asarray(residuals, dtype=float)
+    max_lag = max(1, min(10, len(resid_values)//5))
+    lb_result = acorr_ljungbox(
+        resid_values - resid_values.mean(),
+        lags=[max_lag],
+        boxpierce=False,
+        return_df=True
     )
-    fitted = arima.fit()
-    residuals = fitted.resid
+    lb_stat = lb_result["lb_stat"].iloc[-1]
+    lb_pvalue = lb_result["lb_pvalue"].iloc[-1]
     
-    # Residual statistics
-    residual_stats = {
-        "mean": float(np.mean(residuals)),
-        "std": float(np.std(residuals)),
-        "skewness": float(stats.skew(residuals)),
-        "kurtosis": float(stats.kurtosis(residuals))
+    return {
+        "test_name": "Ljung-Box",
+        "statistic": float(lb_stat),
+        "p_value": float(lb_pvalue),
+        "conclusion": "No residual autocorrelation" if lb_pvalue > 0.05 else "Residual autocorrelation detected",
+        "details": {"lags_tested": max_lag}
     }
+
+
+def jarque_bera_test(residuals: np.ndarray, fitted_values: np.ndarray,
+                     moments: Any) -> Dict[str, Any]:
+    """Jarque-Bera test for normality, from the precomputed residual moments."""
+    jb_stat = moments.nobs / 6.0 * (moments.skewness ** 2 + moments.kurtosis ** 2 / 4.0)
+    jb_pvalue = stats.chi2.sf(jb_stat, 2)
     
-    # Run requested tests
-    test_results = []
-    
-    if "ljung_box" in tests:
-        # Ljung-Box test for residual autocorrelation
-        lb_result = acorr_ljungbox(residuals, lags=min(10, len(residuals)//5), return_df=False)
-        lb_stat = lb_result[0][-1]  # Last lag
-        lb_pvalue = lb_result[1][-1]
-        
-        test_results.append({
-            "test_name": "Ljung-Box",
-            "statistic": float(lb_stat),
-            "p_value": float(lb_pvalue),
-            "conclusion": "No residual autocorrelation" if lb_pvalue > 0.05 else "Residual autocorrelation detected",
-            "details": {"lags_tested": len(lb_result[0])}
-        })
-    
-    if "jarque_bera" in tests:
-        # Jarque-Bera test for normality
-        jb_stat, jb_pvalue = stats.jarque_bera(residuals)
+    return {
+        "test_name": "Jarque-Bera",
+        "statistic": float(jb_stat),
+        "p_value": float(jb_pvalue),
+        "conclusion": "Residuals are normally distributed" if jb_pvalue > 0.05 else "Residuals are not normally distributed",
+        "details": None
+    }
+
+
+def heteroscedasticity_test(residuals: np.ndarray, fitted_values: np.ndarray,
+                            moments: Any) -> Dict[str, Any]:
+    """Simplified heteroscedasticity test using squared residuals."""
+    try:
+        squared_resid = residuals ** 2
+        corr, pvalue = stats.pearsonr(fitted_values, squared_resid)
         
-        test_results.append({
-            "test_name": "Jarque-Bera",
-            "statistic": float(jb_stat),
-            "p_value": float(jb_pvalue),
-            "conclusion": "Residuals are normally distributed" if jb_pvalue > 0.05 else "Residuals are not normally distributed",
-            "details": None
-        })
-    
-    if "heteroscedasticity" in tests:
-        # Breusch-Pagan test for heteroscedasticity
-        # Need to get fitted values
+        return {
+            "test_name": "Heteroscedasticity (simplified)",
+            "statistic": float(corr),
+            "p_value": float(pvalue),
+            "conclusion": "No heteroscedasticity" if pvalue > 0.05 else "Heteroscedasticity detected",
+            "details": {"method": "correlation_test"}
+        }
+    except Exception:
+        # Fallback if test fails
+        return {
+            "test_name": "Heteroscedasticity",
+            "statistic": None,
+            "p_value": None,
+            "conclusion": "Test could not be performed",
+            "details": {"error": "Insufficient data or computation error"}
+        }
+
+
+# Available tests, in reporting order
+DIAGNOSTIC_TESTS = {
+    "ljung_box": ljung_box_test,
+    "jarque_bera": jarque_bera_test,
+    "heteroscedasticity": heteroscedasticity_test,
+}
+
+
+def _get_residuals(ts: TsData, model: ArimaModel,
+                   fitted: Optional[Any] = None,
+                   residuals: Optional[np.ndarray] = None,
+                   fitted_values: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Resolve residuals and fitted values, re-fitting only if nothing was stored."""
+    if residuals is None or fitted_values is None:
+        if fitted is None:
+            fitted = refit_arima(ts, model, differenced=settings.DIAGNOSE_DIFFERENCED)
+        residuals = fitted.resid
         fitted_values = fitted.fittedvalues
-        
-        try:
-            # Simple heteroscedasticity test using squared residuals
-            squared_resid = residuals ** 2
-            corr, pvalue = stats.pearsonr(fitted_values, squared_resid)
-            
-            test_results.append({
-                "test_name": "Heteroscedasticity (simplified)",
-                "statistic": float(corr),
-                "p_value": float(pvalue),
-                "conclusion": "No heteroscedasticity" if pvalue > 0.05 else "Heteroscedasticity detected",
-                "details": {"method": "correlation_test"}
-            })
-        except Exception:
-            # Fallback if test fails
-            test_results.append({
-                "test_name": "Heteroscedasticity",
-                "statistic": None,
-                "p_value": None,
-                "conclusion": "Test could not be performed",
-                "details": {"error": "Insufficient data or computation error"}
-            })
+    return residuals, fitted_values
+
+
+def _summarize(moments: Any, test_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine residual statistics and test results into the diagnostics report."""
+    residual_stats = {
+        "mean": float(moments.mean),
+        # describe reports the sample variance; keep the population std
+        "std": float(np.sqrt(moments.variance * (moments.nobs - 1) / moments.nobs)),
+        "skewness": float(moments.skewness),
+        "kurtosis": float(moments.kurtosis)
+    }
     
     # Overall adequacy assessment
     adequacy_issues = []
@@ -119,4 +121,58 @@ def run_diagnostics(ts: TsData, model: ArimaModel, tests: List[str]) -> Dict[str
         "residual_stats": residual_stats,
         "diagnostic_tests": test_results,
         "model_adequacy": model_adequacy
-    }
\ No newline at end of file
+    }
+
+
+def run_diagnostics(ts: TsData, model: ArimaModel, tests: List[str],
+                    fitted: Optional[Any] = None,
+                    residuals: Optional[np.ndarray] = None,
+                    fitted_values: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Run diagnostic tests on ARIMA model.
+    
+    Stored ``residuals``/``fitted_values`` are used as-is; otherwise they are
+    taken from ``fitted``, the statsmodels results persisted at estimation
+    time, and only when both are missing is the model re-fitted on ``ts``.
+    
+    Returns:
+        Dictionary of diagnostic results
+    """
+    residuals, fitted_values = _get_residuals(ts, model, fitted, residuals, fitted_values)
+    # Residual moments in a single pass, shared with the tests
+    moments = stats.describe(residuals)
+    
+    # Run requested tests
+    test_results = [
+        test_fn(residuals, fitted_values, moments)
+        for name, test_fn in DIAGNOSTIC_TESTS.items()
+        if name in tests
+    ]
+    
+    return _summarize(moments, test_results)
+
+
+async def run_diagnostics_async(ts: TsData, model: ArimaModel, tests: List[str],
+                                fitted: Optional[Any] = None,
+                                residuals: Optional[np.ndarray] = None,
+                                fitted_values: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Run diagnostic tests concurrently in worker threads.
+    
+    Same inputs and output as ``run_diagnostics``; each selected test runs
+    via ``asyncio.to_thread`` so the event loop is not blocked.
+    
+    Returns:
+        Dictionary of diagnostic results
+    """
+    residuals, fitted_values = _get_residuals(ts, model, fitted, residuals, fitted_values)
+    # Residual moments in a single pass, shared with the tests
+    moments = stats.describe(residuals)
+    
+    test_results = await asyncio.gather(*[
+        asyncio.to_thread(test_fn, residuals, fitted_values, moments)
+        for name, test_fn in DIAGNOSTIC_TESTS.items()
+        if name in tests
+    ])
+    
+    return _summarize(moments, list(test_results))
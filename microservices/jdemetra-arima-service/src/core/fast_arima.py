@@ -0,0 +1,259 @@
+"""Numba-compiled ARMA fitting used by automatic model identification."""
+
+import numpy as np
+from joblib import Parallel, delayed
+from numba import boolean, float64, int64, njit
+from typing import Dict, Any, List, Tuple
+
+
+# Kernels carry explicit signatures, so they are compiled (or loaded from the
+# on-disk cache) at import rather than on the first fit. Arguments must be
+# float64 ndarrays and ints; pandas objects have to be unwrapped first.
+
+# Information criterion codes used by the compiled dispatch
+IC_CODES = {"aic": 0, "bic": 1, "aicc": 2}
+
+# Nelder-Mead iteration cap and relative convergence tolerance
+NM_MAX_ITER = 500
+NM_TOL = 1e-8
+
+# Fast-math without the no-NaN/no-Inf assumptions, which would let LLVM fold
+# away the non-finite checks the loss relies on to penalize overflowing fits
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(float64[::1](float64[::1], float64[:], float64[:], int64, int64), cache=True, fastmath=FASTMATH)
+def css_residuals(y: np.ndarray, phi: np.ndarray, theta: np.ndarray, p: int, q: int) -> np.ndarray:
+    """
+    Run the recursive ARMA filter and return conditional residuals.
+
+    The first ``p`` residuals are conditioned to zero.
+    """
+    n = y.shape[0]
+    resid = np.zeros(n)
+    for t in range(p, n):
+        e = y[t]
+        for i in range(p):
+            e -= phi[i] * y[t - i - 1]
+        for j in range(q):
+            if t - j - 1 >= 0:
+                e -= theta[j] * resid[t - j - 1]
+        resid[t] = e
+    return resid
+
+
+@njit(boolean(float64[:]), cache=True, fastmath=FASTMATH)
+def is_stationary(coefs: np.ndarray) -> bool:
+    """
+    Check that 1 - c_1 z - ... - c_k z^k has all roots outside the unit circle.
+
+    Uses the Durbin-Levinson step-down recursion on partial autocorrelations.
+    """
+    a = coefs.copy()
+    for k in range(a.shape[0] - 1, -1, -1):
+        r = a[k]
+        if abs(r) >= 1.0:
+            return False
+        if k == 0:
+            break
+        reduced = np.empty(k)
+        for j in range(k):
+            reduced[j] = (a[j] + r * a[k - 1 - j]) / (1.0 - r * r)
+        a = reduced
+    return True
+
+
+@njit(float64(float64[:], float64[::1], int64, int64, int64), cache=True, fastmath=FASTMATH)
+def css_loss(params: np.ndarray, y: np.ndarray, p: int, q: int, n_cond: int) -> float:
+    """
+    Conditional sum of squares per observation for ARMA(p, q) parameters.
+
+    The loss is accumulated from ``n_cond`` (>= p) so that candidates of
+    different orders are compared on the same observations.
+    """
+    # Non-stationary or non-invertible candidates are infeasible
+    if not is_stationary(params[:p]) or not is_stationary(-params[p:p + q]):
+        return 1e300
+    resid = css_residuals(y, params[:p], params[p:p + q], p, q)
+    n_eff = y.shape[0] - n_cond
+    ssr = 0.0
+    for t in range(n_cond, y.shape[0]):
+        ssr += resid[t] * resid[t]
+    if not np.isfinite(ssr):
+        return 1e300
+    return ssr / n_eff
+
+
+@njit(float64(float64[:], float64[::1], int64, int64, int64, int64), cache=True, fastmath=FASTMATH)
+def neg_loglik(params: np.ndarray, y: np.ndarray, p: int, d: int, q: int, n_cond: int) -> float:
+    """Gaussian negative log-likelihood of the CSS fit on an already differenced series."""
+    sigma2 = css_loss(params, y, p, q, n_cond)
+    n_eff = y.shape[0] - n_cond
+    return 0.5 * n_eff * (np.log(2.0 * np.pi * sigma2) + 1.0)
+
+
+@njit(float64(int64, float64, int64, int64), cache=True, fastmath=FASTMATH)
+def ic_value(ic_code: int, log_likelihood: float, n: int, k: int) -> float:
+    """Evaluate AIC (0), BIC (1) or AICc (2) from the log-likelihood."""
+    base = -2.0 * log_likelihood
+    if ic_code == 1:
+        return base + k * np.log(n)
+    aic = base + 2.0 * k
+    if ic_code == 2:
+        if n - k - 1 <= 0:
+            return np.inf
+        return aic + 2.0 * k * (k + 1) / (n - k - 1)
+    return aic
+
+
+@njit(float64[:](float64[::1], float64[::1], int64, int64, int64, int64, float64), cache=True, fastmath=FASTMATH)
+def nelder_mead(x0: np.ndarray, y: np.ndarray, p: int, q: int, n_cond: int,
+                max_iter: int, tol: float) -> np.ndarray:
+    """Minimize the CSS loss with a Nelder-Mead simplex started around ``x0``."""
+    k = x0.shape[0]
+    simplex = np.empty((k + 1, k))
+    values = np.empty(k + 1)
+    simplex[0] = x0
+    for i in range(k):
+        point = x0.copy()
+        point[i] = point[i] + 0.1 if point[i] == 0.0 else point[i] * 1.1
+        simplex[i + 1] = point
+    for i in range(k + 1):
+        values[i] = css_loss(simplex[i], y, p, q, n_cond)
+
+    for _ in range(max_iter):
+        order = np.argsort(values)
+        simplex = simplex[order]
+        values = values[order]
+        if abs(values[-1] - values[0]) <= tol * (abs(values[0]) + tol):
+            break
+
+        centroid = np.zeros(k)
+        for i in range(k):
+            centroid += simplex[i]
+        centroid /= k
+
+        reflected = centroid + (centroid - simplex[-1])
+        f_reflected = css_loss(reflected, y, p, q, n_cond)
+        if f_reflected < values[0]:
+            expanded = centroid + 2.0 * (centroid - simplex[-1])
+            f_expanded = css_loss(expanded, y, p, q, n_cond)
+            if f_expanded < f_reflected:
+                simplex[-1] = expanded
+                values[-1] = f_expanded
+            else:
+                simplex[-1] = reflected
+                values[-1] = f_reflected
+        elif f_reflected < values[-2]:
+            simplex[-1] = reflected
+            values[-1] = f_reflected
+        else:
+            contracted = centroid + 0.5 * (simplex[-1] - centroid)
+            f_contracted = css_loss(contracted, y, p, q, n_cond)
+            if f_contracted < values[-1]:
+                simplex[-1] = contracted
+                values[-1] = f_contracted
+            else:
+                for i in range(1, k + 1):
+                    simplex[i] = simplex[0] + 0.5 * (simplex[i] - simplex[0])
+                    values[i] = css_loss(simplex[i], y, p, q, n_cond)
+
+    return simplex[np.argmin(values)]
+
+
+def hannan_rissanen(y: np.ndarray, p: int, q: int) -> np.ndarray:
+    """
+    Initial ARMA estimates from the Hannan-Rissanen two-stage regression.
+
+    Returns zeros when the series is too short for the long AR stage.
+    """
+    n = len(y)
+    if p + q == 0:
+        return np.zeros(0)
+
+    # Stage 1: long autoregression to approximate the innovations
+    m = min(max(p, q) + 5, n // 3)
+    if m < 1 or n - m <= p + q:
+        return np.zeros(p + q)
+    X = np.column_stack([y[m - i - 1:n - i - 1] for i in range(m)])
+    coef, *_ = np.linalg.lstsq(X, y[m:], rcond=None)
+    innovations = np.zeros(n)
+    innovations[m:] = y[m:] - X @ coef
+
+    # Stage 2: regress on lagged values and lagged innovations
+    start = m + max(p, q)
+    if n - start <= p + q:
+        return np.zeros(p + q)
+    columns = [y[start - i - 1:n - i - 1] for i in range(p)]
+    columns += [innovations[start - j - 1:n - j - 1] for j in range(q)]
+    coef, *_ = np.linalg.lstsq(np.column_stack(columns), y[start:], rcond=None)
+    return np.clip(coef, -0.95, 0.95)
+
+
+def fit_arma(y: np.ndarray, p: int, q: int, ic_code: int = 0, n_cond: int = -1) -> Dict[str, Any]:
+    """
+    Fit ARMA(p, q) by conditional sum of squares on a demeaned series.
+
+    Returns:
+        Dictionary with parameters, residual variance and information criteria
+    """
+    # The compiled kernels only accept contiguous float64 arrays
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    if n_cond < p:
+        n_cond = p
+    x0 = hannan_rissanen(y, p, q)
+    # Shrink the starting point towards zero until it is feasible
+    while css_loss(x0, y, p, q, n_cond) >= 1e300 and np.any(x0 != 0.0):
+        x0 = np.where(np.abs(x0) < 1e-3, 0.0, 0.5 * x0)
+    params = nelder_mead(x0, y, p, q, n_cond, NM_MAX_ITER, NM_TOL) if p + q > 0 else x0
+    sigma2 = css_loss(params, y, p, q, n_cond)
+    n_eff = len(y) - n_cond
+    k = p + q + 1
+    # Likelihood-based, so the criteria are on the same scale as statsmodels'
+    log_likelihood = -neg_loglik(params, y, p, 0, q, n_cond)
+    return {
+        "p": p,
+        "q": q,
+        "params": params,
+        "sigma2": float(sigma2),
+        "n_obs": n_eff,
+        "log_likelihood": float(log_likelihood),
+        "aic": float(ic_value(0, log_likelihood, n_eff, k)),
+        "bic": float(ic_value(1, log_likelihood, n_eff, k)),
+        "ic": float(ic_value(ic_code, log_likelihood, n_eff, k)),
+    }
+
+
+def search_arma(y: np.ndarray, max_p: int, max_q: int,
+                information_criterion: str = "aic",
+                n_jobs: int = 1) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Fit every ARMA(p, q) candidate up to the given bounds and pick the best.
+
+    Candidates are independent, so with ``n_jobs != 1`` they are fitted in
+    parallel worker processes (-1 uses all cores).
+
+    Returns:
+        Tuple of (best_fit, all_valid_fits)
+    """
+    ic_code = IC_CODES[information_criterion]
+    candidates = [
+        (p, q)
+        for p in range(max_p + 1)
+        for q in range(max_q + 1)
+        if len(y) - max_p > p + q + 2
+    ]
+
+    if n_jobs == 1:
+        results = [fit_arma(y, p, q, ic_code, max_p) for p, q in candidates]
+    else:
+        results = Parallel(n_jobs=n_jobs, backend="loky", batch_size="auto")(
+            delayed(fit_arma)(y, p, q, ic_code, max_p) for p, q in candidates
+        )
+    fits = [fit for fit in results if np.isfinite(fit["ic"])]
+
+    if not fits:
+        raise ValueError("No valid ARMA candidate could be fitted")
+
+    best = min(fits, key=lambda f: f["ic"])
+    return best, fits
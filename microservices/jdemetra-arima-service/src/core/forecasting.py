@@ -2,36 +2,112 @@
 
 import time
 import numpy as np
+import pandas as pd
 from statsmodels.tsa.arima.model import ARIMA
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
 
-from jdemetra_common.models import TsData, ArimaModel, TsPeriod
+from jdemetra_common.models import TsData, ArimaModel
 
 
 def generate_forecasts(ts: TsData, model: ArimaModel, horizon: int, 
-                      confidence_level: float = 0.95) -> Tuple[List[dict], float]:
+                      confidence_level: float = 0.95,
+                      spec: Optional[Any] = None) -> Tuple[List[dict], float]:
     """
     Generate forecasts from ARIMA model.
     
+    ``spec`` is the fitted-results spec persisted at estimation time; the
+    results are rebuilt from it by filtering, or re-fitted on ``ts`` when
+    it is missing.
+    
     Returns:
         Tuple of (forecasts, forecast_time)
     """
     start_time = time.time()
     
+    fitted = refit_arima(ts, model) if spec is None else restore_fitted(ts, spec)
+    
+    # Get point forecasts and prediction intervals
+    forecast_df = fitted.get_forecast(steps=horizon).summary_frame(alpha=1-confidence_level)
+    
+    values = forecast_df[['mean', 'mean_ci_lower', 'mean_ci_upper']].to_numpy(dtype=float)
+    
+    # Periods following the end of the series, from zero-based period ordinals
+    periods_per_year = ts.frequency.periods_per_year
+    start = ts.start_period
+    first = start.year * periods_per_year + start.period - 1 + ts.length
+    years, periods = np.divmod(first + np.arange(horizon), periods_per_year)
+    years = years.tolist()
+    periods = (periods + 1).tolist()
+    
+    # Build forecast list; the frequency is reported once on the response
+    forecasts = [
+        {
+            "period": {
+                "year": year,
+                "period": period
+            },
+            "forecast": mean,
+            "lower_bound": lower,
+            "upper_bound": upper
+        }
+        for year, period, (mean, lower, upper) in zip(years, periods, values.tolist())
+    ]
+    
+    forecast_time = time.time() - start_time
+    
+    return forecasts, forecast_time
+
+
+def difference_series(values: np.ndarray, d: int, seasonal_d: int = 0,
+                      seasonal_period: int = 0) -> np.ndarray:
+    """Apply seasonal then regular differencing to a series."""
+    values = np.asarray(values, dtype=float)
+    for _ in range(seasonal_d):
+        values = values[seasonal_period:] - values[:-seasonal_period]
+    return np.diff(values, n=d) if d > 0 else values
+
+
+def restore_fitted(ts: TsData, spec: Any) -> Any:
+    """Rebuild fitted statsmodels results by filtering ``ts`` at stored parameters."""
+    arima = ARIMA(
+        ts.to_pandas(),
+        order=spec.order,
+        seasonal_order=spec.seasonal_order,
+        trend=spec.trend
+    )
+    return arima.filter(spec.param_values)
+
+
+def refit_arima(ts: TsData, model: ArimaModel, differenced: bool = False) -> Any:
+    """
+    Rebuild and fit the statsmodels ARIMA matching a stored model.
+    
+    With ``differenced`` the integrated model is fitted as an ARMA on the
+    already differenced series, which shrinks the state space. Residuals are
+    then those of the differenced series; forecasts would be of differences,
+    so forecasting keeps the default.
+    """
     # Convert to pandas
     series = ts.to_pandas()
     
     # Rebuild ARIMA model
-    arima_order = (model.order.p, model.order.d, model.order.q)
+    d = model.order.d
+    seasonal_d = model.order.seasonal_d if model.order.is_seasonal else 0
+    if differenced and (d > 0 or seasonal_d > 0):
+        values = difference_series(series.values, d, seasonal_d, model.order.seasonal_period)
+        series = pd.Series(values, index=series.index[len(series) - len(values):])
+        d, seasonal_d = 0, 0
+    
+    arima_order = (model.order.p, d, model.order.q)
     if model.order.is_seasonal:
         seasonal_order = (
             model.order.seasonal_p,
-            model.order.seasonal_d,
+            seasonal_d,
             model.order.seasonal_q,
             model.order.seasonal_period
         )
     else:
-        seasonal_order = None
+        seasonal_order = (0, 0, 0, 0)
     
     # Create and fit model
     arima = ARIMA(
@@ -40,84 +116,4 @@ def generate_forecasts(ts: TsData, model: ArimaModel, horizon: int,
         seasonal_order=seasonal_order,
         trend='c' if model.intercept != 0 else 'n'
     )
-    
-    # Set parameters directly (skip re-estimation)
-    # This is a simplified approach - in production would need proper parameter mapping
-    fitted = arima.fit()
-    
-    # Generate forecasts
-    forecast_result = fitted.forecast(steps=horizon, alpha=1-confidence_level)
-    
-    # Get point forecasts and intervals
-    if hasattr(forecast_result, 'values'):
-        point_forecasts = forecast_result.values
-    else:
-        point_forecasts = forecast_result
-    
-    # Get prediction intervals
-    forecast_df = fitted.get_forecast(steps=horizon).summary_frame(alpha=1-confidence_level)
-    
-    # Build forecast list
-    forecasts = []
-    current_period = ts.end_period
-    
-    for i in range(horizon):
-        # Calculate next period
-        if ts.frequency.value == "M":
-            if current_period.period == 12:
-                next_period = TsPeriod(
-                    year=current_period.year + 1,
-                    period=1,
-                    frequency=ts.frequency
-                )
-            else:
-                next_period = TsPeriod(
-                    year=current_period.year,
-                    period=current_period.period + 1,
-                    frequency=ts.frequency
-                )
-        elif ts.frequency.value == "Q":
-            if current_period.period == 4:
-                next_period = TsPeriod(
-                    year=current_period.year + 1,
-                    period=1,
-                    frequency=ts.frequency
-                )
-            else:
-                next_period = TsPeriod(
-                    year=current_period.year,
-                    period=current_period.period + 1,
-                    frequency=ts.frequency
-                )
-        elif ts.frequency.value == "Y":
-            next_period = TsPeriod(
-                year=current_period.year + 1,
-                period=1,
-                frequency=ts.frequency
-            )
-        else:
-            # For other frequencies, simplified increment
-            next_period = TsPeriod(
-                year=current_period.year,
-                period=current_period.period + 1,
-                frequency=ts.frequency
-            )
-        
-        # Create forecast point
-        forecast_point = {
-            "period": {
-                "year": next_period.year,
-                "period": next_period.period,
-                "frequency": next_period.frequency.value
-            },
-            "forecast": float(forecast_df.iloc[i]['mean']),
-            "lower_bound": float(forecast_df.iloc[i][f'mean_ci_lower']),
-            "upper_bound": float(forecast_df.iloc[i][f'mean_ci_upper'])
-        }
-        
-        forecasts.append(forecast_point)
-        current_period = next_period
-    
-    forecast_time = time.time() - start_time
-    
-    return forecasts, forecast_time
\ No newline at end of file
+    return arima.fit()
\ No newline at end of file
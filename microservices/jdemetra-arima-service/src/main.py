@@ -1,5 +1,9 @@
 """Main entry point for ARIMA Modeling Service."""
 
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -7,29 +11,53 @@ import redis.asyncio as redis
 
 from .api import arima
 from .core.config import settings
+from .core.responses import ORJSONResponse
+from .core.arima_estimation import warm_up
+
+
+logger = logging.getLogger(__name__)
 
 
 # Global Redis client
 redis_client = None
 
+# Worker processes for blocking model fits
+process_pool = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global redis_client
+    global redis_client, process_pool
     # Startup
     redis_client = await redis.from_url(settings.REDIS_URL, decode_responses=False)
+    workers = settings.PROCESS_POOL_WORKERS or os.cpu_count()
+    process_pool = ProcessPoolExecutor(max_workers=workers)
+    app.state.pool = process_pool
+    if settings.WARMUP_ON_STARTUP:
+        # Warm this process and each pool worker so first requests skip import/JIT costs
+        try:
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                asyncio.to_thread(warm_up),
+                *[loop.run_in_executor(process_pool, warm_up) for _ in range(workers)]
+            )
+        except Exception:
+            logger.warning("Model warm-up failed", exc_info=True)
     yield
     # Shutdown
     if redis_client:
         await redis_client.close()
+    if process_pool:
+        process_pool.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(
     title="ARIMA Modeling Service",
     description="ARIMA model estimation and forecasting service",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -55,4 +83,9 @@ def get_redis():
     """Get Redis client."""
     if not redis_client:
         raise RuntimeError("Redis not initialized")
-    return redis_client
\ No newline at end of file
+    return redis_client
+
+
+def get_pool():
+    """Get process pool for model fits (None when running without lifespan)."""
+    return process_pool
@@ -1,57 +1,388 @@
 """Model storage and retrieval."""
 
+import dataclasses
+import hashlib
 import json
 import pickle
+import struct
+import threading
+import time
+from collections import OrderedDict
 from uuid import UUID, uuid4
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+
+import msgspec
+import numpy as np
+import orjson
+import zstandard
 
 from jdemetra_common.models import ArimaModel, TsData
+from ..core.config import settings
+
+
+# Leading byte of model payloads; bump when the envelope layout changes
+PAYLOAD_VERSION = 2
+
+# Version byte followed by the big-endian length of the compressed body
+_HEADER = struct.Struct(">BI")
+
+_compressor = zstandard.ZstdCompressor(level=3)
+_decompressor = zstandard.ZstdDecompressor()
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+
+def _frame(obj: Any) -> bytes:
+    """Encode an object as a length-prefixed, compressed msgpack frame."""
+    body = _compressor.compress(_encoder.encode(obj))
+    return _HEADER.pack(PAYLOAD_VERSION, len(body)) + body
+
+
+def _unframe(data: bytes, decoder: msgspec.msgpack.Decoder = _decoder) -> Any:
+    """Decode a frame written by ``_frame``."""
+    _, length = _HEADER.unpack_from(data)
+    body = data[_HEADER.size:_HEADER.size + length]
+    return decoder.decode(_decompressor.decompress(body))
+
+
+# ArimaModel fields holding numpy parameter arrays
+_PARAM_FIELDS = ("ar_params", "ma_params", "seasonal_ar_params", "seasonal_ma_params")
+
+
+def _np_to_blob(arr: Optional[np.ndarray]) -> Optional[Dict[str, Any]]:
+    """Describe an array by dtype, shape and raw bytes (no per-element boxing)."""
+    if arr is None:
+        return None
+    arr = np.ascontiguousarray(arr)
+    return {"dtype": arr.dtype.str, "shape": list(arr.shape), "data": arr.tobytes()}
+
+
+def _blob_to_np(blob: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+    """Rebuild an array from ``_np_to_blob`` output."""
+    if blob is None:
+        return None
+    return np.frombuffer(blob["data"], dtype=blob["dtype"]).reshape(blob["shape"])
+
+
+def _model_record(model: ArimaModel) -> Dict[str, Any]:
+    """Storage form of a model, shipping parameter arrays as binary blobs."""
+    record = {name: getattr(model, name) for name in (
+        "intercept", "sigma2", "log_likelihood", "aic", "bic"
+    )}
+    # Only the constructor fields; the order also carries a cached label
+    record["order"] = {
+        field.name: getattr(model.order, field.name)
+        for field in dataclasses.fields(model.order) if field.init
+    }
+    for name in _PARAM_FIELDS:
+        record[name] = _np_to_blob(getattr(model, name))
+    return record
+
+
+def pack_model(model: ArimaModel, ts_data: TsData) -> bytes:
+    """
+    Serialize model and series into a versioned, length-prefixed msgpack + zstd frame.
+    
+    Series values are downcast to float32 unless ``STORE_FLOAT32`` is disabled;
+    the stored dtype is recorded in the payload.
+    """
+    dtype = np.float32 if settings.STORE_FLOAT32 else np.float64
+    values = np.ascontiguousarray(ts_data.values, dtype=dtype)
+    ts_dict = {
+        "values": values.tobytes(),
+        "dtype": values.dtype.name,
+        "shape": list(values.shape),
+        "start_period": {
+            "year": ts_data.start_period.year,
+            "period": ts_data.start_period.period,
+            "frequency": ts_data.start_period.frequency.value,
+        },
+        "frequency": ts_data.frequency.value,
+        "metadata": ts_data.metadata,
+    }
+    
+    return _frame({"model": _model_record(model), "ts_data": ts_dict})
+
+
+def unpack_model(data: bytes) -> Dict[str, Any]:
+    """Deserialize a model payload into model/ts_data dictionaries."""
+    if data[0] != PAYLOAD_VERSION:
+        # Pickled payload written before the versioned envelope
+        return pickle.loads(data)
+    
+    model_data = _unframe(data)
+    for name in _PARAM_FIELDS:
+        model_data["model"][name] = _blob_to_np(model_data["model"][name])
+    ts_dict = model_data["ts_data"]
+    # TsData upcasts the values back to float64
+    dtype = np.dtype(ts_dict.pop("dtype"))
+    ts_dict["values"] = np.frombuffer(ts_dict["values"], dtype=dtype).reshape(ts_dict.pop("shape"))
+    return model_data
+
+
+def pack_residuals(residuals: np.ndarray, fitted_values: np.ndarray) -> bytes:
+    """Serialize in-sample residuals and fitted values as float32 msgpack + zstd."""
+    arrays = {}
+    for name, array in (("residuals", residuals), ("fitted_values", fitted_values)):
+        values = np.ascontiguousarray(array, dtype=np.float32)
+        arrays[name] = {"values": values.tobytes(), "shape": list(values.shape)}
+    
+    return _frame(arrays)
+
+
+def unpack_residuals(data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Deserialize residuals and fitted values as float64 arrays."""
+    arrays = _unframe(data)
+    return tuple(
+        np.frombuffer(arrays[name]["values"], dtype=np.float32)
+        .reshape(arrays[name]["shape"])
+        .astype(np.float64)
+        for name in ("residuals", "fitted_values")
+    )
+
+
+class FittedSpec(msgspec.Struct, frozen=True):
+    """Specification and estimated parameters of a fitted statsmodels ARIMA."""
+    order: Tuple[int, int, int]
+    seasonal_order: Tuple[int, int, int, int]
+    trend: Optional[str]
+    params: bytes
+    
+    @property
+    def param_values(self) -> np.ndarray:
+        """Estimated parameters as a float64 array, in statsmodels order."""
+        return np.frombuffer(self.params, dtype=np.float64)
+
+
+_fitted_decoder = msgspec.msgpack.Decoder(FittedSpec)
+
+
+def pack_fitted(fitted: Any) -> bytes:
+    """
+    Serialize what rebuilding fitted statsmodels results needs.
+    
+    Only the specification and parameters are kept; the data and Kalman
+    filter output are recomputed from the stored series on load.
+    """
+    arima = fitted.model
+    return _frame(FittedSpec(
+        order=tuple(arima.order),
+        seasonal_order=tuple(arima.seasonal_order),
+        trend=arima.trend,
+        params=np.ascontiguousarray(fitted.params, dtype=np.float64).tobytes()
+    ))
+
+
+def unpack_fitted(data: bytes) -> Optional[FittedSpec]:
+    """
+    Deserialize and validate a fitted-results payload.
+    
+    Returns:
+        The stored spec, or None for payloads of an older layout, which are
+        then re-fitted rather than loaded
+    """
+    if data[0] != PAYLOAD_VERSION:
+        return None
+    try:
+        return _unframe(data, _fitted_decoder)
+    except (msgspec.DecodeError, zstandard.ZstdError, struct.error):
+        return None
+
+
+def identification_key(ts_data: TsData, params: tuple) -> str:
+    """Redis key for an identification result, fingerprinting series and search parameters."""
+    fingerprint = hashlib.blake2b(
+        np.ascontiguousarray(ts_data.values, dtype=np.float64).tobytes()
+        + str((ts_data.frequency.value,) + tuple(params)).encode(),
+        digest_size=16
+    )
+    return f"arima_id:{fingerprint.hexdigest()}"
+
+
+class ModelCache:
+    """Bounded in-process LRU cache with per-entry TTL for deserialized models."""
+    
+    def __init__(self, max_size: int = 256, ttl: float = 60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached value, dropping it if expired."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if time.monotonic() < entry[0]:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._cache[key]
+            self.misses += 1
+            return None
+    
+    def set(self, key: str, value: Any):
+        """Cache value, evicting the least recently used entry at capacity."""
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+    
+    def invalidate(self, key: str):
+        """Remove cached value."""
+        with self._lock:
+            self._cache.pop(key, None)
+    
+    def clear(self):
+        """Clear cache and reset counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from memory."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
 
 
 class ModelStorage:
     """Handle model storage in Redis."""
     
+    # Shared across instances so every request handler sees the same entries
+    cache = ModelCache(
+        max_size=settings.MODEL_MEMORY_CACHE_SIZE,
+        ttl=settings.MODEL_MEMORY_CACHE_TTL
+    )
+    
     def __init__(self, redis_client):
         self.redis = redis_client
         self.ttl = 86400  # 24 hours
     
-    async def save_model(self, model: ArimaModel, ts_data: TsData) -> UUID:
-        """Save model and return ID."""
+    async def save_model(self, model: ArimaModel, ts_data: TsData,
+                         fitted: Optional[Any] = None) -> UUID:
+        """Save model, and optionally the spec of its fitted statsmodels results, and return ID."""
         model_id = uuid4()
         
-        # Serialize model and data
-        model_data = {
-            "model": model.to_dict(),
-            "ts_data": ts_data.to_dict()
-        }
-        
-        # Store in Redis
-        key = f"arima_model:{model_id}"
-        await self.redis.setex(
-            key,
-            self.ttl,
-            pickle.dumps(model_data)
-        )
+        # Write all keys in a single round trip
+        async with self.redis.pipeline(transaction=False) as pipe:
+            # Store serialized model and data in Redis
+            pipe.setex(
+                f"arima_model:{model_id}",
+                self.ttl,
+                pack_model(model, ts_data)
+            )
+            
+            # Store the fitted spec so forecast/diagnose can filter instead of re-fitting
+            if fitted is not None:
+                pipe.setex(
+                    f"arima_fitted:{model_id}",
+                    self.ttl,
+                    pack_fitted(fitted)
+                )
+                # Diagnostics only need these, so keep them apart from the spec
+                pipe.setex(
+                    f"arima_resid:{model_id}",
+                    self.ttl,
+                    pack_residuals(fitted.resid, fitted.fittedvalues)
+                )
+            
+            await pipe.execute()
         
         return model_id
     
     async def get_model(self, model_id: UUID) -> Optional[tuple[ArimaModel, TsData]]:
-        """Retrieve model by ID."""
+        """Retrieve model by ID, serving repeated lookups from memory."""
         key = f"arima_model:{model_id}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
         data = await self.redis.get(key)
         
         if not data:
             return None
         
-        # Deserialize
-        model_data = pickle.loads(data)
+        return self._load_model(key, data)
+    
+    async def get_model_with_fitted(
+        self, model_id: UUID
+    ) -> Optional[tuple[ArimaModel, TsData, Optional[FittedSpec]]]:
+        """Retrieve model and its fitted-results spec in one round trip."""
+        return await self._get_model_with(model_id, f"arima_fitted:{model_id}", unpack_fitted)
+    
+    async def get_model_with_residuals(
+        self, model_id: UUID
+    ) -> Optional[tuple[ArimaModel, TsData, Optional[Tuple[np.ndarray, np.ndarray]]]]:
+        """Retrieve model and its stored (residuals, fitted_values) in one round trip."""
+        return await self._get_model_with(model_id, f"arima_resid:{model_id}", unpack_residuals)
+    
+    async def _get_model_with(self, model_id: UUID, extra_key: str, decode) -> Optional[tuple]:
+        """Fetch model and a companion key together with MGET."""
+        key = f"arima_model:{model_id}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            extra = await self.redis.get(extra_key)
+            return (*cached, decode(extra) if extra else None)
+        
+        data, extra = await self.redis.mget([key, extra_key])
+        
+        if not data:
+            return None
+        
+        model, ts_data = self._load_model(key, data)
+        return model, ts_data, decode(extra) if extra else None
+    
+    def _load_model(self, key: str, data: bytes) -> tuple[ArimaModel, TsData]:
+        """Deserialize a model payload and cache it in memory."""
+        model_data = unpack_model(data)
         model = ArimaModel.from_dict(model_data["model"])
         ts_data = TsData.from_dict(model_data["ts_data"])
         
+        self.cache.set(key, (model, ts_data))
         return model, ts_data
     
+    async def get_fitted(self, model_id: UUID) -> Optional[FittedSpec]:
+        """Retrieve the fitted-results spec by model ID."""
+        data = await self.redis.get(f"arima_fitted:{model_id}")
+        
+        if not data:
+            return None
+        
+        return unpack_fitted(data)
+    
+    async def get_residuals(self, model_id: UUID) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Retrieve stored (residuals, fitted_values) by model ID."""
+        data = await self.redis.get(f"arima_resid:{model_id}")
+        
+        if not data:
+            return None
+        
+        return unpack_residuals(data)
+    
+    async def get_identification(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a memoized identification result."""
+        data = await self.redis.get(key)
+        
+        if not data:
+            return None
+        
+        return orjson.loads(data)
+    
+    async def save_identification(self, key: str, result: Dict[str, Any]):
+        """Memoize a JSON-compatible identification result."""
+        await self.redis.setex(key, self.ttl, orjson.dumps(result))
+    
     async def delete_model(self, model_id: UUID) -> bool:
         """Delete model."""
         key = f"arima_model:{model_id}"
-        result = await self.redis.delete(key)
+        self.cache.invalidate(key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.delete(f"arima_fitted:{model_id}", f"arima_resid:{model_id}")
+            result, _ = await pipe.execute()
         return result > 0
\ No newline at end of file
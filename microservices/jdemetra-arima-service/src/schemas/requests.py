@@ -1,10 +1,11 @@
 """Request schemas for ARIMA service."""
 
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from uuid import UUID
 
 from jdemetra_common.schemas import TsDataSchema, ArimaOrderSchema
+from ..core.config import settings
 
 
 class EstimateRequest(BaseModel):
@@ -15,10 +16,10 @@ class EstimateRequest(BaseModel):
     method: Literal["css", "mle", "css-mle"] = Field("css-mle", description="Estimation method")
     include_mean: bool = Field(True, description="Include mean in model")
     
-    @validator("order")
+    @field_validator("order")
+    @classmethod
     def validate_order(cls, v):
         """Validate ARIMA order."""
-        from ..core.config import settings
         if v:
             if v.p > settings.MAX_ARIMA_ORDER or v.q > settings.MAX_ARIMA_ORDER:
                 raise ValueError(f"Order exceeds maximum of {settings.MAX_ARIMA_ORDER}")
@@ -32,10 +33,10 @@ class ForecastRequest(BaseModel):
     horizon: int = Field(..., gt=0, description="Forecast horizon")
     confidence_level: float = Field(0.95, gt=0, lt=1, description="Confidence level for intervals")
     
-    @validator("horizon")
+    @field_validator("horizon")
+    @classmethod
     def validate_horizon(cls, v):
         """Validate forecast horizon."""
-        from ..core.config import settings
         if v > settings.MAX_FORECAST_HORIZON:
             raise ValueError(f"Horizon exceeds maximum of {settings.MAX_FORECAST_HORIZON}")
         return v
@@ -51,6 +52,15 @@ class IdentifyRequest(BaseModel):
     max_q: int = Field(5, ge=0, le=10, description="Maximum MA order")
     max_d: int = Field(2, ge=0, le=3, description="Maximum differencing order")
     information_criterion: Literal["aic", "bic", "aicc"] = Field("aic", description="Information criterion")
+    n_jobs: int = Field(1, ge=-1, description="Parallel jobs for exhaustive searches (-1 uses all cores)")
+    
+    @field_validator("n_jobs")
+    @classmethod
+    def validate_n_jobs(cls, v):
+        """Validate number of parallel jobs."""
+        if v == 0:
+            raise ValueError("n_jobs must be -1 or a positive integer")
+        return v
 
 
 class DiagnoseRequest(BaseModel):
@@ -5,7 +5,8 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 from uuid import UUID
 
-from jdemetra_common.schemas import ArimaModelSchema, TsPeriodSchema
+from jdemetra_common.models import TsFrequency
+from jdemetra_common.schemas import ArimaModelSchema, TsPeriodShortSchema
 
 
 class EstimateResponse(BaseModel):
@@ -21,7 +22,7 @@ class EstimateResponse(BaseModel):
 class ForecastPoint(BaseModel):
     """Single forecast point."""
     
-    period: TsPeriodSchema = Field(..., description="Forecast period")
+    period: TsPeriodShortSchema = Field(..., description="Forecast period")
     forecast: float = Field(..., description="Point forecast")
     lower_bound: float = Field(..., description="Lower confidence bound")
     upper_bound: float = Field(..., description="Upper confidence bound")
@@ -31,6 +32,7 @@ class ForecastResponse(BaseModel):
     """Forecast response."""
     
     model_id: UUID = Field(..., description="Model ID used")
+    frequency: TsFrequency = Field(..., description="Frequency of the forecast periods")
     forecasts: List[ForecastPoint] = Field(..., description="Forecast values")
     confidence_level: float = Field(..., description="Confidence level used")
     forecast_time: float = Field(..., description="Forecasting time in seconds")
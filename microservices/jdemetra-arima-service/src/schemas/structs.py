@@ -0,0 +1,45 @@
+"""msgspec request structs for the ARIMA service hot path.
+
+Field-for-field counterparts of the Pydantic requests, which remain the
+OpenAPI documentation of the request bodies.
+"""
+
+from typing import Annotated, Literal, Optional
+
+import msgspec
+
+from jdemetra_common.schemas.arima_msgspec import TsDataSchema, ArimaOrderSchema
+from ..core.config import settings
+
+
+class EstimateRequest(msgspec.Struct, frozen=True):
+    """Request to estimate ARIMA model."""
+    
+    timeseries: TsDataSchema
+    order: Optional[ArimaOrderSchema] = None
+    method: Literal["css", "mle", "css-mle"] = "css-mle"
+    include_mean: bool = True
+    
+    def __post_init__(self):
+        """Validate ARIMA order."""
+        if self.order:
+            if self.order.p > settings.MAX_ARIMA_ORDER or self.order.q > settings.MAX_ARIMA_ORDER:
+                raise ValueError(f"Order exceeds maximum of {settings.MAX_ARIMA_ORDER}")
+
+
+class IdentifyRequest(msgspec.Struct, frozen=True):
+    """Request for automatic model identification."""
+    
+    timeseries: TsDataSchema
+    seasonal: bool = True
+    stepwise: bool = True
+    max_p: Annotated[int, msgspec.Meta(ge=0, le=10)] = 5
+    max_q: Annotated[int, msgspec.Meta(ge=0, le=10)] = 5
+    max_d: Annotated[int, msgspec.Meta(ge=0, le=3)] = 2
+    information_criterion: Literal["aic", "bic", "aicc"] = "aic"
+    n_jobs: Annotated[int, msgspec.Meta(ge=-1)] = 1
+    
+    def __post_init__(self):
+        """Validate number of parallel jobs."""
+        if self.n_jobs == 0:
+            raise ValueError("n_jobs must be -1 or a positive integer")
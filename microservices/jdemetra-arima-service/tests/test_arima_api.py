@@ -1,7 +1,9 @@
 """Tests for ARIMA API."""
 
+import json
 import pytest
 import numpy as np
+from scipy.signal import lfilter
 from uuid import UUID
 from fastapi.testclient import TestClient
 
@@ -11,16 +13,48 @@ class MockRedis:
         self.data = {}
     
     async def setex(self, key, ttl, value):
-        self.data[key] = value
+        # Redis hands values back as bytes
+        self.data[key] = value if isinstance(value, (bytes, bytearray)) else str(value).encode()
     
     async def get(self, key):
         return self.data.get(key)
     
-    async def delete(self, key):
-        if key in self.data:
-            del self.data[key]
-            return 1
-        return 0
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+    
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if key in self.data:
+                del self.data[key]
+                deleted += 1
+        return deleted
+    
+    def pipeline(self, transaction=True):
+        return MockPipeline(self)
+
+
+class MockPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.commands = []
+    
+    def setex(self, *args):
+        self.commands.append((self.redis.setex, args))
+        return self
+    
+    def delete(self, *args):
+        self.commands.append((self.redis.delete, args))
+        return self
+    
+    async def execute(self):
+        return [await command(*args) for command, args in self.commands]
 
 # Override dependencies
 from src.main import app, get_redis
@@ -31,6 +65,11 @@ app.dependency_overrides[get_redis] = lambda: mock_redis
 class TestArimaAPI:
     """Test ARIMA API endpoints."""
     
+    @pytest.fixture(autouse=True)
+    def clear_redis(self):
+        """Start every test from an empty store."""
+        mock_redis.data.clear()
+    
     @pytest.fixture
     def client(self):
         return TestClient(app)
@@ -38,13 +77,11 @@ class TestArimaAPI:
     @pytest.fixture
     def sample_timeseries(self):
         """Generate sample time series data."""
-        np.random.seed(42)
-        # AR(1) process
+        rng = np.random.default_rng(42)
+        # AR(1) process, filtered in one C call
         n = 100
         ar_coef = 0.7
-        data = [0]
-        for i in range(1, n):
-            data.append(ar_coef * data[i-1] + np.random.normal(0, 1))
+        data = lfilter([1.0], [1.0, -ar_coef], rng.standard_normal(n)).tolist()
         
         return {
             "timeseries": {
@@ -118,6 +155,7 @@ class TestArimaAPI:
         
         result = response.json()
         assert result["model_id"] == model_id
+        assert result["frequency"] == "M"
         assert len(result["forecasts"]) == 12
         assert result["confidence_level"] == 0.95
         
@@ -129,6 +167,27 @@ class TestArimaAPI:
         assert "upper_bound" in forecast
         assert forecast["lower_bound"] < forecast["forecast"] < forecast["upper_bound"]
     
+    def test_forecast_stream(self, client, sample_timeseries):
+        """Test NDJSON streaming of long forecast horizons."""
+        est_response = client.post(
+            "/api/v1/arima/estimate",
+            json=sample_timeseries
+        )
+        model_id = est_response.json()["model_id"]
+        
+        response = client.post(
+            "/api/v1/arima/forecast",
+            json={"model_id": model_id, "horizon": 100, "confidence_level": 0.95},
+            headers={"Accept": "application/x-ndjson"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["model_id"] == model_id
+        assert len(lines) == 101
+        assert "forecast" in lines[1]
+    
     def test_identify(self, client, sample_timeseries):
         """Test automatic model identification."""
         request = {
@@ -154,6 +213,23 @@ class TestArimaAPI:
         assert result["candidates_evaluated"] > 0
         assert result["identification_time"] > 0
     
+    def test_identify_cached(self, client, sample_timeseries):
+        """Test repeated identification is served from the cache."""
+        request = {
+            "timeseries": sample_timeseries["timeseries"],
+            "seasonal": False,
+            "max_p": 2,
+            "max_q": 2,
+            "max_d": 1
+        }
+        
+        first = client.post("/api/v1/arima/identify", json=request)
+        second = client.post("/api/v1/arima/identify", json=request)
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert any(key.startswith("arima_id:") for key in mock_redis.data)
+    
     def test_get_model(self, client, sample_timeseries):
         """Test retrieving saved model."""
         # First estimate
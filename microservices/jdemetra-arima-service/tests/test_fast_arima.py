@@ -0,0 +1,79 @@
+"""Tests for the compiled ARMA fitter."""
+
+import pytest
+import numpy as np
+from scipy.signal import lfilter
+from src.core import fast_arima
+from src.core.fast_arima import is_stationary, css_residuals, css_loss, fit_arma, search_arma
+
+
+class TestFastArima:
+    """Test compiled ARMA fitting functions."""
+    
+    @pytest.fixture
+    def ar1_series(self):
+        """Generate a demeaned AR(1) series."""
+        rng = np.random.default_rng(0)
+        # AR(1) process, filtered in one C call
+        n = 200
+        ar_coef = 0.7
+        data = lfilter([1.0], [1.0, -ar_coef], rng.standard_normal(n))
+        return data - data.mean()
+    
+    def test_is_stationary(self):
+        """Test stationarity check on AR polynomials."""
+        assert is_stationary(np.array([0.5]))
+        assert is_stationary(np.array([1.0, -0.5]))
+        assert not is_stationary(np.array([1.2]))
+        assert not is_stationary(np.array([0.5, 0.6]))
+        assert is_stationary(np.zeros(0))
+    
+    def test_css_residuals(self):
+        """Test residual recursion matches the ARMA definition."""
+        y = np.array([1.0, 2.0, 0.5, -1.0])
+        resid = css_residuals(y, np.array([0.5]), np.array([0.2]), 1, 1)
+        assert resid[0] == 0.0
+        assert resid[1] == pytest.approx(2.0 - 0.5 * 1.0)
+        assert resid[2] == pytest.approx(0.5 - 0.5 * 2.0 - 0.2 * resid[1])
+    
+    def test_css_loss_penalty(self):
+        """Test infeasible and overflowing candidates get the finite penalty."""
+        y = np.ones(10)
+        assert css_loss(np.array([1.5]), y, 1, 0, 1) == 1e300
+        assert css_loss(np.array([0.2, -1.5]), y, 1, 1, 1) == 1e300
+        # Feasible parameters whose sum of squares overflows
+        assert css_loss(np.array([0.5]), np.full(10, 1e200), 1, 0, 1) == 1e300
+    
+    def test_fit_arma_explosive_start(self, ar1_series, monkeypatch):
+        """Test an explosive, non-invertible start is shrunk until feasible."""
+        monkeypatch.setattr(fast_arima, "hannan_rissanen", lambda y, p, q: np.array([1.5, -1.5]))
+        fit = fit_arma(ar1_series, 1, 1)
+        assert np.isfinite(fit["sigma2"]) and fit["sigma2"] < 1e300
+        assert is_stationary(fit["params"][:1])
+        assert fit["params"][0] == pytest.approx(0.7, abs=0.15)
+    
+    def test_fit_arma(self, ar1_series):
+        """Test AR(1) coefficient recovery."""
+        fit = fit_arma(ar1_series, 1, 0)
+        assert fit["params"][0] == pytest.approx(0.7, abs=0.1)
+        assert fit["sigma2"] == pytest.approx(1.0, abs=0.25)
+        assert fit["aic"] < fit["bic"]
+        # Criteria on the likelihood scale statsmodels reports
+        assert fit["aic"] == pytest.approx(-2 * fit["log_likelihood"] + 2 * 2)
+        assert fit["bic"] == pytest.approx(-2 * fit["log_likelihood"] + 2 * np.log(fit["n_obs"]))
+    
+    def test_search_arma(self, ar1_series):
+        """Test grid search selects a low order model."""
+        best, fits = search_arma(ar1_series, 2, 2, "bic")
+        assert len(fits) == 9
+        assert (best["p"], best["q"]) == (1, 0)
+        
+        with pytest.raises(KeyError):
+            search_arma(ar1_series, 1, 1, "hqic")
+    
+    def test_search_arma_parallel(self, ar1_series):
+        """Test parallel grid search matches the serial one."""
+        best, fits = search_arma(ar1_series, 2, 2, "aic")
+        best_parallel, fits_parallel = search_arma(ar1_series, 2, 2, "aic", n_jobs=2)
+        assert (best_parallel["p"], best_parallel["q"]) == (best["p"], best["q"])
+        assert len(fits_parallel) == len(fits)
@@ -1,6 +1,7 @@
 """Common data models."""
 
 from .timeseries import TsData, TsPeriod, TsFrequency
+from .batch import TsBatch
 from .arima import ArimaModel, ArimaOrder
 from .decomposition import ComponentType, DecompositionMode
 
@@ -8,6 +9,7 @@ __all__ = [
     "TsData",
     "TsPeriod", 
     "TsFrequency",
+    "TsBatch",
     "ArimaModel",
     "ArimaOrder",
     "ComponentType",
@@ -1,12 +1,13 @@
 """ARIMA model definitions."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 
 import numpy as np
+import orjson
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArimaOrder:
     """ARIMA model order specification."""
     
@@ -17,6 +18,7 @@ class ArimaOrder:
     seasonal_d: int = 0  # Seasonal differencing
     seasonal_q: int = 0  # Seasonal MA order
     seasonal_period: int = 0  # Seasonal period
+    _str: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate orders."""
@@ -30,6 +32,12 @@ class ArimaOrder:
         # If any seasonal component is specified, period must be > 0
         if (self.seasonal_p > 0 or self.seasonal_d > 0 or self.seasonal_q > 0) and self.seasonal_period == 0:
             raise ValueError("Seasonal period must be specified when using seasonal components")
+        
+        # Frozen, so the label used when logging candidates is built only once
+        label = f"ARIMA({self.p},{self.d},{self.q})"
+        if self.is_seasonal:
+            label += f"x({self.seasonal_p},{self.seasonal_d},{self.seasonal_q})[{self.seasonal_period}]"
+        object.__setattr__(self, "_str", label)
     
     @property
     def is_seasonal(self) -> bool:
@@ -47,14 +55,10 @@ class ArimaOrder:
     
     def __str__(self) -> str:
         """String representation."""
-        base = f"ARIMA({self.p},{self.d},{self.q})"
-        if self.is_seasonal:
-            seasonal = f"({self.seasonal_p},{self.seasonal_d},{self.seasonal_q})[{self.seasonal_period}]"
-            return f"{base}x{seasonal}"
-        return base
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True)
 class ArimaModel:
     """ARIMA model with estimated parameters."""
     
@@ -68,6 +72,7 @@ class ArimaModel:
     log_likelihood: Optional[float] = None
     aic: Optional[float] = None
     bic: Optional[float] = None
+    _n_parameters: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate and convert parameters."""
@@ -90,18 +95,21 @@ class ArimaModel:
             self.seasonal_ma_params = np.asarray(self.seasonal_ma_params)
             if len(self.seasonal_ma_params) != self.order.seasonal_q:
                 raise ValueError(f"Expected {self.order.seasonal_q} seasonal MA parameters")
-    
-    @property
-    def n_parameters(self) -> int:
-        """Get total number of parameters."""
+        
+        # The order is frozen, so the parameter count can be fixed up front
         n = 1  # intercept
         n += self.order.p + self.order.q  # AR and MA
         if self.order.is_seasonal:
             n += self.order.seasonal_p + self.order.seasonal_q
-        return n
+        self._n_parameters = n
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    @property
+    def n_parameters(self) -> int:
+        """Get total number of parameters."""
+        return self._n_parameters
+    
+    def _fields(self) -> Dict[str, Any]:
+        """Field values for serialization, with parameter arrays left as ndarrays."""
         return {
             "order": {
                 "p": self.order.p,
@@ -112,10 +120,10 @@ class ArimaModel:
                 "seasonal_q": self.order.seasonal_q,
                 "seasonal_period": self.order.seasonal_period,
             },
-            "ar_params": self.ar_params.tolist() if self.ar_params is not None else None,
-            "ma_params": self.ma_params.tolist() if self.ma_params is not None else None,
-            "seasonal_ar_params": self.seasonal_ar_params.tolist() if self.seasonal_ar_params is not None else None,
-            "seasonal_ma_params": self.seasonal_ma_params.tolist() if self.seasonal_ma_params is not None else None,
+            "ar_params": self.ar_params,
+            "ma_params": self.ma_params,
+            "seasonal_ar_params": self.seasonal_ar_params,
+            "seasonal_ma_params": self.seasonal_ma_params,
             "intercept": self.intercept,
             "sigma2": self.sigma2,
             "log_likelihood": self.log_likelihood,
@@ -123,16 +131,28 @@ class ArimaModel:
             "bic": self.bic,
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        data = self._fields()
+        for name in ("ar_params", "ma_params", "seasonal_ar_params", "seasonal_ma_params"):
+            if data[name] is not None:
+                data[name] = data[name].tolist()
+        return data
+    
+    def to_json(self) -> bytes:
+        """Encode as JSON; orjson reads the parameter arrays directly from their buffers."""
+        return orjson.dumps(self._fields(), option=orjson.OPT_SERIALIZE_NUMPY)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ArimaModel":
         """Create from dictionary."""
         order = ArimaOrder(**data["order"])
         return cls(
             order=order,
-            ar_params=np.array(data["ar_params"]) if data["ar_params"] is not None else None,
-            ma_params=np.array(data["ma_params"]) if data["ma_params"] is not None else None,
-            seasonal_ar_params=np.array(data["seasonal_ar_params"]) if data["seasonal_ar_params"] is not None else None,
-            seasonal_ma_params=np.array(data["seasonal_ma_params"]) if data["seasonal_ma_params"] is not None else None,
+            ar_params=np.asarray(data["ar_params"], dtype=np.float64) if data["ar_params"] is not None else None,
+            ma_params=np.asarray(data["ma_params"], dtype=np.float64) if data["ma_params"] is not None else None,
+            seasonal_ar_params=np.asarray(data["seasonal_ar_params"], dtype=np.float64) if data["seasonal_ar_params"] is not None else None,
+            seasonal_ma_params=np.asarray(data["seasonal_ma_params"], dtype=np.float64) if data["seasonal_ma_params"] is not None else None,
             intercept=data["intercept"],
             sigma2=data["sigma2"],
             log_likelihood=data.get("log_likelihood"),
@@ -0,0 +1,111 @@
+"""Columnar storage for batches of time series."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .timeseries import TsData, TsFrequency, TsPeriod, _date_index
+
+
+@dataclass
+class TsBatch:
+    """
+    Same-frequency time series held as one 2-D block.
+    
+    Row ``i`` of ``values`` holds series ``i`` left-aligned and padded with
+    NaN after ``lengths[i]`` observations. ``starts`` are zero-based period
+    ordinals, ``year * periods_per_year + period - 1``.
+    """
+    
+    values: np.ndarray
+    lengths: np.ndarray
+    starts: np.ndarray
+    frequency: TsFrequency
+    metadata: Optional[List[Dict[str, Any]]] = None
+    
+    def __post_init__(self):
+        """Validate data after initialization."""
+        self.values = np.asarray(self.values, dtype=np.float64)
+        self.lengths = np.asarray(self.lengths, dtype=np.int64)
+        self.starts = np.asarray(self.starts, dtype=np.int64)
+        if self.values.ndim != 2:
+            raise ValueError("Values must be 2-dimensional")
+        n_series = self.values.shape[0]
+        if self.lengths.shape != (n_series,) or self.starts.shape != (n_series,):
+            raise ValueError("Lengths and starts must have one entry per series")
+        if np.any(self.lengths > self.values.shape[1]):
+            raise ValueError("Lengths exceed the number of value columns")
+        if self.metadata is None:
+            self.metadata = [{} for _ in range(n_series)]
+        elif len(self.metadata) != n_series:
+            raise ValueError("Metadata must have one entry per series")
+    
+    def __len__(self) -> int:
+        """Get number of series in the batch."""
+        return self.values.shape[0]
+    
+    def __getitem__(self, i: int) -> TsData:
+        """Series ``i`` as a TsData viewing its row of the block."""
+        year, period = divmod(int(self.starts[i]), self.frequency.periods_per_year)
+        return TsData(
+            values=self.values[i, :self.lengths[i]],
+            start_period=TsPeriod(year, period + 1, self.frequency),
+            frequency=self.frequency,
+            metadata=self.metadata[i]
+        )
+    
+    def __iter__(self) -> Iterator[TsData]:
+        """Iterate over the series as TsData views."""
+        return (self[i] for i in range(len(self)))
+    
+    @property
+    def names(self) -> List[Optional[str]]:
+        """Series names taken from the metadata."""
+        return [meta.get("name") for meta in self.metadata]
+    
+    def to_series(self) -> List[TsData]:
+        """Convert to a list of TsData views."""
+        return list(self)
+    
+    @classmethod
+    def from_series(cls, series_list: List[TsData]) -> "TsBatch":
+        """Pack same-frequency series into one NaN-padded block."""
+        if not series_list:
+            raise ValueError("Cannot build a batch from no series")
+        frequency = series_list[0].frequency
+        if any(ts.frequency != frequency for ts in series_list):
+            raise ValueError("All series in a batch must share one frequency")
+        
+        periods_per_year = frequency.periods_per_year
+        lengths = np.array([ts.length for ts in series_list], dtype=np.int64)
+        values = np.full((len(series_list), lengths.max()), np.nan)
+        for row, ts in zip(values, series_list):
+            row[:ts.length] = ts.values
+        
+        return cls(
+            values=values,
+            lengths=lengths,
+            starts=[
+                ts.start_period.year * periods_per_year + ts.start_period.period - 1
+                for ts in series_list
+            ],
+            frequency=frequency,
+            metadata=[ts.metadata for ts in series_list]
+        )
+    
+    def observation_mask(self) -> np.ndarray:
+        """Boolean block marking the slots that hold observations."""
+        return np.arange(self.values.shape[1]) < self.lengths[:, None]
+    
+    def span_positions(self) -> np.ndarray:
+        """Period offset of every slot from the earliest start in the batch."""
+        return (self.starts - self.starts.min())[:, None] + np.arange(self.values.shape[1])
+    
+    def span_dates(self) -> pd.DatetimeIndex:
+        """Dates of every period from the earliest start to the latest end."""
+        first = int(self.starts.min())
+        span = int((self.starts + self.lengths).max()) - first
+        year, period = divmod(first, self.frequency.periods_per_year)
+        return _date_index(TsPeriod(year, period + 1, self.frequency), span, self.frequency)
@@ -6,6 +6,7 @@ from enum import Enum
 from typing import List, Optional, Dict, Any
 
 import numpy as np
+import orjson
 import pandas as pd
 
 
@@ -22,18 +23,48 @@ class TsFrequency(str, Enum):
     @property
     def periods_per_year(self) -> int:
         """Get number of periods per year for this frequency."""
-        mapping = {
-            "Y": 1,
-            "Q": 4,
-            "M": 12,
-            "W": 52,
-            "D": 365,
-            "H": 8760,
-        }
-        return mapping[self.value]
+        return _PERIODS_PER_YEAR[self.value]
+    
+    @classmethod
+    def from_code(cls, code: str) -> "TsFrequency":
+        """Look up a frequency by code with a dict hit instead of ``Enum.__call__``."""
+        try:
+            return _FREQ_BY_CODE[code]
+        except KeyError:
+            raise ValueError(f"{code!r} is not a valid {cls.__name__}") from None
 
 
-@dataclass
+# Frequencies keyed by code
+_FREQ_BY_CODE = {freq.value: freq for freq in TsFrequency}
+
+# Periods per year, keyed by frequency code
+_PERIODS_PER_YEAR = {
+    "Y": 1,
+    "Q": 4,
+    "M": 12,
+    "W": 52,
+    "D": 365,
+    "H": 8760,
+}
+
+# pandas offset aliases used for date indexes
+_PANDAS_FREQ = {
+    TsFrequency.YEARLY: "YS",
+    TsFrequency.QUARTERLY: "QS",
+    TsFrequency.MONTHLY: "MS",
+    TsFrequency.WEEKLY: "W",
+    TsFrequency.DAILY: "D",
+    TsFrequency.HOURLY: "H",
+}
+
+# numpy datetime64 units for frequencies whose date index is built by array arithmetic
+_DATETIME64_UNIT = {
+    TsFrequency.YEARLY: "Y",
+    TsFrequency.MONTHLY: "M",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class TsPeriod:
     """Represents a time period."""
     
@@ -65,6 +96,38 @@ class TsPeriod:
             return f"{self.year}:{self.period}"
 
 
+# Frequencies with calendar-aligned period arithmetic
+_END_PERIOD_PPY = {
+    TsFrequency.YEARLY: 1,
+    TsFrequency.QUARTERLY: 4,
+    TsFrequency.MONTHLY: 12,
+}
+
+
+def _date_index(start_period: TsPeriod, length: int, frequency: TsFrequency) -> pd.DatetimeIndex:
+    """Dates of ``length`` consecutive periods from ``start_period``."""
+    if frequency == TsFrequency.QUARTERLY:
+        # Period arithmetic beats date_range's offset stepping; dates equal "QS"
+        return pd.period_range(
+            start=str(start_period),
+            periods=length,
+            freq="Q"
+        ).to_timestamp()
+    
+    start_date = start_period.to_datetime()
+    unit = _DATETIME64_UNIT.get(frequency)
+    if unit is None:
+        return pd.date_range(
+            start=start_date,
+            periods=length,
+            freq=_PANDAS_FREQ[frequency]
+        )
+    
+    # Whole months/years step exactly in datetime64, skipping pandas' offset machinery
+    dates = np.datetime64(start_date, unit) + np.arange(length)
+    return pd.DatetimeIndex(dates.astype("datetime64[ns]"), freq=_PANDAS_FREQ[frequency])
+
+
 @dataclass
 class TsData:
     """Time series data container."""
@@ -90,25 +153,12 @@ class TsData:
     @property
     def end_period(self) -> TsPeriod:
         """Get the end period of the time series."""
-        periods_elapsed = self.length - 1
-        if self.frequency == TsFrequency.YEARLY:
-            return TsPeriod(
-                year=self.start_period.year + periods_elapsed,
-                period=1,
-                frequency=self.frequency
-            )
-        elif self.frequency == TsFrequency.QUARTERLY:
-            total_quarters = (self.start_period.year * 4 + self.start_period.period - 1) + periods_elapsed
-            year = total_quarters // 4
-            quarter = (total_quarters % 4) + 1
-            return TsPeriod(year=year, period=quarter, frequency=self.frequency)
-        elif self.frequency == TsFrequency.MONTHLY:
-            total_months = (self.start_period.year * 12 + self.start_period.period - 1) + periods_elapsed
-            year = total_months // 12
-            month = (total_months % 12) + 1
-            return TsPeriod(year=year, period=month, frequency=self.frequency)
-        else:
+        periods_per_year = _END_PERIOD_PPY.get(self.frequency)
+        if periods_per_year is None:
             raise NotImplementedError(f"End period calculation not implemented for {self.frequency}")
+        total = self.start_period.year * periods_per_year + self.start_period.period - 1 + self.length - 1
+        year, period = divmod(total, periods_per_year)
+        return TsPeriod(year=year, period=period + 1, frequency=self.frequency)
     
     def to_pandas(self) -> pd.Series:
         """Convert to pandas Series."""
@@ -117,20 +167,7 @@ class TsData:
     
     def _generate_date_index(self) -> pd.DatetimeIndex:
         """Generate pandas DatetimeIndex for the time series."""
-        start_date = self.start_period.to_datetime()
-        freq_map = {
-            TsFrequency.YEARLY: "YS",
-            TsFrequency.QUARTERLY: "QS",
-            TsFrequency.MONTHLY: "MS",
-            TsFrequency.WEEKLY: "W",
-            TsFrequency.DAILY: "D",
-            TsFrequency.HOURLY: "H",
-        }
-        return pd.date_range(
-            start=start_date,
-            periods=self.length,
-            freq=freq_map[self.frequency]
-        )
+        return _date_index(self.start_period, self.length, self.frequency)
     
     @classmethod
     def from_pandas(cls, series: pd.Series, frequency: TsFrequency) -> "TsData":
@@ -139,9 +176,12 @@ class TsData:
             raise ValueError("Series must have DatetimeIndex")
         
         start_date = series.index[0]
+        # Calendar frequencies split the year into equal runs of months
+        periods_per_year = _END_PERIOD_PPY.get(frequency)
+        period = (start_date.month - 1) * periods_per_year // 12 + 1 if periods_per_year else 1
         start_period = TsPeriod(
             year=start_date.year,
-            period=start_date.month if frequency == TsFrequency.MONTHLY else 1,
+            period=period,
             frequency=frequency
         )
         
@@ -152,10 +192,10 @@ class TsData:
             metadata={"name": series.name} if series.name else {}
         )
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    def _fields(self) -> Dict[str, Any]:
+        """Field values for serialization, with the values left as an ndarray."""
         return {
-            "values": self.values.tolist(),
+            "values": self.values,
             "start_period": {
                 "year": self.start_period.year,
                 "period": self.start_period.period,
@@ -165,17 +205,30 @@ class TsData:
             "metadata": self.metadata,
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        data = self._fields()
+        data["values"] = self.values.tolist()
+        return data
+    
+    def to_json(self) -> bytes:
+        """Encode as JSON; orjson reads the values directly from the array buffer."""
+        data = self._fields()
+        # orjson only serializes C-contiguous arrays
+        data["values"] = np.ascontiguousarray(self.values)
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TsData":
         """Create from dictionary."""
         start_period = TsPeriod(
             year=data["start_period"]["year"],
             period=data["start_period"]["period"],
-            frequency=TsFrequency(data["start_period"]["frequency"])
+            frequency=TsFrequency.from_code(data["start_period"]["frequency"])
         )
         return cls(
-            values=np.array(data["values"]),
+            values=np.asarray(data["values"], dtype=np.float64),
             start_period=start_period,
-            frequency=TsFrequency(data["frequency"]),
+            frequency=TsFrequency.from_code(data["frequency"]),
             metadata=data.get("metadata", {})
         )
\ No newline at end of file
@@ -1,11 +1,12 @@
 """Pydantic schemas for API validation."""
 
-from .timeseries import TsDataSchema, TsPeriodSchema
+from .timeseries import TsDataSchema, TsPeriodSchema, TsPeriodShortSchema
 from .arima import ArimaOrderSchema, ArimaModelSchema
 
 __all__ = [
     "TsDataSchema",
     "TsPeriodSchema",
+    "TsPeriodShortSchema",
     "ArimaOrderSchema",
     "ArimaModelSchema",
 ]
\ No newline at end of file
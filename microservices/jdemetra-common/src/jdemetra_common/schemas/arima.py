@@ -1,36 +1,36 @@
 """Pydantic schemas for ARIMA models."""
 
 from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ArimaOrderSchema(BaseModel):
     """Schema for ARIMA order specification."""
     
-    p: int = Field(..., ge=0, description="AR order")
-    d: int = Field(..., ge=0, description="Differencing order")
-    q: int = Field(..., ge=0, description="MA order")
-    seasonal_p: int = Field(0, ge=0, description="Seasonal AR order")
-    seasonal_d: int = Field(0, ge=0, description="Seasonal differencing order")
-    seasonal_q: int = Field(0, ge=0, description="Seasonal MA order")
-    seasonal_period: int = Field(0, ge=0, description="Seasonal period")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
-    @validator("seasonal_period")
-    def validate_seasonal_period(cls, v, values):
+    p: int = Field(..., ge=0, strict=True, description="AR order")
+    d: int = Field(..., ge=0, strict=True, description="Differencing order")
+    q: int = Field(..., ge=0, strict=True, description="MA order")
+    seasonal_p: int = Field(0, ge=0, strict=True, description="Seasonal AR order")
+    seasonal_d: int = Field(0, ge=0, strict=True, description="Seasonal differencing order")
+    seasonal_q: int = Field(0, ge=0, strict=True, description="Seasonal MA order")
+    seasonal_period: int = Field(0, ge=0, strict=True, description="Seasonal period")
+    
+    @model_validator(mode="after")
+    def _check_seasonal(self):
         """Validate seasonal period consistency."""
-        has_seasonal = any([
-            values.get("seasonal_p", 0) > 0,
-            values.get("seasonal_d", 0) > 0,
-            values.get("seasonal_q", 0) > 0
-        ])
-        if has_seasonal and v == 0:
+        has_seasonal = self.seasonal_p > 0 or self.seasonal_d > 0 or self.seasonal_q > 0
+        if has_seasonal and self.seasonal_period == 0:
             raise ValueError("Seasonal period must be > 0 when seasonal components are specified")
-        return v
+        return self
 
 
 class ArimaModelSchema(BaseModel):
     """Schema for estimated ARIMA model."""
     
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     order: ArimaOrderSchema = Field(..., description="Model order")
     ar_params: Optional[List[float]] = Field(None, description="AR parameters")
     ma_params: Optional[List[float]] = Field(None, description="MA parameters")
@@ -0,0 +1,70 @@
+"""msgspec schemas for hot-path request decoding.
+
+These mirror the Pydantic schemas field for field; the Pydantic versions stay
+the source of the OpenAPI documentation.
+"""
+
+from typing import Annotated, Any, Dict, List, Optional
+
+import msgspec
+
+from ..models.timeseries import TsFrequency
+
+
+NonNegativeInt = Annotated[int, msgspec.Meta(ge=0)]
+
+
+class TsPeriodSchema(msgspec.Struct, frozen=True):
+    """Schema for time period."""
+    
+    year: int
+    period: Annotated[int, msgspec.Meta(ge=1)]
+    frequency: TsFrequency
+    
+    def __post_init__(self):
+        """Validate period is within valid range for frequency."""
+        max_period = self.frequency.periods_per_year
+        if self.period > max_period:
+            raise ValueError(f"Period {self.period} exceeds maximum {max_period} for frequency {self.frequency}")
+
+
+class TsDataSchema(msgspec.Struct, frozen=True):
+    """Schema for time series data."""
+    
+    values: Annotated[List[float], msgspec.Meta(min_length=1)]
+    start_period: TsPeriodSchema
+    frequency: TsFrequency
+    metadata: Optional[Dict[str, Any]] = {}
+
+
+class ArimaOrderSchema(msgspec.Struct, frozen=True):
+    """Schema for ARIMA order specification."""
+    
+    p: NonNegativeInt
+    d: NonNegativeInt
+    q: NonNegativeInt
+    seasonal_p: NonNegativeInt = 0
+    seasonal_d: NonNegativeInt = 0
+    seasonal_q: NonNegativeInt = 0
+    seasonal_period: NonNegativeInt = 0
+    
+    def __post_init__(self):
+        """Validate seasonal period consistency."""
+        has_seasonal = self.seasonal_p > 0 or self.seasonal_d > 0 or self.seasonal_q > 0
+        if has_seasonal and self.seasonal_period == 0:
+            raise ValueError("Seasonal period must be > 0 when seasonal components are specified")
+
+
+class ArimaModelSchema(msgspec.Struct, frozen=True):
+    """Schema for estimated ARIMA model."""
+    
+    order: ArimaOrderSchema
+    ar_params: Optional[List[float]] = None
+    ma_params: Optional[List[float]] = None
+    seasonal_ar_params: Optional[List[float]] = None
+    seasonal_ma_params: Optional[List[float]] = None
+    intercept: float = 0.0
+    sigma2: Annotated[float, msgspec.Meta(gt=0)] = 1.0
+    log_likelihood: Optional[float] = None
+    aic: Optional[float] = None
+    bic: Optional[float] = None
@@ -1,7 +1,7 @@
 """Pydantic schemas for time series data."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ..models.timeseries import TsFrequency
 
@@ -9,37 +9,38 @@ from ..models.timeseries import TsFrequency
 class TsPeriodSchema(BaseModel):
     """Schema for time period."""
     
-    year: int = Field(..., description="Year")
-    period: int = Field(..., ge=1, description="Period within year")
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    year: int = Field(..., strict=True, description="Year")
+    period: int = Field(..., ge=1, strict=True, description="Period within year")
     frequency: TsFrequency = Field(..., description="Time series frequency")
     
-    @validator("period")
-    def validate_period(cls, v, values):
+    @model_validator(mode="after")
+    def _check_period(self):
         """Validate period is within valid range for frequency."""
-        if "frequency" in values:
-            freq = values["frequency"]
-            max_period = freq.periods_per_year
-            if v > max_period:
-                raise ValueError(f"Period {v} exceeds maximum {max_period} for frequency {freq}")
-        return v
+        max_period = self.frequency.periods_per_year
+        if self.period > max_period:
+            raise ValueError(f"Period {self.period} exceeds maximum {max_period} for frequency {self.frequency}")
+        return self
+
+
+class TsPeriodShortSchema(BaseModel):
+    """Schema for time period whose frequency is given by the enclosing object."""
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    year: int = Field(..., strict=True, description="Year")
+    period: int = Field(..., ge=1, strict=True, description="Period within year")
 
 
 class TsDataSchema(BaseModel):
     """Schema for time series data."""
     
-    values: List[float] = Field(..., description="Time series values")
+    # TsFrequency serializes to its value in JSON mode, so no custom encoder is needed
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    # The non-empty check runs inside pydantic-core rather than a Python validator
+    values: List[float] = Field(..., min_length=1, description="Time series values")
     start_period: TsPeriodSchema = Field(..., description="Starting period")
     frequency: TsFrequency = Field(..., description="Time series frequency")
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Optional metadata")
-    
-    @validator("values")
-    def validate_values(cls, v):
-        """Validate values list is not empty."""
-        if not v:
-            raise ValueError("Values list cannot be empty")
-        return v
-    
-    class Config:
-        json_encoders = {
-            TsFrequency: lambda v: v.value
-        }
\ No newline at end of file
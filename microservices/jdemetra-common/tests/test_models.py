@@ -3,10 +3,11 @@
 import pytest
 import numpy as np
 import pandas as pd
+import orjson
 from datetime import datetime
 
 from jdemetra_common.models import (
-    TsData, TsPeriod, TsFrequency,
+    TsData, TsPeriod, TsFrequency, TsBatch,
     ArimaModel, ArimaOrder,
     ComponentType, DecompositionMode
 )
@@ -23,6 +24,13 @@ class TestTsFrequency:
         assert TsFrequency.WEEKLY.periods_per_year == 52
         assert TsFrequency.DAILY.periods_per_year == 365
         assert TsFrequency.HOURLY.periods_per_year == 8760
+    
+    def test_from_code(self):
+        """Test lookup by frequency code."""
+        assert TsFrequency.from_code("Q") is TsFrequency.QUARTERLY
+        assert TsFrequency.from_code(TsFrequency.MONTHLY) is TsFrequency.MONTHLY
+        with pytest.raises(ValueError):
+            TsFrequency.from_code("X")
 
 
 class TestTsPeriod:
@@ -129,6 +137,14 @@ class TestTsData:
         assert ts.start_period.period == 1
         assert ts.metadata["name"] == "test"
     
+    def test_from_pandas_quarterly(self):
+        """Test quarterly round trip through pandas."""
+        ts = TsData([1.0, 2.0, 3.0], TsPeriod(2023, 3, TsFrequency.QUARTERLY), TsFrequency.QUARTERLY)
+        
+        result = TsData.from_pandas(ts.to_pandas(), TsFrequency.QUARTERLY)
+        assert result.start_period == ts.start_period
+        assert result.end_period == TsPeriod(2024, 1, TsFrequency.QUARTERLY)
+    
     def test_serialization(self):
         """Test dict serialization."""
         values = [1.0, 2.0, 3.0]
@@ -143,6 +159,9 @@ class TestTsData:
         assert data["frequency"] == "Q"
         assert data["metadata"]["source"] == "test"
         
+        # To JSON
+        assert orjson.loads(ts.to_json()) == data
+        
         # From dict
         ts2 = TsData.from_dict(data)
         assert np.array_equal(ts2.values, ts.values)
@@ -229,6 +248,9 @@ class TestArimaModel:
         assert data["ma_params"] == [0.3]
         assert data["aic"] == 100.0
         
+        # To JSON
+        assert orjson.loads(model.to_json()) == data
+        
         # From dict
         model2 = ArimaModel.from_dict(data)
         assert np.array_equal(model2.ar_params, model.ar_params)
@@ -248,4 +270,48 @@ class TestEnums:
         """Test DecompositionMode enum."""
         assert DecompositionMode.ADDITIVE.value == "additive"
         assert DecompositionMode.MULTIPLICATIVE.value == "multiplicative"
-        assert len(DecompositionMode) == 4
\ No newline at end of file
+        assert len(DecompositionMode) == 4
+
+class TestTsBatch:
+    """Test TsBatch class."""
+    
+    def test_round_trip(self):
+        """Test packing series into a batch and viewing them back."""
+        series = [
+            TsData([1.0, 2.0, 3.0], TsPeriod(2020, 11, TsFrequency.MONTHLY), TsFrequency.MONTHLY, {"name": "a"}),
+            TsData([4.0], TsPeriod(2021, 2, TsFrequency.MONTHLY), TsFrequency.MONTHLY, {"name": "b"})
+        ]
+        batch = TsBatch.from_series(series)
+        
+        assert batch.values.shape == (2, 3)
+        assert np.isnan(batch.values[1, 1:]).all()
+        assert batch.names == ["a", "b"]
+        
+        for original, restored in zip(series, batch.to_series()):
+            assert np.array_equal(restored.values, original.values)
+            assert restored.start_period == original.start_period
+            assert restored.metadata == original.metadata
+    
+    def test_span_dates(self):
+        """Test dates spanning every series in the batch."""
+        batch = TsBatch(
+            values=np.zeros((2, 2)),
+            lengths=[2, 1],
+            starts=[2020 * 4 + 3, 2021 * 4 + 1],
+            frequency=TsFrequency.QUARTERLY
+        )
+        dates = batch.span_dates()
+        assert len(dates) == 3
+        assert dates[0] == pd.Timestamp("2020-10-01")
+        assert dates[-1] == pd.Timestamp("2021-04-01")
+    
+    def test_validation(self):
+        """Test batch validation."""
+        with pytest.raises(ValueError):
+            TsBatch(np.zeros((2, 3)), [3, 4], [0, 0], TsFrequency.MONTHLY)
+        
+        with pytest.raises(ValueError, match="one frequency"):
+            TsBatch.from_series([
+                TsData([1.0], TsPeriod(2020, 1, TsFrequency.MONTHLY), TsFrequency.MONTHLY),
+                TsData([1.0], TsPeriod(2020, 1, TsFrequency.QUARTERLY), TsFrequency.QUARTERLY)
+            ])
@@ -64,7 +64,7 @@ class TestTsDataSchema:
         }
         with pytest.raises(ValidationError) as exc_info:
             TsDataSchema(**data)
-        assert "cannot be empty" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["type"] == "too_short"
     
     def test_default_metadata(self):
         """Test default metadata."""
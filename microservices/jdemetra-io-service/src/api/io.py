@@ -1,14 +1,23 @@
 """I/O API endpoints."""
 
+import asyncio
 import io
+import json
+import logging
+import os
 import time
 from datetime import datetime, timedelta
-from uuid import uuid4
+from functools import lru_cache, partial
+from uuid import UUID, uuid4
 from typing import List
+
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from fastapi.responses import StreamingResponse
 
-from ..schemas.requests import ImportRequest, ExportRequest, ConvertRequest, ValidateRequest
+from jdemetra_common.models import TsBatch, TsData, TsPeriod, TsFrequency
+
+from ..schemas.requests import Format, ImportRequest, ExportRequest, ConvertRequest, ValidateRequest
 from ..schemas.responses import (
     ImportResponse, ExportResponse, ConvertResponse, 
     ValidationResult, FormatsResponse, FormatInfo, ImportedSeries
@@ -24,14 +33,77 @@ from ..formatters.excel_formatter import ExcelFormatter
 from ..formatters.xml_formatter import XMLFormatter
 from ..formatters.yaml_formatter import YAMLFormatter
 from ..core.config import settings
-from ..main import get_minio
+from ..main import get_cpu_pool, get_minio
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=256)
+def _cached_instance(cls, options_key: str):
+    """Build a parser/formatter from canonical JSON options, once per distinct key."""
+    return cls(json.loads(options_key))
+
+
+def get_instance(cls, options: dict):
+    """
+    Return a shared parser/formatter configured with ``options``.
+    
+    Parsers and formatters only hold their configuration, so instances are
+    reused across requests. Options arrive as JSON, so their sorted JSON
+    encoding is a hashable key that round-trips to the same dict.
+    """
+    return _cached_instance(cls, json.dumps(options, sort_keys=True))
+
+
+async def run_blocking(pool, fn, *args, **kwargs):
+    """Run blocking parse or format work in the thread pool, or inline without one."""
+    if pool is None:
+        return fn(*args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(pool, partial(fn, *args, **kwargs))
+
+
+def uuid4_batch(n: int) -> List[UUID]:
+    """Random (version 4) UUIDs drawn from a single ``os.urandom`` call."""
+    raw = os.urandom(16 * n)
+    return [UUID(bytes=raw[i:i + 16], version=4) for i in range(0, len(raw), 16)]
+
+
+async def read_object(minio_client, object_name: str) -> bytes:
+    """Fetch an object from MinIO in a worker thread so the event loop keeps serving."""
+    def read():
+        response = minio_client.get_object(settings.MINIO_BUCKET, object_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+    
+    return await asyncio.to_thread(read)
+
+
+async def read_object_counting_lines(minio_client, object_name: str) -> tuple[bytes, int]:
+    """Fetch an object in a worker thread, counting newlines chunk by chunk as it arrives."""
+    def read():
+        response = minio_client.get_object(settings.MINIO_BUCKET, object_name)
+        try:
+            chunks = []
+            newlines = 0
+            for chunk in response.stream(settings.CHUNK_SIZE):
+                newlines += chunk.count(b'\n')
+                chunks.append(chunk)
+            return b"".join(chunks), newlines
+        finally:
+            response.close()
+            response.release_conn()
+    
+    return await asyncio.to_thread(read)
+
+
 # Format registry
 FORMATS = {
-    "csv": {
+    Format.CSV: {
         "name": "Comma-Separated Values",
         "extensions": [".csv"],
         "parser": CSVParser,
@@ -53,7 +125,7 @@ FORMATS = {
             }
         }
     },
-    "json": {
+    Format.JSON: {
         "name": "JavaScript Object Notation",
         "extensions": [".json"],
         "parser": JSONParser,
@@ -64,12 +136,12 @@ FORMATS = {
             },
             "export": {
                 "format_type": "jdemetra or simple",
-                "indent": "Indentation level",
+                "indent": "Indent with two spaces (default: true)",
                 "include_metadata": "Include metadata"
             }
         }
     },
-    "excel": {
+    Format.EXCEL: {
         "name": "Microsoft Excel",
         "extensions": [".xlsx", ".xls"],
         "parser": ExcelParser,
@@ -90,7 +162,7 @@ FORMATS = {
             }
         }
     },
-    "xml": {
+    Format.XML: {
         "name": "Extensible Markup Language",
         "extensions": [".xml"],
         "parser": XMLParser,
@@ -111,7 +183,7 @@ FORMATS = {
             }
         }
     },
-    "yaml": {
+    Format.YAML: {
         "name": "YAML Ain't Markup Language",
         "extensions": [".yaml", ".yml"],
         "parser": YAMLParser,
@@ -131,64 +203,88 @@ FORMATS = {
     }
 }
 
+# Dispatch tables keyed by format
+_PARSERS = {fmt: info["parser"] for fmt, info in FORMATS.items()}
+_FORMATTERS = {fmt: info["formatter"] for fmt, info in FORMATS.items()}
+
+
+def warm_up():
+    """
+    Round-trip a tiny series through every format with default options.
+    
+    Pays the lazy imports behind the formats (openpyxl, YAML, XML, pandas
+    readers) and fills the instance cache before the first real request.
+    """
+    series = [TsData(np.arange(4.0), TsPeriod(2020, 1, TsFrequency.MONTHLY), TsFrequency.MONTHLY)]
+    for fmt in Format:
+        try:
+            content = get_instance(_FORMATTERS[fmt], {}).format(series)
+            get_instance(_PARSERS[fmt], {}).parse(content)
+        except Exception:
+            logger.debug("Warm-up of format %s failed", fmt.value, exc_info=True)
+
 
 @router.post("/io/upload")
 async def upload_file(file: UploadFile = File(...), minio_client=Depends(get_minio)):
     """Upload a file for processing."""
-    # Validate file size
-    content = await file.read()
-    if len(content) > settings.MAX_FILE_SIZE:
+    # Validate file size; the upload is already spooled, so measure it without reading it
+    size = file.size
+    if size is None:
+        size = file.file.seek(0, os.SEEK_END)
+    if size > settings.MAX_FILE_SIZE:
         raise HTTPException(status_code=413, detail="File too large")
     
     # Validate extension
-    file_ext = "." + file.filename.split(".")[-1].lower()
+    file_ext = os.path.splitext(file.filename)[1].lower()
     if file_ext not in settings.ALLOWED_EXTENSIONS:
         raise HTTPException(status_code=400, detail=f"Unsupported file extension: {file_ext}")
     
-    # Upload to MinIO
+    # Stream the spooled file to MinIO one part at a time
     file_id = f"{uuid4()}_{file.filename}"
-    minio_client.put_object(
+    file.file.seek(0)
+    await asyncio.to_thread(
+        minio_client.put_object,
         settings.MINIO_BUCKET,
         file_id,
-        io.BytesIO(content),
-        len(content)
+        file.file,
+        size,
+        part_size=settings.UPLOAD_PART_SIZE
     )
     
-    return {"file_id": file_id, "size": len(content)}
+    return {"file_id": file_id, "size": size}
 
 
 @router.post("/io/import/{format}", response_model=ImportResponse)
-async def import_data(format: str, request: ImportRequest, minio_client=Depends(get_minio)):
+async def import_data(format: Format, request: ImportRequest, minio_client=Depends(get_minio)):
     """Import data from uploaded file."""
-    if format not in FORMATS:
-        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
-    
     start_time = time.time()
     
     try:
         # Download file from MinIO
-        response = minio_client.get_object(settings.MINIO_BUCKET, request.file_id)
-        content = response.read().decode('utf-8')
-        response.close()
-        response.release_conn()
+        content = await read_object(minio_client, request.file_id)
         
-        # Parse content
-        parser_class = FORMATS[format]["parser"]
-        parser = parser_class(request.options)
-        series_list = parser.parse(content)
+        # Parse the stored bytes; parsers decode only what they need
+        parser = get_instance(_PARSERS[format], request.options)
+        if hasattr(parser, "parse_batch"):
+            # Columnar parsers skip building a TsData per series
+            metadata_list = parser.parse_batch(content).metadata
+        else:
+            metadata_list = [ts.metadata for ts in parser.parse(content)]
         
-        # Create response
-        imported_series = []
-        for ts in series_list:
-            series_id = uuid4()
-            imported_series.append(ImportedSeries(
+        # Create response; one urandom read covers the import and every series ID
+        import_id, *series_ids = uuid4_batch(len(metadata_list) + 1)
+        # Values are built here, so skip re-validating each entry
+        imported_series = [
+            ImportedSeries.model_construct(
                 series_id=series_id,
-                name=ts.metadata.get("name"),
-                metadata=ts.metadata
-            ))
+                name=metadata.get("name"),
+                metadata=metadata
+            )
+            for series_id, metadata in zip(series_ids, metadata_list)
+        ]
         
         return ImportResponse(
-            import_id=uuid4(),
+            import_id=import_id,
             status="completed",
             imported_series=imported_series,
             total_series=len(imported_series),
@@ -200,41 +296,44 @@ async def import_data(format: str, request: ImportRequest, minio_client=Depends(
         raise HTTPException(status_code=400, detail=f"Import failed: {str(e)}")
 
 
+# Generator for the demo export data
+_DEMO_RNG = np.random.default_rng()
+
+
 @router.post("/io/export/{format}", response_model=ExportResponse)
-async def export_data(format: str, request: ExportRequest, minio_client=Depends(get_minio)):
+async def export_data(format: Format, request: ExportRequest, minio_client=Depends(get_minio)):
     """Export data to specified format."""
-    if format not in FORMATS:
-        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
-    
     try:
-        # For demo, create mock time series
-        from jdemetra_common.models import TsData, TsPeriod, TsFrequency
-        import numpy as np
-        
-        series_list = []
-        for i, series_id in enumerate(request.series_ids):
-            ts = TsData(
-                values=np.random.normal(100, 10, 50),
-                start_period=TsPeriod(2020, 1, TsFrequency.MONTHLY),
-                frequency=TsFrequency.MONTHLY,
-                metadata={"name": f"series_{i}", "id": str(series_id)}
-            )
-            series_list.append(ts)
+        # For demo, create mock time series, all drawn in a single call
+        n_series = len(request.series_ids)
+        batch = TsBatch(
+            values=_DEMO_RNG.normal(100, 10, (n_series, 50)),
+            lengths=np.full(n_series, 50),
+            starts=np.full(n_series, 2020 * 12),
+            frequency=TsFrequency.MONTHLY,
+            metadata=[
+                {"name": f"series_{i}", "id": str(series_id)}
+                for i, series_id in enumerate(request.series_ids)
+            ]
+        )
         
-        # Format data
-        formatter_class = FORMATS[format]["formatter"]
-        formatter = formatter_class(request.options)
-        formatted_content = formatter.format(series_list)
+        # Format data, column-wise when the formatter supports it
+        formatter = get_instance(_FORMATTERS[format], request.options)
+        if hasattr(formatter, "format_batch"):
+            data = formatter.format_batch(batch)
+        else:
+            data = formatter.format(batch.to_series())
         
         # Upload to MinIO
-        filename = request.filename or f"export_{uuid4()}.{format}"
+        filename = request.filename or f"export_{uuid4()}.{format.value}"
         file_id = f"exports/{filename}"
         
-        minio_client.put_object(
+        await asyncio.to_thread(
+            minio_client.put_object,
             settings.MINIO_BUCKET,
             file_id,
-            io.BytesIO(formatted_content.encode()),
-            len(formatted_content)
+            io.BytesIO(data),
+            len(data)
         )
         
         # Generate download URL
@@ -244,8 +343,8 @@ async def export_data(format: str, request: ExportRequest, minio_client=Depends(
             export_id=uuid4(),
             file_id=file_id,
             download_url=download_url,
-            format=format,
-            file_size=len(formatted_content),
+            format=format.value,
+            file_size=len(data),
             expires_at=datetime.utcnow() + timedelta(hours=24)
         )
         
@@ -254,39 +353,31 @@ async def export_data(format: str, request: ExportRequest, minio_client=Depends(
 
 
 @router.post("/io/convert", response_model=ConvertResponse)
-async def convert_format(request: ConvertRequest, minio_client=Depends(get_minio)):
+async def convert_format(request: ConvertRequest, minio_client=Depends(get_minio),
+                         pool=Depends(get_cpu_pool)):
     """Convert between formats."""
-    if request.source_format not in FORMATS:
-        raise HTTPException(status_code=400, detail=f"Unsupported source format: {request.source_format}")
-    if request.target_format not in FORMATS:
-        raise HTTPException(status_code=400, detail=f"Unsupported target format: {request.target_format}")
-    
     start_time = time.time()
     
     try:
         # Download source file
-        response = minio_client.get_object(settings.MINIO_BUCKET, request.source_file_id)
-        content = response.read().decode('utf-8')
-        response.close()
-        response.release_conn()
+        content = await read_object(minio_client, request.source_file_id)
         
         # Parse with source format
-        parser_class = FORMATS[request.source_format]["parser"]
-        parser = parser_class(request.options.get("parse_options", {}))
-        series_list = parser.parse(content)
+        parser = get_instance(_PARSERS[request.source_format], request.options.get("parse_options", {}))
+        series_list = await run_blocking(pool, parser.parse, content)
         
         # Format with target format
-        formatter_class = FORMATS[request.target_format]["formatter"]
-        formatter = formatter_class(request.options.get("format_options", {}))
-        formatted_content = formatter.format(series_list)
+        formatter = get_instance(_FORMATTERS[request.target_format], request.options.get("format_options", {}))
+        data = await run_blocking(pool, formatter.format, series_list)
         
         # Upload converted file
-        target_file_id = f"converted/{uuid4()}.{request.target_format}"
-        minio_client.put_object(
+        target_file_id = f"converted/{uuid4()}.{request.target_format.value}"
+        await asyncio.to_thread(
+            minio_client.put_object,
             settings.MINIO_BUCKET,
             target_file_id,
-            io.BytesIO(formatted_content.encode()),
-            len(formatted_content)
+            io.BytesIO(data),
+            len(data)
         )
         
         download_url = f"/api/v1/io/download/{target_file_id}"
@@ -303,43 +394,42 @@ async def convert_format(request: ConvertRequest, minio_client=Depends(get_minio
         raise HTTPException(status_code=400, detail=f"Conversion failed: {str(e)}")
 
 
+# The registry is static, so the listing is built once
+_FORMATS_RESPONSE = FormatsResponse(formats=[
+    FormatInfo(
+        format=fmt_id.value,
+        name=fmt_info["name"],
+        extensions=fmt_info["extensions"],
+        supports_import="parser" in fmt_info,
+        supports_export="formatter" in fmt_info,
+        options=fmt_info["options"]
+    )
+    for fmt_id, fmt_info in FORMATS.items()
+])
+
+
 @router.get("/io/formats", response_model=FormatsResponse)
 async def list_formats():
     """List supported formats."""
-    format_list = []
-    
-    for fmt_id, fmt_info in FORMATS.items():
-        format_list.append(FormatInfo(
-            format=fmt_id,
-            name=fmt_info["name"],
-            extensions=fmt_info["extensions"],
-            supports_import="parser" in fmt_info,
-            supports_export="formatter" in fmt_info,
-            options=fmt_info["options"]
-        ))
-    
-    return FormatsResponse(formats=format_list)
+    return _FORMATS_RESPONSE
 
 
 @router.post("/io/validate", response_model=ValidationResult)
 async def validate_file(request: ValidateRequest, minio_client=Depends(get_minio)):
     """Validate file format."""
     try:
-        # Download file
-        response = minio_client.get_object(settings.MINIO_BUCKET, request.file_id)
-        content = response.read().decode('utf-8')
+        # Download file; lines are counted while the chunks are still cache-hot
+        content, newlines = await read_object_counting_lines(minio_client, request.file_id)
         file_size = len(content)
-        response.close()
-        response.release_conn()
         
         # Validate with appropriate parser
-        if request.format in FORMATS and "parser" in FORMATS[request.format]:
-            parser_class = FORMATS[request.format]["parser"]
-            parser = parser_class({})
+        parser_class = _PARSERS.get(request.format)
+        if parser_class is not None:
+            parser = get_instance(parser_class, {})
             valid, errors = parser.validate(content)
             
             # Try to detect actual format
-            format_detected = request.format if valid else None
+            format_detected = request.format.value if valid else None
             
             return ValidationResult(
                 valid=valid,
@@ -348,11 +438,11 @@ async def validate_file(request: ValidateRequest, minio_client=Depends(get_minio
                 warnings=[],
                 file_info={
                     "size": file_size,
-                    "lines": content.count('\n') + 1
+                    "lines": newlines + 1
                 }
             )
         else:
-            raise HTTPException(status_code=400, detail=f"Format {request.format} does not support validation")
+            raise HTTPException(status_code=400, detail=f"Format {request.format.value} does not support validation")
             
     except Exception as e:
         return ValidationResult(
@@ -364,32 +454,37 @@ async def validate_file(request: ValidateRequest, minio_client=Depends(get_minio
         )
 
 
+# Content types served by download, keyed by file extension
+_MEDIA_TYPES = {
+    ".csv": "text/csv",
+    ".json": "application/json",
+    ".xml": "application/xml",
+    ".yaml": "application/x-yaml",
+    ".yml": "application/x-yaml",
+}
+
+
 @router.get("/io/download/{file_id:path}")
 async def download_file(file_id: str, minio_client=Depends(get_minio)):
     """Download exported file."""
     try:
-        # Get file from MinIO
-        response = minio_client.get_object(settings.MINIO_BUCKET, file_id)
-        content = response.read()
-        response.close()
-        response.release_conn()
+        # Get file from MinIO; the body is streamed below rather than read into memory
+        response = await asyncio.to_thread(minio_client.get_object, settings.MINIO_BUCKET, file_id)
         
-        # Determine content type
-        if file_id.endswith('.csv'):
-            media_type = "text/csv"
-        elif file_id.endswith('.json'):
-            media_type = "application/json"
-        elif file_id.endswith('.xml'):
-            media_type = "application/xml"
-        elif file_id.endswith('.yaml') or file_id.endswith('.yml'):
-            media_type = "application/x-yaml"
-        else:
-            media_type = "application/octet-stream"
+        media_type = _MEDIA_TYPES.get(os.path.splitext(file_id)[1].lower(), "application/octet-stream")
         
         filename = file_id.split('/')[-1]
         
+        def chunks():
+            try:
+                yield from response.stream(settings.CHUNK_SIZE)
+            finally:
+                response.close()
+                response.release_conn()
+        
+        # Starlette iterates the sync generator in its thread pool
         return StreamingResponse(
-            io.BytesIO(content),
+            chunks(),
             media_type=media_type,
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
@@ -1,6 +1,6 @@
 """Configuration settings."""
 
-from typing import List
+from typing import FrozenSet, List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -13,18 +13,24 @@ class Settings(BaseSettings):
     MINIO_SECRET_KEY: str = "minioadmin"
     MINIO_BUCKET: str = "jdemetra-data"
     MINIO_SECURE: bool = False
+    MINIO_POOL_MAXSIZE: int = 64  # Pooled connections kept per host
+    MINIO_CONNECT_TIMEOUT: float = 2.0
+    MINIO_READ_TIMEOUT: float = 30.0
     
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8000"]
     
     # File settings
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
-    ALLOWED_EXTENSIONS: List[str] = [".csv", ".xlsx", ".xls", ".json", ".xml", ".yaml", ".yml"]
+    ALLOWED_EXTENSIONS: FrozenSet[str] = frozenset({".csv", ".xlsx", ".xls", ".json", ".xml", ".yaml", ".yml"})
     TEMP_DIR: str = "/tmp/jdemetra-io"
     
     # Processing settings
     CHUNK_SIZE: int = 8192
+    UPLOAD_PART_SIZE: int = 10 * 1024 * 1024  # Multipart chunk streamed to MinIO
     MAX_SERIES_PER_FILE: int = 1000
+    CPU_POOL_WORKERS: Optional[int] = None  # Defaults to the CPU count
+    WARMUP_ON_STARTUP: bool = True
     
     class Config:
         env_file = ".env"
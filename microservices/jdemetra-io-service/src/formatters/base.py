@@ -0,0 +1,73 @@
+"""Base formatter class."""
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from jdemetra_common.models import TsData
+
+
+# pandas frequencies stepping from a period's first day; weeks step from the start date itself
+_DATE_FREQ = {
+    'YEARLY': 'YS',
+    'QUARTERLY': 'QS',
+    'MONTHLY': 'MS',
+    'WEEKLY': '7D',
+    'DAILY': 'D',
+    'HOURLY': 'h'
+}
+
+
+def _period_start(frequency: str, year: int, period: int) -> pd.Timestamp:
+    """First day of a period given by frequency name, year and period number."""
+    if frequency == 'MONTHLY':
+        return pd.Timestamp(year=year, month=period, day=1)
+    elif frequency == 'QUARTERLY':
+        month = (period - 1) * 3 + 1
+        return pd.Timestamp(year=year, month=month, day=1)
+    elif frequency == 'WEEKLY':
+        # Approximate - week number to date
+        return pd.Timestamp(year=year, month=1, day=1) + pd.Timedelta(weeks=period-1)
+    elif frequency == 'DAILY':
+        # Day of year
+        return pd.Timestamp(year=year, month=1, day=1) + pd.Timedelta(days=period-1)
+    else:
+        return pd.Timestamp(year=year, month=1, day=1)
+
+
+@lru_cache(maxsize=256)
+def _date_range_cached(frequency: str, year: int, period: int, length: int) -> pd.DatetimeIndex:
+    """
+    Observation dates keyed on everything they depend on.
+    
+    DatetimeIndex is immutable, so one instance is safely shared by every
+    formatter and request that asks for the same span.
+    """
+    return pd.date_range(
+        start=_period_start(frequency, year, period),
+        periods=length,
+        freq=_DATE_FREQ.get(frequency, 'MS')
+    )
+
+
+class BaseFormatter(ABC):
+    """Base class for all formatters."""
+    
+    def __init__(self, options: Optional[Dict[str, Any]] = None):
+        self.options = options or {}
+    
+    @abstractmethod
+    def format(self, series: List[TsData]) -> bytes:
+        """Format time series to file content, encoded as it will be stored."""
+        pass
+    
+    def _generate_dates(self, ts: TsData) -> pd.DatetimeIndex:
+        """Generate the observation dates of a time series."""
+        return _date_range_cached(
+            ts.frequency.name,
+            ts.start_period.year,
+            ts.start_period.period,
+            len(ts.values)
+        )
@@ -1,10 +1,13 @@
 """CSV formatter implementation."""
 
+import os
+
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
-from io import StringIO
+from typing import List, Dict, Any, Optional, Sequence
+from io import BytesIO
 
-from jdemetra_common.models import TsData
+from jdemetra_common.models import TsBatch, TsData
 
 
 class CSVFormatter:
@@ -16,14 +19,61 @@ class CSVFormatter:
         self.date_format = options.get("date_format", "%Y-%m")
         self.layout = options.get("layout", "wide")  # wide or long
     
-    def format(self, series_list: List[TsData]) -> str:
-        """Format time series to CSV."""
+    def format(self, series_list: List[TsData]) -> bytes:
+        """Format time series to UTF-8 encoded CSV."""
+        if series_list and len({ts.frequency for ts in series_list}) == 1:
+            return self.format_batch(TsBatch.from_series(series_list))
+        
+        # Mixed frequencies are aligned on dates through pandas
         if self.layout == "wide":
             return self._format_wide(series_list)
         else:
             return self._format_long(series_list)
     
-    def _format_wide(self, series_list: List[TsData]) -> str:
+    def format_batch(self, batch: TsBatch) -> bytes:
+        """Format a columnar batch to CSV by scattering its block onto one date grid."""
+        dates = batch.span_dates().strftime(self.date_format)
+        
+        if self.layout == "wide":
+            names = [meta.get("name", f"series_{i}") for i, meta in enumerate(batch.metadata)]
+            if (batch.starts == batch.starts[0]).all() and (batch.lengths == batch.lengths[0]).all():
+                # Aligned series already form the table, one column per row of the block
+                table = batch.values[:, :batch.lengths[0]].T
+            else:
+                observed = batch.observation_mask()
+                positions = batch.span_positions()[observed]
+                grid = np.full((len(dates), len(batch)), np.nan)
+                grid[positions, np.nonzero(observed)[0]] = batch.values[observed]
+                # As with an outer join of the series, keep only dates some series covers
+                covered = np.zeros(len(dates), dtype=bool)
+                covered[positions] = True
+                table, dates = grid[covered], dates[covered]
+            content = self._write_numeric_wide(dates, names, table)
+            if content is not None:
+                return content
+            df = pd.DataFrame(table, index=dates, columns=names)
+        else:
+            observed = batch.observation_mask()
+            positions = batch.span_positions()[observed]
+            names = np.array([meta.get("name", "unnamed") for meta in batch.metadata], dtype=object)
+            df = pd.DataFrame({
+                "date": dates[positions],
+                "series": np.repeat(names, batch.lengths),
+                "value": batch.values[observed]
+            })
+        
+        # Convert to CSV
+        output = BytesIO()
+        df.to_csv(
+            output,
+            sep=self.delimiter,
+            encoding="utf-8",
+            header=self.include_header,
+            index=self.layout == "wide"
+        )
+        return output.getvalue()
+    
+    def _format_wide(self, series_list: List[TsData]) -> bytes:
         """Format as wide CSV (one column per series)."""
         # Convert all series to pandas
         dfs = []
@@ -39,44 +89,70 @@ class CSVFormatter:
             # Format dates
             df.index = df.index.strftime(self.date_format)
             
+            content = self._write_numeric_wide(df.index.to_numpy(), list(df.columns), df.to_numpy(np.float64))
+            if content is not None:
+                return content
+            
             # Convert to CSV
-            output = StringIO()
+            output = BytesIO()
             df.to_csv(
                 output,
                 sep=self.delimiter,
+                encoding="utf-8",
                 header=self.include_header,
                 index=True
             )
             return output.getvalue()
         
-        return ""
+        return b""
     
-    def _format_long(self, series_list: List[TsData]) -> str:
-        """Format as long CSV (stacked format)."""
-        rows = []
+    def _write_numeric_wide(self, dates: np.ndarray, names: Sequence[Any],
+                            block: np.ndarray) -> Optional[bytes]:
+        """
+        Write a wide float table directly, bypassing DataFrame.to_csv.
         
-        for ts in series_list:
-            name = ts.metadata.get("name", "unnamed")
-            dates = ts._generate_date_index()
-            
-            for i, (date, value) in enumerate(zip(dates, ts.values)):
-                rows.append({
-                    "date": date.strftime(self.date_format),
-                    "series": name,
-                    "value": value
-                })
+        Cells use the shortest round-trip repr and NaN becomes an empty
+        field, exactly as pandas writes them.
+        
+        Returns:
+            CSV bytes, or None when a date or name would need quoting
+        """
+        labels = [*dates, *names] if self.include_header else list(dates)
+        special = (self.delimiter, '"', "\n", "\r")
+        if any(not isinstance(label, str) or any(c in label for c in special) for label in labels):
+            return None
+        
+        cells = block.astype(str)
+        cells[np.isnan(block)] = ""
+        lines = [self.delimiter.join(row) for row in np.column_stack((dates, cells)).tolist()]
+        if self.include_header:
+            lines.insert(0, self.delimiter.join(["", *names]))
+        lines.append("")
+        return os.linesep.join(lines).encode("utf-8")
+    
+    def _format_long(self, series_list: List[TsData]) -> bytes:
+        """Format as long CSV (stacked format)."""
+        present = [ts for ts in series_list if ts.length]
         
-        if rows:
-            df = pd.DataFrame(rows)
+        if present:
+            # Stack every series' dates so the format string is applied in one call
+            indexes = [ts._generate_date_index() for ts in present]
+            names = np.array([ts.metadata.get("name", "unnamed") for ts in present], dtype=object)
+            df = pd.DataFrame({
+                "date": indexes[0].append(indexes[1:]).strftime(self.date_format),
+                "series": np.repeat(names, [ts.length for ts in present]),
+                "value": np.concatenate([ts.values for ts in present])
+            })
             
             # Convert to CSV
-            output = StringIO()
+            output = BytesIO()
             df.to_csv(
                 output,
                 sep=self.delimiter,
+                encoding="utf-8",
                 header=self.include_header,
                 index=False
             )
             return output.getvalue()
         
-        return ""
\ No newline at end of file
+        return b""
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Excel formatter implementation."""
 
+import numpy as np
 import pandas as pd
-import base64
+import xlsxwriter
 from typing import List, Dict, Any
 from io import BytesIO
 
@@ -12,22 +13,26 @@ from .base import BaseFormatter
 class ExcelFormatter(BaseFormatter):
     """Formatter for Excel files."""
     
-    def format(self, series: List[TsData]) -> str:
+    def format(self, series: List[TsData]) -> bytes:
         """Format time series as Excel.
         
-        Returns base64 encoded Excel file content.
+        Returns the xlsx workbook content.
         """
         # Determine layout
         layout = self.options.get('layout', 'wide')
         
         if layout == 'wide':
             df = self._format_wide(series)
+            # A plain single-sheet table can skip to_excel and its per-cell objects
+            if (not df.empty and self.options.get('header', True)
+                    and not self.options.get('include_metadata', False)):
+                return self._write_wide_fast(df)
         else:
             df = self._format_long(series)
         
-        # Write to Excel
+        # Write to Excel; xlsxwriter streams sheet XML instead of building an openpyxl cell model
         output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
             sheet_name = self.options.get('sheet_name', 'TimeSeries')
             df.to_excel(
                 writer,
@@ -40,9 +45,7 @@ class ExcelFormatter(BaseFormatter):
                 metadata_df = self._create_metadata_df(series)
                 metadata_df.to_excel(writer, sheet_name='Metadata', index=False)
         
-        # Return base64 encoded content
-        excel_bytes = output.getvalue()
-        return base64.b64encode(excel_bytes).decode('utf-8')
+        return output.getvalue()
     
     def _format_wide(self, series: List[TsData]) -> pd.DataFrame:
         """Format as wide table (one column per series)."""
@@ -53,8 +56,9 @@ class ExcelFormatter(BaseFormatter):
         first_series = series[0]
         dates = self._generate_dates(first_series)
         
-        # Create dataframe
-        data = {'Date': dates}
+        # Create dataframe, with the dates formatted straight from the index
+        date_format = self.options.get('date_format', '%Y-%m-%d')
+        data = {'Date': dates.strftime(date_format)}
         
         for ts in series:
             name = ts.metadata.get('name', f'series_{len(data)}')
@@ -62,47 +66,62 @@ class ExcelFormatter(BaseFormatter):
             if len(ts.values) == len(dates):
                 data[name] = ts.values
             else:
-                # Pad or truncate
-                values = list(ts.values)
+                # Pad with NaN or truncate, keeping a float64 column
+                values = np.asarray(ts.values, dtype=np.float64)
                 if len(values) < len(dates):
-                    values.extend([None] * (len(dates) - len(values)))
+                    values = np.pad(values, (0, len(dates) - len(values)), constant_values=np.nan)
                 else:
                     values = values[:len(dates)]
                 data[name] = values
         
-        df = pd.DataFrame(data)
+        return pd.DataFrame(data)
+    
+    def _write_wide_fast(self, df: pd.DataFrame) -> bytes:
+        """
+        Write a wide table row by row with xlsxwriter, bypassing to_excel.
         
-        # Format dates
-        date_format = self.options.get('date_format', '%Y-%m-%d')
-        df['Date'] = pd.to_datetime(df['Date']).dt.strftime(date_format)
+        In constant_memory mode each row is flushed to the sheet XML once it
+        is written. The header style, empty missing cells and "inf"/"-inf"
+        strings for infinite values match to_excel.
+        """
+        output = BytesIO()
+        workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+        worksheet = workbook.add_worksheet(self.options.get('sheet_name', 'TimeSeries'))
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        worksheet.write_row(0, 0, list(df.columns), header_format)
+        
+        block = df.iloc[:, 1:].to_numpy(dtype=np.float64)
+        # write_number rejects NaN and inf, so rows holding either go cell by cell
+        irregular = ~np.isfinite(block)
+        for row, (date, values, flags) in enumerate(zip(df['Date'].tolist(), block.tolist(), irregular), start=1):
+            worksheet.write_string(row, 0, date)
+            if flags.any():
+                for col, value in enumerate(values, start=1):
+                    if value in (np.inf, -np.inf):
+                        worksheet.write_string(row, col, 'inf' if value > 0 else '-inf')
+                    elif value == value:
+                        worksheet.write_number(row, col, value)
+            else:
+                worksheet.write_row(row, 1, values)
         
-        return df
+        workbook.close()
+        return output.getvalue()
     
     def _format_long(self, series: List[TsData]) -> pd.DataFrame:
         """Format as long table (stacked format)."""
-        if not series:
+        present = [ts for ts in series if len(ts.values)]
+        if not present:
             return pd.DataFrame()
         
-        rows = []
-        
-        for ts in series:
-            name = ts.metadata.get('name', 'unnamed')
-            dates = self._generate_dates(ts)
-            
-            for i, (date, value) in enumerate(zip(dates, ts.values)):
-                rows.append({
-                    'Series': name,
-                    'Date': date,
-                    'Value': value
-                })
-        
-        df = pd.DataFrame(rows)
-        
-        # Format dates
+        # Stack every series' dates so the format string is applied in one call
+        indexes = [self._generate_dates(ts) for ts in present]
+        names = np.array([ts.metadata.get('name', 'unnamed') for ts in present], dtype=object)
         date_format = self.options.get('date_format', '%Y-%m-%d')
-        df['Date'] = pd.to_datetime(df['Date']).dt.strftime(date_format)
-        
-        return df
+        return pd.DataFrame({
+            'Series': np.repeat(names, [len(ts.values) for ts in present]),
+            'Date': indexes[0].append(indexes[1:]).strftime(date_format),
+            'Value': np.concatenate([ts.values for ts in present])
+        })
     
     def _create_metadata_df(self, series: List[TsData]) -> pd.DataFrame:
         """Create metadata dataframe."""
@@ -125,42 +144,3 @@ class ExcelFormatter(BaseFormatter):
             rows.append(row)
         
         return pd.DataFrame(rows)
-    
-    def _generate_dates(self, ts: TsData) -> List[pd.Timestamp]:
-        """Generate date series for time series."""
-        start_date = self._ts_period_to_date(ts.start_period)
-        
-        # Map frequency
-        freq_map = {
-            'DAILY': 'D',
-            'WEEKLY': 'W',
-            'MONTHLY': 'M',
-            'QUARTERLY': 'Q',
-            'YEARLY': 'Y'
-        }
-        
-        pd_freq = freq_map.get(ts.frequency.name, 'M')
-        
-        return pd.date_range(
-            start=start_date,
-            periods=len(ts.values),
-            freq=pd_freq
-        )
-    
-    def _ts_period_to_date(self, period) -> pd.Timestamp:
-        """Convert TsPeriod to pandas Timestamp."""
-        if period.frequency.name == 'MONTHLY':
-            return pd.Timestamp(year=period.year, month=period.period, day=1)
-        elif period.frequency.name == 'QUARTERLY':
-            month = (period.period - 1) * 3 + 1
-            return pd.Timestamp(year=period.year, month=month, day=1)
-        elif period.frequency.name == 'YEARLY':
-            return pd.Timestamp(year=period.year, month=1, day=1)
-        elif period.frequency.name == 'WEEKLY':
-            # Approximate - week number to date
-            return pd.Timestamp(year=period.year, month=1, day=1) + pd.Timedelta(weeks=period.period-1)
-        elif period.frequency.name == 'DAILY':
-            # Day of year
-            return pd.Timestamp(year=period.year, month=1, day=1) + pd.Timedelta(days=period.period-1)
-        else:
-            return pd.Timestamp(year=period.year, month=1, day=1)
\ No newline at end of file
@@ -1,9 +1,11 @@
 """JSON formatter implementation."""
 
-import json
 from typing import List, Dict, Any
 
-from jdemetra_common.models import TsData
+import numpy as np
+import orjson
+
+from jdemetra_common.models import TsData, TsFrequency
 
 
 class JSONFormatter:
@@ -11,10 +13,11 @@ class JSONFormatter:
     
     def __init__(self, options: Dict[str, Any]):
         self.format_type = options.get("format_type", "jdemetra")
+        # orjson only indents by two spaces, so any truthy indent enables it
         self.indent = options.get("indent", 2)
         self.include_metadata = options.get("include_metadata", True)
     
-    def format(self, series_list: List[TsData]) -> str:
+    def format(self, series_list: List[TsData]) -> bytes:
         """Format time series to JSON."""
         if self.format_type == "jdemetra":
             return self._format_jdemetra(series_list)
@@ -23,20 +26,20 @@ class JSONFormatter:
         else:
             raise ValueError(f"Unknown JSON format type: {self.format_type}")
     
-    def _format_jdemetra(self, series_list: List[TsData]) -> str:
+    def _format_jdemetra(self, series_list: List[TsData]) -> bytes:
         """Format as JDemetra+ JSON."""
         if len(series_list) == 1:
             # Single series
-            data = series_list[0].to_dict()
+            data = self._series_fields(series_list[0])
         else:
             # Multiple series
             data = {
-                "series": [ts.to_dict() for ts in series_list]
+                "series": [self._series_fields(ts) for ts in series_list]
             }
         
-        return json.dumps(data, indent=self.indent)
+        return self._dumps(data)
     
-    def _format_simple(self, series_list: List[TsData]) -> str:
+    def _format_simple(self, series_list: List[TsData]) -> bytes:
         """Format as simple JSON."""
         data = {}
         
@@ -47,15 +50,15 @@ class JSONFormatter:
             dates = ts._generate_date_index()
             
             if ts.frequency == TsFrequency.MONTHLY:
-                date_strings = [d.strftime("%Y-%m") for d in dates]
+                date_strings = dates.strftime("%Y-%m")
             elif ts.frequency == TsFrequency.QUARTERLY:
-                date_strings = [f"{d.year}Q{(d.month-1)//3+1}" for d in dates]
+                date_strings = dates.year.astype(str) + "Q" + dates.quarter.astype(str)
             else:
-                date_strings = [str(d.year) for d in dates]
+                date_strings = dates.year.astype(str)
             
             series_data = {
-                "dates": date_strings,
-                "values": ts.values.tolist()
+                "dates": date_strings.tolist(),
+                "values": np.ascontiguousarray(ts.values)
             }
             
             if self.include_metadata:
@@ -63,4 +66,18 @@ class JSONFormatter:
             
             data[name] = series_data
         
-        return json.dumps(data, indent=self.indent)
\ No newline at end of file
+        return self._dumps(data)
+    
+    def _series_fields(self, ts: TsData) -> Dict[str, Any]:
+        """TsData.to_dict layout with the values kept as an array for orjson."""
+        data = ts._fields()
+        # orjson only serializes C-contiguous arrays
+        data["values"] = np.ascontiguousarray(ts.values)
+        return data
+    
+    def _dumps(self, data: Any) -> bytes:
+        """Encode with orjson, indenting when requested."""
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if self.indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
@@ -1,7 +1,6 @@
 """XML formatter implementation."""
 
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from lxml import etree as ET
 from typing import List, Dict, Any
 from datetime import datetime
 
@@ -12,8 +11,8 @@ from .base import BaseFormatter
 class XMLFormatter(BaseFormatter):
     """Formatter for XML files."""
     
-    def format(self, series: List[TsData]) -> str:
-        """Format time series as XML."""
+    def format(self, series: List[TsData]) -> bytes:
+        """Format time series as UTF-8 encoded XML."""
         format_type = self.options.get('format_type', 'jdemetra')
         
         if format_type == 'jdemetra':
@@ -21,11 +20,9 @@ class XMLFormatter(BaseFormatter):
         else:
             root = self._format_generic(series)
         
-        # Convert to string
-        if self.options.get('pretty_print', True):
-            return self._prettify(root)
-        else:
-            return ET.tostring(root, encoding='unicode')
+        # One serialization pass; lxml indents while writing, with no reparse
+        pretty = self.options.get('pretty_print', True)
+        return ET.tostring(root, encoding='utf-8', xml_declaration=pretty, pretty_print=pretty)
     
     def _format_jdemetra(self, series: List[TsData]) -> ET.Element:
         """Format as JDemetra+ XML."""
@@ -65,12 +62,9 @@ class XMLFormatter(BaseFormatter):
             obs_container = ET.SubElement(series_elem, 'observations')
             obs_container.set('count', str(len(ts.values)))
             
-            dates = self._generate_dates(ts)
-            for i, (date, value) in enumerate(zip(dates, ts.values)):
-                obs = ET.SubElement(obs_container, 'observation')
-                obs.set('index', str(i))
-                obs.set('date', date.isoformat())
-                obs.set('value', str(value))
+            date_strs = self._generate_dates(ts).strftime('%Y-%m-%dT%H:%M:%S')
+            for index, date, value in zip(self._index_strings(ts), date_strs, self._value_strings(ts)):
+                ET.SubElement(obs_container, 'observation', index=index, date=date, value=value)
         
         return root
     
@@ -101,25 +95,24 @@ class XMLFormatter(BaseFormatter):
             # Add data
             data_elem = ET.SubElement(series_elem, 'data')
             
+            values = self._value_strings(ts)
             if self.options.get('include_dates', True):
-                dates = self._generate_dates(ts)
-                for date, value in zip(dates, ts.values):
-                    obs = ET.SubElement(data_elem, obs_tag)
-                    obs.set('date', date.strftime('%Y-%m-%d'))
-                    obs.set('value', str(value))
+                date_strs = self._generate_dates(ts).strftime('%Y-%m-%d')
+                for date, value in zip(date_strs, values):
+                    ET.SubElement(data_elem, obs_tag, date=date, value=value)
             else:
-                for i, value in enumerate(ts.values):
-                    obs = ET.SubElement(data_elem, obs_tag)
-                    obs.set('index', str(i))
-                    obs.set('value', str(value))
+                for index, value in zip(self._index_strings(ts), values):
+                    ET.SubElement(data_elem, obs_tag, index=index, value=value)
         
         return root
     
-    def _prettify(self, elem: ET.Element) -> str:
-        """Return a pretty-printed XML string."""
-        rough_string = ET.tostring(elem, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent='  ', encoding=None)
+    def _index_strings(self, ts: TsData) -> List[str]:
+        """Format all observation indices up front."""
+        return list(map(str, range(len(ts.values))))
+    
+    def _value_strings(self, ts: TsData) -> List[str]:
+        """Format all observation values up front."""
+        return list(map(str, ts.values.tolist()))
     
     def _frequency_to_code(self, frequency) -> str:
         """Convert TsFrequency to single letter code."""
@@ -131,40 +124,3 @@ class XMLFormatter(BaseFormatter):
             'YEARLY': 'Y'
         }
         return freq_map.get(frequency.name, 'U')
-    
-    def _generate_dates(self, ts: TsData) -> List[datetime]:
-        """Generate dates for time series."""
-        dates = []
-        year = ts.start_period.year
-        period = ts.start_period.period
-        
-        for i in range(len(ts.values)):
-            if ts.frequency.name == 'MONTHLY':
-                date = datetime(year, period, 1)
-                period += 1
-                if period > 12:
-                    period = 1
-                    year += 1
-            elif ts.frequency.name == 'QUARTERLY':
-                month = (period - 1) * 3 + 1
-                date = datetime(year, month, 1)
-                period += 1
-                if period > 4:
-                    period = 1
-                    year += 1
-            elif ts.frequency.name == 'YEARLY':
-                date = datetime(year, 1, 1)
-                year += 1
-            elif ts.frequency.name == 'DAILY':
-                # Day of year
-                date = datetime(year, 1, 1)
-                date = date.replace(year=year, month=1, day=1)
-                from datetime import timedelta
-                date = date + timedelta(days=period-1+i)
-            else:
-                # Default to monthly
-                date = datetime(year, 1, 1)
-            
-            dates.append(date)
-        
-        return dates
\ No newline at end of file
@@ -8,11 +8,15 @@ from jdemetra_common.models import TsData
 from .base import BaseFormatter
 
 
+# libyaml's C emitter when PyYAML was built against it
+_Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
 class YAMLFormatter(BaseFormatter):
     """Formatter for YAML files."""
     
-    def format(self, series: List[TsData]) -> str:
-        """Format time series as YAML."""
+    def format(self, series: List[TsData]) -> bytes:
+        """Format time series as UTF-8 encoded YAML."""
         format_type = self.options.get('format_type', 'structured')
         
         if format_type == 'simple':
@@ -20,13 +24,15 @@ class YAMLFormatter(BaseFormatter):
         else:
             data = self._format_structured(series)
         
-        # Convert to YAML
+        # Convert to YAML; scalar-only collections such as value lists go in flow style
         return yaml.dump(
             data,
-            default_flow_style=False,
+            Dumper=_Dumper,
+            default_flow_style=None,
             sort_keys=False,
             indent=self.options.get('indent', 2),
-            allow_unicode=True
+            allow_unicode=True,
+            encoding='utf-8'
         )
     
     def _format_simple(self, series: List[TsData]) -> List[Dict[str, Any]]:
@@ -39,7 +45,7 @@ class YAMLFormatter(BaseFormatter):
                 'frequency': ts.frequency.name,
                 'start_year': ts.start_period.year,
                 'start_period': ts.start_period.period,
-                'values': ts.values
+                'values': ts.values.tolist()
             }
             
             # Add metadata if requested
@@ -87,59 +93,18 @@ class YAMLFormatter(BaseFormatter):
             # Add data based on options
             if self.options.get('include_dates', False):
                 # Include dates with values
-                dates = self._generate_dates(ts)
-                observations = []
-                for date, value in zip(dates, ts.values):
-                    observations.append({
-                        'date': date.strftime('%Y-%m-%d'),
-                        'value': float(value)
-                    })
+                date_strs = self._generate_dates(ts).strftime('%Y-%m-%d')
+                observations = [
+                    {'date': date, 'value': value}
+                    for date, value in zip(date_strs, ts.values.tolist())
+                ]
                 series_data['observations'] = observations
             else:
                 # Just values array
-                series_data['values'] = [float(v) for v in ts.values]
+                series_data['values'] = ts.values.tolist()
             
             series_list.append(series_data)
         
         document['series'] = series_list
         
         return document
-    
-    def _generate_dates(self, ts: TsData) -> List[datetime]:
-        """Generate dates for time series."""
-        dates = []
-        year = ts.start_period.year
-        period = ts.start_period.period
-        
-        for i in range(len(ts.values)):
-            if ts.frequency.name == 'MONTHLY':
-                date = datetime(year, period, 1)
-                period += 1
-                if period > 12:
-                    period = 1
-                    year += 1
-            elif ts.frequency.name == 'QUARTERLY':
-                month = (period - 1) * 3 + 1
-                date = datetime(year, month, 1)
-                period += 1
-                if period > 4:
-                    period = 1
-                    year += 1
-            elif ts.frequency.name == 'YEARLY':
-                date = datetime(year, 1, 1)
-                year += 1
-            elif ts.frequency.name == 'DAILY':
-                # Day of year - simplified
-                from datetime import timedelta
-                date = datetime(year, 1, 1) + timedelta(days=period-1+i)
-            elif ts.frequency.name == 'WEEKLY':
-                # Week of year - simplified
-                from datetime import timedelta
-                date = datetime(year, 1, 1) + timedelta(weeks=period-1+i)
-            else:
-                # Default to start of year
-                date = datetime(year, 1, 1)
-            
-            dates.append(date)
-        
-        return dates
\ No newline at end of file
@@ -1,44 +1,55 @@
 """Main entry point for Data I/O Service."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import urllib3
 from minio import Minio
 
 from .api import io
 from .core.config import settings
+from .core.responses import ORJSONResponse
 
 
-# Global MinIO client
-minio_client = None
+# Worker threads for parsing and formatting
+cpu_pool = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global minio_client
+    global cpu_pool
     # Startup
-    minio_client = Minio(
-        settings.MINIO_ENDPOINT,
-        access_key=settings.MINIO_ACCESS_KEY,
-        secret_key=settings.MINIO_SECRET_KEY,
-        secure=settings.MINIO_SECURE
-    )
+    minio_client = get_minio()
     
     # Create bucket if it doesn't exist
     if not minio_client.bucket_exists(settings.MINIO_BUCKET):
         minio_client.make_bucket(settings.MINIO_BUCKET)
     
+    cpu_pool = ThreadPoolExecutor(
+        max_workers=settings.CPU_POOL_WORKERS or os.cpu_count(),
+        thread_name_prefix="io-cpu"
+    )
+    
+    if settings.WARMUP_ON_STARTUP:
+        await asyncio.to_thread(io.warm_up)
+    
     yield
     # Shutdown
-    pass
+    if cpu_pool:
+        cpu_pool.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(
     title="Data I/O Service",
     description="Data import/export service for JDemetra+",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -60,8 +71,25 @@ async def health_check():
     return {"status": "healthy", "service": "io-service"}
 
 
-def get_minio():
-    """Get MinIO client."""
-    if not minio_client:
-        raise RuntimeError("MinIO not initialized")
-    return minio_client
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_minio() -> Minio:
+    """Get the shared MinIO client, whose connection pool is reused across requests."""
+    http_client = urllib3.PoolManager(
+        num_pools=10,
+        maxsize=settings.MINIO_POOL_MAXSIZE,
+        block=False,
+        timeout=urllib3.Timeout(connect=settings.MINIO_CONNECT_TIMEOUT, read=settings.MINIO_READ_TIMEOUT),
+        retries=urllib3.Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
+    )
+    return Minio(
+        settings.MINIO_ENDPOINT,
+        access_key=settings.MINIO_ACCESS_KEY,
+        secret_key=settings.MINIO_SECRET_KEY,
+        secure=settings.MINIO_SECURE,
+        http_client=http_client
+    )
+
+
+def get_cpu_pool():
+    """Get thread pool for parsing and formatting (None when running without lifespan)."""
+    return cpu_pool
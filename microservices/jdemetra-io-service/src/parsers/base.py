@@ -0,0 +1,23 @@
+"""Base parser class."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+from jdemetra_common.models import TsData
+
+
+class BaseParser(ABC):
+    """Base class for all parsers."""
+    
+    def __init__(self, options: Optional[Dict[str, Any]] = None):
+        self.options = options or {}
+    
+    @abstractmethod
+    def parse(self, content: Union[bytes, str]) -> List[TsData]:
+        """Parse file content, as stored bytes or decoded text, to time series."""
+        pass
+    
+    @abstractmethod
+    def validate(self, content: Union[bytes, str]) -> tuple[bool, List[str]]:
+        """Validate file content."""
+        pass
@@ -2,10 +2,20 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional
-from io import StringIO
+from typing import List, Dict, Any, Optional, Union
+from io import BytesIO, StringIO
 
-from jdemetra_common.models import TsData, TsPeriod, TsFrequency
+from jdemetra_common.models import TsBatch, TsData, TsFrequency
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional accelerator; pandas reads everything without it
+    pacsv = None
+
+
+# Payload size from which pyarrow's multithreaded reader beats its own setup cost
+ARROW_MIN_BYTES = 1024 * 1024
 
 
 class CSVParser:
@@ -19,23 +29,33 @@ class CSVParser:
         self.frequency = options.get("frequency", "M")
         self.date_format = options.get("date_format", None)
     
-    def parse(self, content: str) -> List[TsData]:
+    @staticmethod
+    def _buffer(content: Union[bytes, str]):
+        """Wrap content for pandas; bytes are decoded by the C reader, not in Python."""
+        return BytesIO(content) if isinstance(content, (bytes, bytearray, memoryview)) else StringIO(content)
+    
+    def parse(self, content: Union[bytes, str]) -> List[TsData]:
         """Parse CSV content to time series."""
-        # Read CSV
-        df = pd.read_csv(
-            StringIO(content),
-            delimiter=self.delimiter,
-            header=0 if self.has_header else None
-        )
-        
-        # Parse dates
-        if isinstance(self.date_column, int):
-            date_col = df.columns[self.date_column]
+        return self.parse_batch(content).to_series()
+    
+    def parse_batch(self, content: Union[bytes, str]) -> TsBatch:
+        """Parse CSV content to one columnar batch, skipping all-missing columns."""
+        # Read CSV, parsing the date column into the index in the same pass
+        if pacsv is not None and len(content) >= ARROW_MIN_BYTES:
+            df = self._read_arrow(content)
         else:
-            date_col = self.date_column
-        
-        df[date_col] = pd.to_datetime(df[date_col], format=self.date_format)
-        df = df.set_index(date_col)
+            df = pd.read_csv(
+                self._buffer(content),
+                delimiter=self.delimiter,
+                header=0 if self.has_header else None,
+                index_col=self.date_column,
+                parse_dates=True,
+                date_format=self.date_format,
+                engine="c"
+            )
+        if not isinstance(df.index, pd.DatetimeIndex):
+            # read_csv leaves unparseable dates as text; convert again to raise the parse error
+            df.index = pd.to_datetime(df.index, format=self.date_format)
         df = df.sort_index()
         
         # Determine value columns
@@ -48,45 +68,57 @@ class CSVParser:
             else:
                 value_cols = self.value_columns
         
-        # Convert to time series
-        series_list = []
-        for col in value_cols:
-            values = df[col].dropna().values
-            
-            if len(values) == 0:
-                continue
-            
-            # Create TsPeriod for start
-            start_date = df[col].dropna().index[0]
-            freq = TsFrequency(self.frequency)
-            
-            if freq == TsFrequency.MONTHLY:
-                start_period = TsPeriod(start_date.year, start_date.month, freq)
-            elif freq == TsFrequency.QUARTERLY:
-                start_period = TsPeriod(start_date.year, (start_date.month - 1) // 3 + 1, freq)
-            elif freq == TsFrequency.YEARLY:
-                start_period = TsPeriod(start_date.year, 1, freq)
-            else:
-                start_period = TsPeriod(start_date.year, 1, freq)
-            
-            ts = TsData(
-                values=values,
-                start_period=start_period,
-                frequency=freq,
-                metadata={"name": col, "source": "csv"}
-            )
-            
-            series_list.append(ts)
+        # Observations of every column in one block; missing values are dropped
+        # per column by moving them to the end (the sort is stable)
+        block = df[value_cols].to_numpy(dtype=np.float64)
+        present = ~np.isnan(block)
+        lengths = present.sum(axis=0)
+        keep = np.flatnonzero(lengths > 0)
+        order = np.argsort(~present, axis=0, kind="stable")
+        values = np.take_along_axis(block, order, axis=0)[:, keep].T
         
-        return series_list
+        # Start period of each column from the date of its first observation
+        freq = TsFrequency.from_code(self.frequency)
+        periods_per_year = freq.periods_per_year
+        start_dates = df.index[present.argmax(axis=0)[keep]]
+        if freq in (TsFrequency.MONTHLY, TsFrequency.QUARTERLY, TsFrequency.YEARLY):
+            periods = (start_dates.month.to_numpy() - 1) * periods_per_year // 12
+        else:
+            periods = np.zeros(len(keep), dtype=np.int64)
+        
+        return TsBatch(
+            values=values,
+            lengths=lengths[keep],
+            starts=start_dates.year.to_numpy() * periods_per_year + periods,
+            frequency=freq,
+            metadata=[{"name": value_cols[i], "source": "csv"} for i in keep]
+        )
+    
+    def _read_arrow(self, content: Union[bytes, str]) -> pd.DataFrame:
+        """Read with pyarrow's multithreaded reader into the same frame read_csv gives."""
+        if isinstance(content, str):
+            content = content.encode()
+        table = pacsv.read_csv(
+            pa.BufferReader(content),
+            read_options=pacsv.ReadOptions(use_threads=True, autogenerate_column_names=not self.has_header),
+            parse_options=pacsv.ParseOptions(delimiter=self.delimiter),
+            convert_options=pacsv.ConvertOptions(
+                timestamp_parsers=[self.date_format] if self.date_format else None
+            )
+        )
+        df = table.to_pandas(self_destruct=True, date_as_object=False)
+        if not self.has_header:
+            df.columns = range(df.shape[1])
+        date_col = df.columns[self.date_column] if isinstance(self.date_column, int) else self.date_column
+        return df.set_index(date_col)
     
-    def validate(self, content: str) -> tuple[bool, List[str]]:
+    def validate(self, content: Union[bytes, str]) -> tuple[bool, List[str]]:
         """Validate CSV content."""
         errors = []
         
         try:
             df = pd.read_csv(
-                StringIO(content),
+                self._buffer(content),
                 delimiter=self.delimiter,
                 header=0 if self.has_header else None
             )
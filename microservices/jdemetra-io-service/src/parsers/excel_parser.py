@@ -1,35 +1,59 @@
 """Excel parser implementation."""
 
+import binascii
+import re
+import zipfile
+from itertools import islice
+import numpy as np
+import openpyxl
 import pandas as pd
-from typing import List, Dict, Any
+import pybase64
+from typing import List, Dict, Any, Optional, Tuple, Union
 from io import BytesIO
 
 from jdemetra_common.models import TsData, TsPeriod, TsFrequency
 from .base import BaseParser
+from .frequency import resolve_frequency
+
+
+# Leading bytes of xlsx (zip) and legacy xls (OLE2) workbooks
+_WORKBOOK_MAGIC = (b"PK\x03\x04", b"\xd0\xcf\x11\xe0")
+
+# Used range of a worksheet, e.g. <dimension ref="A1:C25"/>; a single cell has no second half
+_DIMENSION_RE = re.compile(rb'<dimension ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"')
+
+# Relationship id of the first <sheet> in xl/workbook.xml, e.g. r:id="rId1"
+_FIRST_SHEET_RE = re.compile(rb'<(?:\w+:)?sheet\s[^>]*?\w+:id="([^"]+)"')
+
+# Relationship entries of xl/_rels/workbook.xml.rels and their attributes
+_RELATIONSHIP_RE = re.compile(rb'<(?:\w+:)?Relationship\s([^>]*)>')
+_ATTRIBUTE_RE = re.compile(rb'(\w+)="([^"]*)"')
+
+
+def _column_number(letters: bytes) -> int:
+    """One-based index of a spreadsheet column given by its letters (A=1, AA=27)."""
+    number = 0
+    for letter in letters:
+        number = number * 26 + letter - ord('A') + 1
+    return number
 
 
 class ExcelParser(BaseParser):
     """Parser for Excel files."""
     
-    def parse(self, content: str) -> List[TsData]:
+    def parse(self, content: Union[bytes, str]) -> List[TsData]:
         """Parse Excel content.
         
-        Note: For Excel, content should be base64 encoded bytes.
+        Note: For Excel, content is the raw workbook bytes or their base64 encoding.
         """
-        import base64
+        excel_bytes = self._workbook_bytes(content)
         
-        # Decode base64 content
-        try:
-            excel_bytes = base64.b64decode(content)
-        except:
-            # If not base64, assume it's already bytes
-            excel_bytes = content.encode('latin-1')
-        
-        # Read Excel file
+        # Read Excel file; calamine parses the sheet XML in Rust rather than cell by cell in Python
         df = pd.read_excel(
             BytesIO(excel_bytes),
             sheet_name=self.options.get('sheet', 0),
-            header=0 if self.options.get('header', True) else None
+            header=0 if self.options.get('header', True) else None,
+            engine='calamine'
         )
         
         # Extract date column
@@ -39,13 +63,16 @@ class ExcelParser(BaseParser):
         else:
             dates = df[date_col]
         
-        # Parse dates
-        dates = pd.to_datetime(dates)
+        # Parse dates, unless the reader already returned datetimes
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, format=self.options.get('date_format'), cache=True)
         
         # Determine frequency
         freq_str = self.options.get('frequency')
         if freq_str:
-            frequency = TsFrequency[freq_str]
+            frequency = resolve_frequency(freq_str)
+            if frequency is None:
+                raise ValueError(f"Unknown frequency: {freq_str}")
         else:
             # Auto-detect frequency
             freq = pd.infer_freq(dates)
@@ -58,28 +85,34 @@ class ExcelParser(BaseParser):
             value_cols = [i for i in range(len(df.columns)) 
                          if i != date_col and pd.api.types.is_numeric_dtype(df.iloc[:, i])]
         
+        if not value_cols:
+            return []
+        
+        # Every column shares the date column, hence the start period
+        start_date = dates.iloc[0]
+        start_period = TsPeriod(
+            year=start_date.year,
+            period=self._get_period_number(start_date, frequency),
+            frequency=frequency
+        )
+        
         # Create time series
         series_list = []
         
         for col in value_cols:
             if isinstance(col, int):
-                values = df.iloc[:, col].values
+                column = df.iloc[:, col]
                 col_name = df.columns[col] if self.options.get('header', True) else f'column_{col}'
             else:
-                values = df[col].values
+                column = df[col]
                 col_name = col
             
-            # Create start period
-            start_date = dates.iloc[0]
-            start_period = TsPeriod(
-                year=start_date.year,
-                period=self._get_period_number(start_date, frequency),
-                frequency=frequency
-            )
+            # Float columns come back as views into the frame's 2-D block, with no per-value boxing
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan)
             
             # Create time series
             ts = TsData(
-                values=values.tolist(),
+                values=values,
                 start_period=start_period,
                 frequency=frequency,
                 metadata={'name': str(col_name), 'source': 'excel'}
@@ -88,26 +121,25 @@ class ExcelParser(BaseParser):
         
         return series_list
     
-    def validate(self, content: str) -> tuple[bool, List[str]]:
+    def validate(self, content: Union[bytes, str]) -> tuple[bool, List[str]]:
         """Validate Excel content."""
         errors = []
         
         try:
-            import base64
-            
-            # Try to decode base64
-            try:
-                excel_bytes = base64.b64decode(content)
-            except:
-                excel_bytes = content.encode('latin-1')
+            excel_bytes = self._workbook_bytes(content)
             
-            # Try to read Excel
-            df = pd.read_excel(BytesIO(excel_bytes), nrows=5)
+            # The sheet's declared range answers both checks without reading any cells
+            shape = self._sniff_shape(excel_bytes)
+            if shape is None:
+                # Peek at the header and first data rows without building a DataFrame
+                rows = self._peek_rows(excel_bytes, 6)
+                shape = (len(rows), max(map(len, rows), default=0))
+            n_rows, n_cols = shape
             
-            if df.empty:
+            if n_rows < 2:
                 errors.append("Excel file is empty")
             
-            if len(df.columns) < 2:
+            if n_cols < 2:
                 errors.append("Excel file must have at least 2 columns (date and values)")
             
         except Exception as e:
@@ -115,28 +147,118 @@ class ExcelParser(BaseParser):
         
         return len(errors) == 0, errors
     
+    def _sniff_shape(self, excel_bytes: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Rows and columns of the first sheet from its <dimension> element.
+        
+        Only the first kilobyte of the sheet XML is decompressed. Returns
+        None for anything but an xlsx whose first sheet can be located and
+        declares its range there, so the caller can fall back to reading rows.
+        """
+        if bytes(excel_bytes[:4]) != _WORKBOOK_MAGIC[0]:
+            return None
+        
+        try:
+            with zipfile.ZipFile(BytesIO(excel_bytes)) as archive:
+                sheet_path = self._first_sheet_path(archive)
+                if sheet_path is None:
+                    return None
+                with archive.open(sheet_path) as sheet:
+                    head = sheet.read(1024)
+        except (zipfile.BadZipFile, KeyError):
+            return None
+        
+        match = _DIMENSION_RE.search(head)
+        if match is None:
+            return None
+        first_col, first_row, last_col, last_row = match.groups()
+        if last_col is None:
+            last_col, last_row = first_col, first_row
+        return (
+            int(last_row) - int(first_row) + 1,
+            _column_number(last_col) - _column_number(first_col) + 1
+        )
+    
+    def _first_sheet_path(self, archive: zipfile.ZipFile) -> Optional[str]:
+        """
+        Archive path of the workbook's first sheet, in workbook order.
+        
+        The sheet is resolved through xl/workbook.xml and its relationships
+        rather than assumed to be sheet1.xml. Returns None when the order
+        cannot be confirmed.
+        """
+        names = set(archive.namelist())
+        if 'xl/workbook.xml' not in names or 'xl/_rels/workbook.xml.rels' not in names:
+            return None
+        
+        match = _FIRST_SHEET_RE.search(archive.read('xl/workbook.xml'))
+        if match is None:
+            return None
+        
+        for relationship in _RELATIONSHIP_RE.finditer(archive.read('xl/_rels/workbook.xml.rels')):
+            attributes = dict(_ATTRIBUTE_RE.findall(relationship.group(1)))
+            if attributes.get(b'Id') != match.group(1):
+                continue
+            target = attributes.get(b'Target', b'').decode()
+            # Targets are relative to xl/ unless absolute within the package
+            path = target[1:] if target.startswith('/') else f'xl/{target}'
+            return path if path in names else None
+        return None
+    
+    def _peek_rows(self, excel_bytes: bytes, n: int) -> List[tuple]:
+        """
+        Read the first ``n`` rows of the first sheet, skipping empty ones.
+        
+        xlsx workbooks are opened read-only so only the rows asked for are
+        decompressed; legacy xls files go through pandas. Trailing empty
+        cells are dropped from each row.
+        """
+        if bytes(excel_bytes[:4]) != _WORKBOOK_MAGIC[0]:
+            df = pd.read_excel(BytesIO(excel_bytes), header=None, nrows=n, engine='calamine')
+            return [tuple(row) for row in df.itertuples(index=False)]
+        
+        workbook = openpyxl.load_workbook(BytesIO(excel_bytes), read_only=True, data_only=True)
+        try:
+            rows = []
+            for row in islice(workbook.worksheets[0].iter_rows(values_only=True), n):
+                row = list(row)
+                while row and row[-1] is None:
+                    row.pop()
+                if row:
+                    rows.append(tuple(row))
+            return rows
+        finally:
+            workbook.close()
+    
+    def _workbook_bytes(self, content: Union[bytes, str]) -> bytes:
+        """Get workbook bytes, passing raw xlsx/xls files through and decoding base64 otherwise."""
+        if isinstance(content, (bytes, bytearray, memoryview)) and bytes(content[:4]) in _WORKBOOK_MAGIC:
+            return content
+        
+        # Decode base64 content; strict validation keeps pybase64 on its SIMD path
+        try:
+            return pybase64.b64decode(content, validate=True)
+        except binascii.Error:
+            pass
+        
+        # Line-wrapped base64 needs the lenient decoder, which skips non-alphabet bytes
+        try:
+            return pybase64.b64decode(content)
+        except ValueError:
+            # If not base64, assume it's already bytes
+            return content.encode('latin-1') if isinstance(content, str) else content
+    
     def _map_pandas_freq(self, freq: str) -> TsFrequency:
         """Map pandas frequency to TsFrequency."""
         if not freq:
-            return TsFrequency.UNDEFINED
-        
-        freq_map = {
-            'D': TsFrequency.DAILY,
-            'B': TsFrequency.DAILY,
-            'W': TsFrequency.WEEKLY,
-            'M': TsFrequency.MONTHLY,
-            'MS': TsFrequency.MONTHLY,
-            'Q': TsFrequency.QUARTERLY,
-            'QS': TsFrequency.QUARTERLY,
-            'A': TsFrequency.YEARLY,
-            'AS': TsFrequency.YEARLY,
-            'Y': TsFrequency.YEARLY,
-            'YS': TsFrequency.YEARLY
-        }
+            raise ValueError("Could not infer the frequency of the date column; set the 'frequency' option")
         
         # Get base frequency
         base_freq = freq.split('-')[0] if '-' in freq else freq
-        return freq_map.get(base_freq, TsFrequency.UNDEFINED)
+        frequency = resolve_frequency(base_freq)
+        if frequency is None:
+            raise ValueError(f"Unsupported date frequency: {freq}")
+        return frequency
     
     def _get_period_number(self, date: pd.Timestamp, frequency: TsFrequency) -> int:
         """Get period number for a date based on frequency."""
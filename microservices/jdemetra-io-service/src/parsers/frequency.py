@@ -0,0 +1,40 @@
+"""Frequency name resolution shared by the parsers."""
+
+from typing import Any, Optional
+
+from jdemetra_common.models import TsFrequency
+
+
+# Every spelling the parsers accept: enum names, codes, lowercase names
+# and base pandas offset aliases (as returned by infer_freq, anchor removed)
+_FREQUENCIES = {
+    **{freq.name: freq for freq in TsFrequency},
+    **{freq.value: freq for freq in TsFrequency},
+    **{freq.name.lower(): freq for freq in TsFrequency},
+    'annual': TsFrequency.YEARLY,
+    'A': TsFrequency.YEARLY,
+    'AS': TsFrequency.YEARLY,
+    'YS': TsFrequency.YEARLY,
+    'YE': TsFrequency.YEARLY,
+    'QS': TsFrequency.QUARTERLY,
+    'QE': TsFrequency.QUARTERLY,
+    'MS': TsFrequency.MONTHLY,
+    'ME': TsFrequency.MONTHLY,
+    'B': TsFrequency.DAILY,
+    'h': TsFrequency.HOURLY
+}
+
+
+def resolve_frequency(name: Any) -> Optional[TsFrequency]:
+    """
+    Look up a frequency by name, code or pandas alias.
+    
+    Returns:
+        The matching frequency, or None when the name is not recognised
+    """
+    if not isinstance(name, str):
+        return None
+    frequency = _FREQUENCIES.get(name)
+    if frequency is None:
+        frequency = _FREQUENCIES.get(name.lower())
+    return frequency
@@ -1,21 +1,60 @@
 """JSON parser implementation."""
 
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
+import msgspec
 import numpy as np
+import orjson
 
 from jdemetra_common.models import TsData, TsPeriod, TsFrequency
 
 
+class _TopLevelFields(msgspec.Struct):
+    """Top-level fields checked by validation, kept as undecoded JSON (empty when absent)."""
+    
+    series: msgspec.Raw = msgspec.Raw()
+    values: msgspec.Raw = msgspec.Raw()
+    start_period: msgspec.Raw = msgspec.Raw()
+    frequency: msgspec.Raw = msgspec.Raw()
+
+
+# Checks the whole document's syntax but only materializes the fields above
+_TOP_LEVEL_DECODER = msgspec.json.Decoder(_TopLevelFields)
+
+
+def _lenient_top_level(content: Union[bytes, str], error: msgspec.DecodeError) -> _TopLevelFields:
+    """
+    Top-level fields of a document the strict decoder rejected.
+    
+    The stdlib decoder accepts the NaN/Infinity literals the original
+    formatter wrote for missing values; anything it rejects as well
+    re-raises the strict decoder's ``error``.
+    """
+    try:
+        data = json.loads(content)
+    except ValueError:
+        raise error from None
+    if not isinstance(data, dict):
+        raise msgspec.ValidationError("Expected `object`")
+    return _TopLevelFields(**{
+        name: msgspec.Raw(json.dumps(data[name]).encode())
+        for name in _TopLevelFields.__struct_fields__ if name in data
+    })
+
+
 class JSONParser:
     """Parse JSON files to time series."""
     
     def __init__(self, options: Dict[str, Any]):
         self.format_type = options.get("format_type", "jdemetra")
     
-    def parse(self, content: str) -> List[TsData]:
-        """Parse JSON content to time series."""
-        data = json.loads(content)
+    def parse(self, content: Union[bytes, str]) -> List[TsData]:
+        """Parse JSON content to time series (orjson reads UTF-8 bytes directly)."""
+        try:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals, as the original formatter wrote for gaps, are not strict JSON
+            data = json.loads(content)
         
         if self.format_type == "jdemetra":
             return self._parse_jdemetra_format(data)
@@ -81,7 +120,8 @@ class JSONParser:
                 start_period = TsPeriod(2020, 1, freq)
             
             ts = TsData(
-                values=np.array(values),
+                # Converted straight to float64, so integer lists are not copied twice
+                values=np.array(values, dtype=np.float64),
                 start_period=start_period,
                 frequency=freq,
                 metadata={"name": name, "source": "json"}
@@ -91,31 +131,35 @@ class JSONParser:
         
         return series_list
     
-    def validate(self, content: str) -> tuple[bool, List[str]]:
+    def validate(self, content: Union[bytes, str]) -> tuple[bool, List[str]]:
         """Validate JSON content."""
         errors = []
         
         try:
-            data = json.loads(content)
-            
-            if not isinstance(data, dict):
-                errors.append("JSON must be an object")
+            try:
+                fields = _TOP_LEVEL_DECODER.decode(content)
+            except msgspec.ValidationError:
+                raise
+            except msgspec.DecodeError as e:
+                fields = _lenient_top_level(content, e)
             
             if self.format_type == "jdemetra":
                 # Validate JDemetra format
-                if "series" in data:
-                    if not isinstance(data["series"], list):
+                if fields.series:
+                    if memoryview(fields.series)[:1] != b"[":
                         errors.append("'series' must be an array")
                 else:
                     # Single series - check required fields
-                    if "values" not in data:
+                    if not fields.values:
                         errors.append("Missing 'values' field")
-                    if "start_period" not in data:
+                    if not fields.start_period:
                         errors.append("Missing 'start_period' field")
-                    if "frequency" not in data:
+                    if not fields.frequency:
                         errors.append("Missing 'frequency' field")
             
-        except json.JSONDecodeError as e:
+        except msgspec.ValidationError:
+            errors.append("JSON must be an object")
+        except msgspec.DecodeError as e:
             errors.append(f"Invalid JSON: {str(e)}")
         except Exception as e:
             errors.append(f"JSON validation failed: {str(e)}")
@@ -1,24 +1,45 @@
 """XML parser implementation."""
 
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+import numpy as np
+from lxml import etree as ET
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
 from jdemetra_common.models import TsData, TsPeriod, TsFrequency
 from .base import BaseParser
+from .frequency import resolve_frequency
+
+
+def _fromstring(content: Union[bytes, str]) -> ET.Element:
+    """Parse an XML document with lxml, leaving entities unresolved as the stdlib parser did."""
+    if isinstance(content, str):
+        # lxml refuses str input that carries an encoding declaration
+        content = content.encode('utf-8')
+    return ET.fromstring(content, ET.XMLParser(resolve_entities=False, no_network=True))
 
 
 class XMLParser(BaseParser):
     """Parser for XML files."""
     
-    def parse(self, content: str) -> List[TsData]:
+    def __init__(self, options: Optional[Dict[str, Any]] = None):
+        super().__init__(options)
+        # Resolve the generic layout's tag and attribute names once per parser
+        series_tags = self.options.get('series_tag', 'timeseries')
+        if isinstance(series_tags, str):
+            series_tags = [series_tags]
+        self._series_paths = [f'.//{tag}' for tag in series_tags]
+        self._obs_path = f".//{self.options.get('observation_tag', 'observation')}"
+        self._date_attr = self.options.get('date_attribute', 'date')
+        self._value_attr = self.options.get('value_attribute', 'value')
+    
+    def parse(self, content: Union[bytes, str]) -> List[TsData]:
         """Parse XML content.
         
         Supports two formats:
         1. JDemetra+ XML format
         2. Generic time series XML format
         """
-        root = ET.fromstring(content)
+        root = _fromstring(content)
         
         # Check format
         if root.tag == 'jdemetra' or self.options.get('format') == 'jdemetra':
@@ -36,14 +57,7 @@ class XMLParser(BaseParser):
             freq_str = series_elem.get('frequency', 'M')
             
             # Map frequency
-            freq_map = {
-                'D': TsFrequency.DAILY,
-                'W': TsFrequency.WEEKLY,
-                'M': TsFrequency.MONTHLY,
-                'Q': TsFrequency.QUARTERLY,
-                'Y': TsFrequency.YEARLY
-            }
-            frequency = freq_map.get(freq_str, TsFrequency.MONTHLY)
+            frequency = resolve_frequency(freq_str) or TsFrequency.MONTHLY
             
             # Extract start period
             start_elem = series_elem.find('start')
@@ -64,11 +78,11 @@ class XMLParser(BaseParser):
             
             start_period = TsPeriod(year, period, frequency)
             
-            # Extract values
-            values = []
-            for obs_elem in series_elem.findall('.//observation'):
-                value = float(obs_elem.get('value'))
-                values.append(value)
+            # Extract values straight into a float64 array
+            values = np.fromiter(
+                (float(obs_elem.get('value')) for obs_elem in series_elem.iterfind('.//observation')),
+                dtype=np.float64
+            )
             
             # Create time series
             metadata = {
@@ -97,12 +111,8 @@ class XMLParser(BaseParser):
         series_list = []
         
         # Try to find time series elements
-        series_tags = self.options.get('series_tag', 'timeseries')
-        if isinstance(series_tags, str):
-            series_tags = [series_tags]
-        
-        for tag in series_tags:
-            for series_elem in root.findall(f'.//{tag}'):
+        for path in self._series_paths:
+            for series_elem in root.findall(path):
                 ts = self._parse_generic_series(series_elem)
                 if ts:
                     series_list.append(ts)
@@ -122,14 +132,13 @@ class XMLParser(BaseParser):
         
         # Extract frequency
         freq_str = elem.get('frequency') or self.options.get('frequency', 'M')
-        frequency = TsFrequency[freq_str] if hasattr(TsFrequency, freq_str) else TsFrequency.MONTHLY
+        frequency = resolve_frequency(freq_str) or TsFrequency.MONTHLY
         
         # Find observations
-        obs_tag = self.options.get('observation_tag', 'observation')
-        date_attr = self.options.get('date_attribute', 'date')
-        value_attr = self.options.get('value_attribute', 'value')
+        date_attr = self._date_attr
+        value_attr = self._value_attr
         
-        observations = elem.findall(f'.//{obs_tag}')
+        observations = elem.findall(self._obs_path)
         if not observations:
             # Try alternative patterns
             observations = elem.findall('.//obs') or elem.findall('.//data')
@@ -185,12 +194,12 @@ class XMLParser(BaseParser):
         
         return ts
     
-    def validate(self, content: str) -> tuple[bool, List[str]]:
+    def validate(self, content: Union[bytes, str]) -> tuple[bool, List[str]]:
         """Validate XML content."""
         errors = []
         
         try:
-            root = ET.fromstring(content)
+            root = _fromstring(content)
             
             # Check if it's a valid time series XML
             valid_roots = ['jdemetra', 'timeseries', 'series', 'data']
@@ -1,19 +1,28 @@
 """YAML parser implementation."""
 
+import logging
 import yaml
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from datetime import datetime
 
 from jdemetra_common.models import TsData, TsPeriod, TsFrequency
 from .base import BaseParser
+from .frequency import resolve_frequency
+
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader when PyYAML was built against it
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+if _Loader is yaml.SafeLoader:
+    logger.warning("PyYAML was built without libyaml; YAML imports use the pure-Python loader")
 
 
 class YAMLParser(BaseParser):
     """Parser for YAML files."""
     
-    def parse(self, content: str) -> List[TsData]:
+    def parse(self, content: Union[bytes, str]) -> List[TsData]:
         """Parse YAML content."""
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_Loader)
         
         # Handle different YAML structures
         if isinstance(data, list):
@@ -65,19 +74,7 @@ class YAMLParser(BaseParser):
         
         # Extract frequency
         freq_str = data.get('frequency', self.options.get('frequency', 'M'))
-        if hasattr(TsFrequency, freq_str):
-            frequency = TsFrequency[freq_str]
-        else:
-            # Try to map common frequency strings
-            freq_map = {
-                'monthly': TsFrequency.MONTHLY,
-                'quarterly': TsFrequency.QUARTERLY,
-                'yearly': TsFrequency.YEARLY,
-                'annual': TsFrequency.YEARLY,
-                'daily': TsFrequency.DAILY,
-                'weekly': TsFrequency.WEEKLY
-            }
-            frequency = freq_map.get(freq_str.lower(), TsFrequency.MONTHLY)
+        frequency = resolve_frequency(freq_str) or TsFrequency.MONTHLY
         
         # Extract start period
         if 'start_period' in data:
@@ -85,6 +82,10 @@ class YAMLParser(BaseParser):
             if isinstance(sp, dict):
                 year = sp.get('year', 2020)
                 period = sp.get('period', 1)
+            elif 'start_year' in data:
+                # Simple layout: start_year plus the period within that year
+                year = int(data['start_year'])
+                period = int(sp)
             else:
                 # Assume it's a year
                 year = int(sp)
@@ -113,7 +114,7 @@ class YAMLParser(BaseParser):
         metadata = {'name': str(name), 'source': 'yaml'}
         
         # Add any extra fields as metadata
-        exclude_keys = {values_key, 'name', 'id', 'frequency', 'start_period', 'start'}
+        exclude_keys = {values_key, 'name', 'id', 'frequency', 'start_year', 'start_period', 'start'}
         for key, value in data.items():
             if key not in exclude_keys and not key.startswith('_'):
                 metadata[key] = value
@@ -128,12 +129,12 @@ class YAMLParser(BaseParser):
         
         return ts
     
-    def validate(self, content: str) -> tuple[bool, List[str]]:
+    def validate(self, content: Union[bytes, str]) -> tuple[bool, List[str]]:
         """Validate YAML content."""
         errors = []
         
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_Loader)
             
             if data is None:
                 errors.append("Empty YAML file")
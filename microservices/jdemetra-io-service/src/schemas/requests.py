@@ -1,15 +1,26 @@
 """Request schemas for I/O service."""
 
-from typing import List, Optional, Dict, Any, Literal
+from enum import Enum
+from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 from uuid import UUID
 
 
+class Format(str, Enum):
+    """Supported file formats."""
+    
+    CSV = "csv"
+    EXCEL = "excel"
+    JSON = "json"
+    XML = "xml"
+    YAML = "yaml"
+
+
 class ImportRequest(BaseModel):
     """Request for data import."""
     
     file_id: str = Field(..., description="Uploaded file ID")
-    format: Literal["csv", "excel", "json", "xml", "yaml"] = Field(..., description="File format")
+    format: Format = Field(..., description="File format")
     options: Optional[Dict[str, Any]] = Field(
         default_factory=dict,
         description="Format-specific options"
@@ -34,7 +45,7 @@ class ExportRequest(BaseModel):
     """Request for data export."""
     
     series_ids: List[UUID] = Field(..., description="Time series IDs to export")
-    format: Literal["csv", "excel", "json", "xml", "yaml"] = Field(..., description="Export format")
+    format: Format = Field(..., description="Export format")
     options: Optional[Dict[str, Any]] = Field(
         default_factory=dict,
         description="Format-specific options"
@@ -52,8 +63,8 @@ class ConvertRequest(BaseModel):
     """Request for format conversion."""
     
     source_file_id: str = Field(..., description="Source file ID")
-    source_format: Literal["csv", "excel", "json", "xml", "yaml"] = Field(..., description="Source format")
-    target_format: Literal["csv", "excel", "json", "xml", "yaml"] = Field(..., description="Target format")
+    source_format: Format = Field(..., description="Source format")
+    target_format: Format = Field(..., description="Target format")
     options: Optional[Dict[str, Any]] = Field(
         default_factory=dict,
         description="Conversion options"
@@ -70,5 +81,5 @@ class ValidateRequest(BaseModel):
     """Request for file validation."""
     
     file_id: str = Field(..., description="File ID to validate")
-    format: Literal["csv", "excel", "json", "xml", "yaml"] = Field(..., description="Expected format")
+    format: Format = Field(..., description="Expected format")
     strict: bool = Field(False, description="Strict validation mode")
\ No newline at end of file
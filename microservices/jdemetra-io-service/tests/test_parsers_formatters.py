@@ -1,7 +1,11 @@
 """Tests for all parsers and formatters."""
 
-import pytest
 import base64
+import io
+import numpy as np
+import openpyxl
+import pytest
+import zipfile
 import xml.etree.ElementTree as ET
 import yaml
 import json
@@ -50,6 +54,28 @@ class TestCSVParserFormatter:
         assert len(parsed) == 2
         assert parsed[0].values == pytest.approx(ts1.values)
         assert parsed[1].values == pytest.approx(ts2.values)
+    
+    def test_csv_wide_gaps_and_quoting(self):
+        """Test wide CSV with unaligned series and names that need quoting."""
+        ts1 = TsData(
+            values=[0.1, 2.5],
+            start_period=TsPeriod(2020, 1, TsFrequency.MONTHLY),
+            frequency=TsFrequency.MONTHLY,
+            metadata={"name": "a"}
+        )
+        ts2 = TsData(
+            values=[3.0],
+            start_period=TsPeriod(2020, 2, TsFrequency.MONTHLY),
+            frequency=TsFrequency.MONTHLY,
+            metadata={"name": "b"}
+        )
+        
+        csv_content = CSVFormatter({}).format([ts1, ts2])
+        assert csv_content.splitlines() == [b",a,b", b"2020-01,0.1,", b"2020-02,2.5,3.0"]
+        
+        ts2.metadata["name"] = "b,c"
+        csv_content = CSVFormatter({}).format([ts1, ts2])
+        assert csv_content.splitlines()[0] == b',a,"b,c"'
 
 
 class TestJSONParserFormatter:
@@ -77,6 +103,28 @@ class TestJSONParserFormatter:
         assert parsed[0].frequency == TsFrequency.QUARTERLY
         assert parsed[0].start_period.year == 2020
         assert parsed[0].start_period.period == 1
+    
+    def test_json_non_finite_literals(self):
+        """Test documents with NaN/Infinity literals, as earlier exports wrote them."""
+        content = (
+            '{"values": [1.0, NaN, Infinity, 4.0], '
+            '"start_period": {"year": 2020, "period": 1, "frequency": "M"}, "frequency": "M"}'
+        )
+        parser = JSONParser({"format_type": "jdemetra"})
+        
+        valid, errors = parser.validate(content)
+        assert valid, errors
+        
+        parsed = parser.parse(content.encode())
+        assert len(parsed) == 1
+        assert parsed[0].values[0] == 1.0
+        assert np.isnan(parsed[0].values[1])
+        assert parsed[0].values[2] == float("inf")
+        
+        # Missing values are now exported as null and read back as NaN
+        exported = JSONFormatter({"format_type": "jdemetra"}).format(parsed)
+        assert b"NaN" not in exported
+        assert np.isnan(parser.parse(exported)[0].values[1])
 
 
 class TestExcelParserFormatter:
@@ -91,13 +139,48 @@ class TestExcelParserFormatter:
             metadata={"name": "series1"}
         )
         
-        # Format to Excel (base64)
+        # Format to Excel
         formatter = ExcelFormatter({"layout": "wide"})
-        excel_b64 = formatter.format([ts1])
+        excel_bytes = formatter.format([ts1])
+        
+        # Verify it's an xlsx (zip) workbook
+        assert excel_bytes[:4] == b"PK\x03\x04"
+        
+    def test_excel_round_trip(self):
+        """Test parsing a formatted workbook with the frequency inferred from its dates."""
+        ts = TsData(
+            values=[100.0, 101.0, 102.0, 103.0],
+            start_period=TsPeriod(2020, 2, TsFrequency.QUARTERLY),
+            frequency=TsFrequency.QUARTERLY,
+            metadata={"name": "series1"}
+        )
+        
+        parsed = ExcelParser({}).parse(ExcelFormatter({}).format([ts]))
+        assert len(parsed) == 1
+        assert parsed[0].frequency == TsFrequency.QUARTERLY
+        assert parsed[0].start_period == ts.start_period
+        assert parsed[0].values.tolist() == ts.values.tolist()
+        assert parsed[0].metadata["name"] == "series1"
+    
+    def test_excel_non_finite_values(self):
+        """Test infinite and missing values are written as to_excel does."""
+        ts = TsData(
+            values=[1.0, float("inf"), float("nan"), float("-inf")],
+            start_period=TsPeriod(2020, 1, TsFrequency.MONTHLY),
+            frequency=TsFrequency.MONTHLY,
+            metadata={"name": "series1"}
+        )
         
-        # Verify it's base64
-        assert base64.b64decode(excel_b64)  # Should not raise
+        def cells(excel_bytes):
+            sheet = openpyxl.load_workbook(io.BytesIO(excel_bytes)).worksheets[0]
+            return [row for row in sheet.iter_rows(values_only=True)]
         
+        fast = cells(ExcelFormatter({}).format([ts]))
+        # The metadata sheet routes the export through to_excel
+        reference = cells(ExcelFormatter({"include_metadata": True}).format([ts]))
+        assert fast == reference
+        assert [row[1] for row in fast[1:]] == [1, "inf", None, "-inf"]
+    
     def test_excel_long_format(self):
         """Test Excel long format."""
         ts1 = TsData(
@@ -108,10 +191,11 @@ class TestExcelParserFormatter:
         )
         
         formatter = ExcelFormatter({"layout": "long"})
-        excel_b64 = formatter.format([ts1])
+        excel_bytes = formatter.format([ts1])
         
-        # Verify it's valid base64
-        assert base64.b64decode(excel_b64)
+        # Verify it's an xlsx (zip) workbook
+        assert isinstance(excel_bytes, bytes)
+        assert excel_bytes[:4] == b"PK\x03\x04"
 
 
 class TestXMLParserFormatter:
@@ -138,6 +222,21 @@ class TestXMLParserFormatter:
         assert parsed[0].values == pytest.approx(ts.values)
         assert parsed[0].metadata["name"] == "test_series"
     
+    def test_xml_values_round_trip_exactly(self):
+        """Test that formatted values keep full float precision."""
+        ts = TsData(
+            values=[0.1, 1.0 / 3.0, 1e16, -2.5e-8, 123456.789],
+            start_period=TsPeriod(2020, 1, TsFrequency.MONTHLY),
+            frequency=TsFrequency.MONTHLY,
+            metadata={"name": "precise"}
+        )
+        
+        xml_content = XMLFormatter({"pretty_print": False}).format([ts])
+        assert b'value="0.1"' in xml_content
+        
+        parsed = XMLParser({"format": "jdemetra"}).parse(xml_content)
+        assert parsed[0].values.tolist() == ts.values.tolist()
+    
     def test_xml_generic_format(self):
         """Test generic XML format."""
         # Create generic XML
@@ -256,6 +355,10 @@ class TestValidation:
         invalid_json = '{"series": [{"name": "test", "values": [1,2,3'
         valid, errors = parser.validate(invalid_json)
         assert not valid
+        
+        # Not an object, also under the lenient decoder
+        valid, errors = parser.validate('[1, NaN]')
+        assert errors == ["JSON must be an object"]
     
     def test_xml_validation(self):
         """Test XML validation."""
@@ -283,4 +386,41 @@ class TestValidation:
         # Invalid YAML structure
         invalid_yaml = "- name: test"  # List with no values
         valid, errors = parser.validate(invalid_yaml)
-        assert not valid
\ No newline at end of file
+        assert not valid
+    
+    def test_excel_validation(self):
+        """Test Excel validation."""
+        parser = ExcelParser({})
+        
+        # Valid workbook, raw and base64 encoded
+        ts = TsData(
+            values=[100.0, 101.0, 102.0],
+            start_period=TsPeriod(2020, 1, TsFrequency.MONTHLY),
+            frequency=TsFrequency.MONTHLY,
+            metadata={"name": "series1"}
+        )
+        excel_bytes = ExcelFormatter({}).format([ts])
+        assert parser._sniff_shape(excel_bytes) == (4, 2)
+        valid, errors = parser.validate(excel_bytes)
+        assert valid
+        valid, errors = parser.validate(base64.b64encode(excel_bytes))
+        assert valid
+        
+        # Empty workbook
+        valid, errors = parser.validate(ExcelFormatter({}).format([]))
+        assert not valid
+        assert "Excel file is empty" in errors
+        
+        # First sheet stored under another part name than sheet1.xml
+        renamed = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(excel_bytes)) as source, \
+                zipfile.ZipFile(renamed, 'w') as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                name = item.filename.replace('sheet1.xml', 'data.xml')
+                if item.filename in ('xl/_rels/workbook.xml.rels', '[Content_Types].xml'):
+                    data = data.replace(b'sheet1.xml', b'data.xml')
+                target.writestr(name, data)
+        assert parser._sniff_shape(renamed.getvalue()) == (4, 2)
+        valid, errors = parser.validate(renamed.getvalue())
+        assert valid
@@ -3,7 +3,7 @@
 import numpy as np
 from typing import Dict, Any
 
-from jdemetra_common.models import TsData
+from jdemetra_common.models import TsData, TsPeriod
 
 
 def apply_transformation(ts: TsData, operation: str, parameters: Dict[str, Any]) -> TsData:
@@ -60,27 +60,27 @@ def difference(ts: TsData, lag: int = 1) -> TsData:
     
     diff_values = np.diff(ts.values, n=lag)
     
-    # Adjust start period
-    new_start = ts.start_period
+    # Adjust start period; TsPeriod is immutable, so build a new one
+    year, period = ts.start_period.year, ts.start_period.period
     for _ in range(lag):
         if ts.frequency.value == "M":
-            if new_start.period == 12:
-                new_start.year += 1
-                new_start.period = 1
+            if period == 12:
+                year += 1
+                period = 1
             else:
-                new_start.period += 1
+                period += 1
         elif ts.frequency.value == "Q":
-            if new_start.period == 4:
-                new_start.year += 1
-                new_start.period = 1
+            if period == 4:
+                year += 1
+                period = 1
             else:
-                new_start.period += 1
+                period += 1
         elif ts.frequency.value == "Y":
-            new_start.year += 1
+            year += 1
     
     return TsData(
         values=diff_values,
-        start_period=new_start,
+        start_period=TsPeriod(year, period, ts.frequency),
         frequency=ts.frequency,
         metadata={**ts.metadata, "transformation": f"diff({lag})"}
     )
@@ -93,18 +93,18 @@ def seasonal_difference(ts: TsData, period: int) -> TsData:
     
     sdiff_values = ts.values[period:] - ts.values[:-period]
     
-    # Adjust start period by the seasonal period
-    new_start = ts.start_period
+    # Adjust start period by the seasonal period; TsPeriod is immutable, so build a new one
+    start = ts.start_period
     if ts.frequency.value == "M":
-        total_months = new_start.year * 12 + new_start.period - 1 + period
-        new_start.year = total_months // 12
-        new_start.period = (total_months % 12) + 1
+        total_months = start.year * 12 + start.period - 1 + period
+        new_start = TsPeriod(total_months // 12, (total_months % 12) + 1, ts.frequency)
     elif ts.frequency.value == "Q":
-        total_quarters = new_start.year * 4 + new_start.period - 1 + period
-        new_start.year = total_quarters // 4
-        new_start.period = (total_quarters % 4) + 1
+        total_quarters = start.year * 4 + start.period - 1 + period
+        new_start = TsPeriod(total_quarters // 4, (total_quarters % 4) + 1, ts.frequency)
     elif ts.frequency.value == "Y":
-        new_start.year += period
+        new_start = TsPeriod(start.year + period, start.period, ts.frequency)
+    else:
+        new_start = start
     
     return TsData(
         values=sdiff_values,
@@ -58,6 +58,7 @@ class TestTransformations:
         assert len(result.values) == 3
         assert np.allclose(result.values, [2.0, 3.0, 4.0])
         assert result.start_period.period == 2  # Started at 1, now 2
+        assert ts.start_period.period == 1  # Input left untouched
         assert result.metadata["transformation"] == "diff(1)"
         
         # Test lag=2
@@ -85,6 +86,8 @@ class TestTransformations:
         result_q = seasonal_difference(ts_q, period=4)
         assert len(result_q.values) == 4
         assert np.allclose(result_q.values, [4, 4, 4, 4])
+        assert result_q.start_period.year == ts_q.start_period.year + 1
+        assert result_q.start_period.period == ts_q.start_period.period
     
     def test_standardize(self):
         """Test standardization."""